@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.artifact_store import ArtifactError, ArtifactStore
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = True
+
+    argument_spec = dict(
+        url=dict(type='str', required=True),
+        dest=dict(type='path', required=True),
+        checksum=dict(type='str'),
+        cache_dir=dict(type='path', default='~/.ansible/cache/code3tech.devtools/artifacts'),
+        mirror_url=dict(type='str'),
+        offline=dict(type='bool', default=False),
+        owner=dict(type='str'),
+        group=dict(type='str'),
+        mode=dict(type='raw'),
+        validate_certs=dict(type='bool', default=True),
+        timeout=dict(type='int', default=60),
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        dummy, args = self.validate_argument_spec(argument_spec=self.argument_spec)
+
+        store = ArtifactStore(args['cache_dir'])
+        try:
+            digest, hit = store.ensure(args['url'], checksum=args['checksum'], offline=args['offline'],
+                                       validate_certs=args['validate_certs'], timeout=args['timeout'])
+        except ArtifactError as exc:
+            raise AnsibleActionFail(to_native(exc))
+        except Exception as exc:
+            raise AnsibleActionFail('Unable to cache {0} on the controller: {1}'.format(args['url'], to_native(exc)))
+
+        file_args = dict((k, args[k]) for k in ('owner', 'group', 'mode') if args[k] is not None)
+        if args['mirror_url']:
+            # Hosts pull from the LAN mirror exporting the store's blobs/ tree.
+            module_args = dict(
+                url='{0}/blobs/sha256/{1}'.format(args['mirror_url'].rstrip('/'), digest),
+                dest=args['dest'],
+                checksum='sha256:{0}'.format(digest),
+                validate_certs=args['validate_certs'],
+                timeout=args['timeout'],
+                **file_args
+            )
+            transfer = self._execute_module('ansible.legacy.get_url', module_args=module_args, task_vars=task_vars)
+        else:
+            # Push over the existing connection; copy skips hosts that already match.
+            transfer = self._copy_blob(store.blob_path(digest), args['dest'], file_args, task_vars)
+
+        result.update(transfer)
+        result.update(
+            dest=args['dest'],
+            sha256=digest,
+            size=store.size(digest),
+            cache_hit=hit,
+            cache_path=store.blob_path(digest),
+        )
+        return result
+
+    def _copy_blob(self, src, dest, file_args, task_vars):
+        new_task = self._task.copy()
+        new_task.args = dict(src=src, dest=dest, **file_args)
+        copy_action = self._shared_loader_obj.action_loader.get(
+            'ansible.legacy.copy',
+            task=new_task,
+            connection=self._connection,
+            play_context=self._play_context,
+            loader=self._loader,
+            templar=self._templar,
+            shared_loader_obj=self._shared_loader_obj,
+        )
+        return copy_action.run(task_vars=task_vars)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import time
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.azure_devops_api import (
+    AzureDevOpsClient,
+    RESOURCE_KINDS,
+    tag_changes,
+    target_name,
+)
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestError
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache, cache_key
+
+CACHE_NAMESPACE = 'azure_devops_resources'
+
+# IDs already resolved by this worker process, keyed like the file cache.
+_MEMORY_CACHE = {}
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    argument_spec = dict(
+        url=dict(type='str', required=True),
+        pat=dict(type='str', required=True, no_log=True),
+        project=dict(type='str', required=True),
+        kind=dict(type='str', required=True, choices=sorted(RESOURCE_KINDS)),
+        name=dict(type='str', required=True),
+        create=dict(type='bool', default=False),
+        description=dict(type='str', default='Created by Ansible azure_devops_agents role'),
+        open_access=dict(type='bool'),
+        targets=dict(type='list', elements='dict'),
+        cache_dir=dict(type='path', default='~/.ansible/cache/code3tech.devtools'),
+        cache_ttl=dict(type='int', default=3600),
+        validate_certs=dict(type='bool', default=True),
+        timeout=dict(type='int', default=30),
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        dummy, args = self.validate_argument_spec(argument_spec=self.argument_spec)
+        if args['open_access'] is not None and args['kind'] != 'environment':
+            raise AnsibleActionFail('open_access only applies to environments')
+        for target in args['targets'] or []:
+            if not target.get('name') or not isinstance(target.get('tags', []), list):
+                raise AnsibleActionFail('Every target needs a name and a list of tags: {0!r}'.format(target))
+
+        client = AzureDevOpsClient(args['url'], pat=args['pat'],
+                                   validate_certs=args['validate_certs'], timeout=args['timeout'])
+        try:
+            with client:
+                result.update(self._reconcile(client, args))
+        except RestError as exc:
+            raise AnsibleActionFail('Azure DevOps API request failed: HTTP {0} from {1}'.format(exc.status, exc.url))
+        except AnsibleActionFail:
+            raise
+        except Exception as exc:
+            raise AnsibleActionFail('Azure DevOps API request failed: {0}'.format(to_native(exc)))
+        result['requests'] = client.requests_made
+        return result
+
+    def _reconcile(self, client, args):
+        project, kind = args['project'], args['kind']
+        # The PAT fingerprint is part of the key so different credentials never share entries.
+        key = cache_key(args['url'].rstrip('/'), project, kind, args['name'].lower(), args['pat'])
+        cache = FileCache(args['cache_dir'], CACHE_NAMESPACE) if args['cache_dir'] else None
+
+        resource_id, created, cached = self._resource_id(client, args, key, cache)
+        output = dict(changed=created, id=resource_id, created=created, cached=cached,
+                      targets=[], missing=[], updated=[])
+        if resource_id is None:
+            # Check mode: the resource would be created, it has no agents yet.
+            return output
+
+        if args['open_access'] is not None and client.open_access(project, resource_id) != args['open_access']:
+            if not self._task.check_mode:
+                client.set_open_access(project, resource_id, args['open_access'])
+            output['changed'] = True
+
+        if args['targets']:
+            try:
+                existing = client.targets(project, kind, resource_id)
+            except RestError as exc:
+                if exc.status != 404 or created:
+                    raise
+                # Deleted and recreated since it was cached: resolve the name again.
+                self._forget(key, cache)
+                resource_id, created, cached = self._resource_id(client, args, key, cache)
+                output.update(id=resource_id, created=created, cached=cached, changed=output['changed'] or created)
+                existing = client.targets(project, kind, resource_id) if resource_id is not None else []
+            output.update(self._reconcile_tags(client, args, resource_id, existing))
+            output['changed'] = output['changed'] or bool(output['updated'])
+        return output
+
+    def _reconcile_tags(self, client, args, resource_id, existing):
+        by_name = dict((target_name(item).lower(), item) for item in existing if target_name(item))
+        targets, updates, updated, missing = [], [], [], []
+        for target in args['targets']:
+            current = by_name.get(target['name'].lower())
+            if current is None:
+                missing.append(target['name'])
+                continue
+            added, removed = tag_changes(current.get('tags'), target.get('tags', []))
+            targets.append({'name': target['name'], 'id': current['id'], 'added': added, 'removed': removed})
+            if added or removed:
+                updated.append(target['name'])
+                updates.append({'id': current['id'], 'name': current.get('name') or target['name'],
+                                'tags': list(target.get('tags', []))})
+        if updates and not self._task.check_mode:
+            client.update_tags(args['project'], args['kind'], resource_id, updates)
+        return dict(targets=targets, missing=missing, updated=updated)
+
+    @staticmethod
+    def _fresh(entry, ttl):
+        if entry and time.time() - entry.get('stored', 0) < ttl:
+            return entry
+        return None
+
+    def _resource_id(self, client, args, key, cache):
+        """Return ``(id, created, cached)``, from the cache or the API (creating the resource when asked)."""
+        entry = self._fresh(_MEMORY_CACHE.get(key), args['cache_ttl'])
+        if entry is None and cache is not None:
+            entry = self._fresh(cache.get(key), args['cache_ttl'])
+        if entry is not None:
+            _MEMORY_CACHE[key] = entry
+            return entry['id'], False, True
+        if cache is None:
+            return self._lookup(client, args, key, None)
+        # Hosts sharing a resource wait here, so only one of them creates it.
+        with cache.lock(key):
+            entry = self._fresh(cache.get(key), args['cache_ttl'])
+            if entry is not None:
+                _MEMORY_CACHE[key] = entry
+                return entry['id'], False, True
+            return self._lookup(client, args, key, cache)
+
+    def _lookup(self, client, args, key, cache):
+        project, kind, name = args['project'], args['kind'], args['name']
+        found = client.find(project, kind, name)
+        created = False
+        if found is None:
+            if not args['create']:
+                raise AnsibleActionFail('{0} {1!r} does not exist in project {2}'.format(
+                    kind.replace('_', ' ').capitalize(), name, project))
+            if self._task.check_mode:
+                return None, True, False
+            found = client.create(project, kind, name, args['description'])
+            created = True
+        entry = {'id': found['id'], 'stored': time.time()}
+        _MEMORY_CACHE[key] = entry
+        if cache is not None:
+            cache.set(key, entry)
+        return found['id'], created, False
+
+    @staticmethod
+    def _forget(key, cache):
+        _MEMORY_CACHE.pop(key, None)
+        if cache is not None:
+            cache.delete(key)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import time
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.github_api import (
+    GitHubClient,
+    RUNNER_SCOPES,
+    runners_path,
+)
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestError
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache, cache_key
+
+CACHE_NAMESPACE = 'github_registration_tokens'
+
+# Tokens already seen by this worker process, keyed like the file cache.
+_MEMORY_CACHE = {}
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    argument_spec = dict(
+        api_url=dict(type='str', default='https://api.github.com'),
+        token=dict(type='str', required=True, no_log=True),
+        scope=dict(type='str', required=True, choices=list(RUNNER_SCOPES)),
+        organization=dict(type='str'),
+        repository=dict(type='str'),
+        enterprise=dict(type='str'),
+        min_ttl=dict(type='int', default=300),
+        cache_dir=dict(type='path', default='~/.ansible/cache/code3tech.devtools'),
+        validate_certs=dict(type='bool', default=True),
+        timeout=dict(type='int', default=30),
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        dummy, args = self.validate_argument_spec(
+            argument_spec=self.argument_spec,
+            required_if=[
+                ('scope', 'organization', ('organization',)),
+                ('scope', 'repository', ('repository',)),
+                ('scope', 'enterprise', ('enterprise',)),
+            ],
+        )
+
+        scope_path = runners_path(args['scope'], args['organization'], args['repository'], args['enterprise'])
+        # The PAT fingerprint is part of the key so different credentials never share tokens.
+        key = cache_key(args['api_url'].rstrip('/'), scope_path, args['token'])
+        cache = FileCache(args['cache_dir'], CACHE_NAMESPACE) if args['cache_dir'] else None
+
+        entry, cached = self._cached_entry(key, cache, args['min_ttl'])
+        if entry is None:
+            if cache is None:
+                entry = self._fetch(args, scope_path)
+            else:
+                with cache.lock(key):
+                    # Another worker may have refreshed the token while we waited.
+                    entry = self._fresh(cache.get(key), args['min_ttl'])
+                    cached = entry is not None
+                    if entry is None:
+                        entry = self._fetch(args, scope_path)
+                        cache.set(key, entry)
+            _MEMORY_CACHE[key] = entry
+
+        result.update(
+            changed=False,
+            token=entry['token'],
+            expires_at=entry['expires_at'],
+            cached=cached,
+            registration_url='{0}{1}/registration-token'.format(args['api_url'].rstrip('/'), scope_path),
+        )
+        return result
+
+    @staticmethod
+    def _fresh(entry, min_ttl):
+        if entry and entry.get('expires_at_epoch', 0) - time.time() > min_ttl:
+            return entry
+        return None
+
+    def _cached_entry(self, key, cache, min_ttl):
+        entry = self._fresh(_MEMORY_CACHE.get(key), min_ttl)
+        if entry is None and cache is not None:
+            entry = self._fresh(cache.get(key), min_ttl)
+        return entry, entry is not None
+
+    @staticmethod
+    def _fetch(args, scope_path):
+        client = GitHubClient(args['api_url'], token=args['token'],
+                              validate_certs=args['validate_certs'], timeout=args['timeout'])
+        try:
+            with client:
+                return client.registration_token(scope_path)
+        except RestError as exc:
+            raise AnsibleActionFail('Unable to create a runner registration token: HTTP {0} from {1}'.format(
+                exc.status, exc.url))
+        except Exception as exc:
+            raise AnsibleActionFail('Unable to create a runner registration token: {0}'.format(to_native(exc)))
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import threading
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.github_api import (
+    GitHubClient,
+    RUNNER_SCOPES,
+    label_changes,
+    runners_path,
+)
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestError
+
+
+def _error(exc):
+    if isinstance(exc, RestError):
+        return 'HTTP {0} from {1}'.format(exc.status, exc.url)
+    return to_native(exc)
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    argument_spec = dict(
+        api_url=dict(type='str', default='https://api.github.com'),
+        token=dict(type='str', required=True, no_log=True),
+        scope=dict(type='str', choices=list(RUNNER_SCOPES)),
+        organization=dict(type='str'),
+        repository=dict(type='str'),
+        enterprise=dict(type='str'),
+        runners=dict(type='list', elements='dict', required=True),
+        parallelism=dict(type='int', default=4),
+        validate_certs=dict(type='bool', default=True),
+        timeout=dict(type='int', default=30),
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        dummy, args = self.validate_argument_spec(argument_spec=self.argument_spec)
+        wanted = []
+        for runner in args['runners']:
+            if not runner.get('name'):
+                raise AnsibleActionFail('Every runner needs a name: {0!r}'.format(runner))
+            labels = runner.get('labels') or []
+            if isinstance(labels, str) or not isinstance(labels, list):
+                raise AnsibleActionFail('labels of runner {0} must be a list'.format(runner['name']))
+            try:
+                scope_path = runners_path(
+                    runner.get('scope') or args['scope'],
+                    runner.get('organization') or args['organization'],
+                    runner.get('repository') or args['repository'],
+                    runner.get('enterprise') or args['enterprise'],
+                )
+            except ValueError as exc:
+                raise AnsibleActionFail('Runner {0}: {1}'.format(runner['name'], to_native(exc)))
+            wanted.append((str(runner['name']), scope_path, [to_native(label) for label in labels]))
+
+        clients = []
+
+        def new_client():
+            client = GitHubClient(args['api_url'], token=args['token'],
+                                  validate_certs=args['validate_certs'], timeout=args['timeout'])
+            clients.append(client)
+            return client
+
+        # One listing per scope, whatever the number of runners.
+        listed = {}
+        try:
+            with new_client() as client:
+                for scope_path in sorted(set(path for dummy, path, dummy in wanted)):
+                    listed[scope_path] = dict((r['name'], r) for r in client.list_runners(scope_path))
+        except Exception as exc:
+            raise AnsibleActionFail('Unable to list the runners: {0}'.format(_error(exc)))
+
+        results = []
+        updates = []
+        for name, scope_path, labels in wanted:
+            current = listed[scope_path].get(name)
+            if current is None:
+                results.append({'name': name, 'status': 'missing', 'added': [], 'removed': []})
+                continue
+            added, removed = label_changes(current.get('labels', []), labels)
+            entry = {
+                'name': name,
+                'id': current['id'],
+                'status': 'updated' if added or removed else 'unchanged',
+                'added': added,
+                'removed': removed,
+                'labels': sorted(label['name'] for label in current.get('labels', [])
+                                 if label['name'] not in removed) + added,
+            }
+            results.append(entry)
+            if added or removed:
+                updates.append((entry, scope_path, labels))
+
+        if updates and not self._task.check_mode:
+            self._apply(updates, args['parallelism'], new_client)
+
+        failed = [r['name'] for r in results if r['status'] == 'failed']
+        result.update(
+            changed=any(r['status'] == 'updated' for r in results),
+            runners=results,
+            missing=[r['name'] for r in results if r['status'] == 'missing'],
+            requests=sum(client.requests_made for client in clients),
+        )
+        if failed:
+            result.update(failed=True, msg='Label update failed for {0} of {1} runners: {2}'.format(
+                len(failed), len(updates), ', '.join(failed)))
+        return result
+
+    @staticmethod
+    def _apply(updates, parallelism, new_client):
+        """Send the label writes with at most ``parallelism`` connections at a time."""
+        pending = list(updates)
+        lock = threading.Lock()
+
+        def worker():
+            with new_client() as client:
+                while True:
+                    with lock:
+                        if not pending:
+                            return
+                        entry, scope_path, labels = pending.pop(0)
+                    try:
+                        entry['labels'] = sorted(label['name'] for label in
+                                                 client.set_runner_labels(scope_path, entry['id'], labels))
+                    except Exception as exc:
+                        entry.update(status='failed', error=_error(exc))
+
+        threads = [threading.Thread(target=worker) for dummy in range(max(1, min(parallelism, len(updates))))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.gitlab_api import GitLabClient
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestError
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache, cache_key
+
+CACHE_NAMESPACE = 'gitlab_api'
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    argument_spec = dict(
+        gitlab_url=dict(type='str', required=True),
+        api_token=dict(type='str', required=True, no_log=True),
+        group_paths=dict(type='list', elements='str', default=[]),
+        project_paths=dict(type='list', elements='str', default=[]),
+        runners=dict(type='bool', default=False),
+        runner_filters=dict(type='dict', default={}),
+        cache_dir=dict(type='path', default='~/.ansible/cache/code3tech.devtools'),
+        validate_certs=dict(type='bool', default=True),
+        timeout=dict(type='int', default=30),
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        dummy, args = self.validate_argument_spec(argument_spec=self.argument_spec)
+        gitlab_url = args['gitlab_url'].rstrip('/')
+        cache = FileCache(args['cache_dir'], CACHE_NAMESPACE) if args['cache_dir'] else None
+        # Entries are only valid for the play that wrote them: every host of the
+        # play shares one answer, the next play (or run) starts fresh.
+        play = self._task.get_play()
+        self._play_id = play._uuid if play is not None else None
+
+        client = GitLabClient(gitlab_url, token=args['api_token'],
+                              validate_certs=args['validate_certs'], timeout=args['timeout'])
+        groups, projects, runners = {}, {}, None
+        try:
+            with client:
+                groups = self._scope_ids(client, cache, 'groups', args, args['group_paths'])
+                projects = self._scope_ids(client, cache, 'projects', args, args['project_paths'])
+                if args['runners']:
+                    runners = self._runners(client, cache, args)
+        except RestError as exc:
+            raise AnsibleActionFail('GitLab API request failed: HTTP {0} from {1}'.format(exc.status, exc.url))
+        except AnsibleActionFail:
+            raise
+        except Exception as exc:
+            raise AnsibleActionFail('GitLab API request failed: {0}'.format(to_native(exc)))
+
+        result.update(changed=False, groups=groups, projects=projects, requests=client.requests_made)
+        if runners is not None:
+            result['runners'] = runners
+        return result
+
+    def _cached(self, cache, key):
+        entry = cache.get(key) if cache is not None else None
+        if entry and self._play_id and entry.get('play') == self._play_id:
+            return entry
+        return None
+
+    def _scope_ids(self, client, cache, kind, args, paths):
+        paths = sorted(set(p.strip('/') for p in paths if p and p.strip('/')))
+        if not paths:
+            return {}
+        resolve = client.group_id if kind == 'groups' else client.project_id
+        if cache is None:
+            return dict((path, resolve(path)) for path in paths)
+
+        # Only found IDs are cached: a group or project created later in the
+        # play is looked up again.
+        key = cache_key(args['gitlab_url'].rstrip('/'), args['api_token'], kind)
+        known = (self._cached(cache, key) or {}).get('ids', {})
+        if all(path in known for path in paths):
+            return dict((path, known[path]) for path in paths)
+        with cache.lock(key):
+            # Another host may have resolved the same paths while we waited.
+            known = (self._cached(cache, key) or {}).get('ids', {})
+            ids = dict((path, known.get(path)) for path in paths)
+            for path in paths:
+                if ids[path] is None:
+                    ids[path] = resolve(path)
+            found = dict((path, ids[path]) for path in paths if ids[path] is not None and path not in known)
+            if found:
+                known.update(found)
+                cache.set(key, {'play': self._play_id, 'ids': known})
+        return ids
+
+    def _runners(self, client, cache, args):
+        filters = args['runner_filters']
+        if cache is None:
+            return client.list_runners(**filters)
+
+        key = cache_key(args['gitlab_url'].rstrip('/'), args['api_token'], 'runners', sorted(filters.items()))
+        entry = self._cached(cache, key)
+        if entry is None:
+            with cache.lock(key):
+                entry = self._cached(cache, key)
+                if entry is None:
+                    entry = {'play': self._play_id, 'runners': client.list_runners(**filters)}
+                    cache.set(key, entry)
+        return entry['runners']
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.gitlab_api import (
+    GitLabClient,
+    RUNNER_ATTRIBUTES,
+    runner_changes,
+)
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestError
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _requires_connection = False
+
+    argument_spec = dict(
+        gitlab_url=dict(type='str', required=True),
+        api_token=dict(type='str', required=True, no_log=True),
+        runners=dict(type='list', elements='dict', required=True),
+        validate_certs=dict(type='bool', default=True),
+        timeout=dict(type='int', default=30),
+    )
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        dummy, args = self.validate_argument_spec(argument_spec=self.argument_spec)
+        wanted = []
+        for runner in args['runners']:
+            try:
+                runner_id = int(runner.get('id') or 0)
+            except (TypeError, ValueError):
+                raise AnsibleActionFail('Invalid runner id: {0!r}'.format(runner.get('id')))
+            if runner_id <= 0:
+                continue
+            unknown = set(runner) - set(RUNNER_ATTRIBUTES) - set(('id', 'name'))
+            if unknown:
+                raise AnsibleActionFail('Unsupported runner attributes: {0}'.format(', '.join(sorted(unknown))))
+            attributes = dict((k, runner[k]) for k in RUNNER_ATTRIBUTES if k in runner)
+            wanted.append((runner_id, runner.get('name', str(runner_id)), attributes))
+
+        client = GitLabClient(args['gitlab_url'], token=args['api_token'],
+                              validate_certs=args['validate_certs'], timeout=args['timeout'])
+        updated = []
+        try:
+            with client:
+                for runner_id, name, attributes in wanted:
+                    changes = runner_changes(client.runner(runner_id), attributes)
+                    if changes and not self._task.check_mode:
+                        client.update_runner(runner_id, **changes)
+                    updated.append({'id': runner_id, 'name': name, 'changes': changes})
+        except RestError as exc:
+            raise AnsibleActionFail('GitLab API request failed: HTTP {0} from {1}'.format(exc.status, exc.url))
+        except Exception as exc:
+            raise AnsibleActionFail('GitLab API request failed: {0}'.format(to_native(exc)))
+
+        result.update(
+            changed=any(r['changes'] for r in updated),
+            runners=updated,
+            requests=client.requests_made,
+        )
+        return result
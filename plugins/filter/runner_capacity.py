@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+import math
+
+from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common._collections_compat import Mapping
+
+# Resources of one job, and resources kept for the host itself.
+DEFAULT_PROFILE = {'cpus': 2, 'memory_mb': 4096, 'disk_gb': 20}
+DEFAULT_RESERVE = {'cpus': 1, 'memory_mb': 2048, 'disk_gb': 10}
+
+# Job requests GitLab Runner sends per cycle are capped: more does not start jobs faster.
+MAX_REQUEST_CONCURRENCY = 4
+
+GIB = 1024 ** 3
+
+
+def _number(value, name):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise AnsibleFilterError('runner_capacity: {0} must be a number, got {1!r}'.format(name, value))
+
+
+def _merge(defaults, overrides, name):
+    if overrides is None:
+        overrides = {}
+    if not isinstance(overrides, Mapping):
+        raise AnsibleFilterError('runner_capacity: {0} must be a dictionary'.format(name))
+    unknown = sorted(set(overrides) - set(defaults))
+    if unknown:
+        raise AnsibleFilterError('runner_capacity: unknown {0} key(s): {1}'.format(name, ', '.join(unknown)))
+    merged = dict(defaults)
+    merged.update(overrides)
+    return dict((key, _number(value, '{0}.{1}'.format(name, key))) for key, value in merged.items())
+
+
+def mount_for(mounts, path):
+    """Return the entry of ``ansible_mounts`` holding ``path`` (longest mount point wins)."""
+    best = None
+    for mount in mounts or []:
+        point = mount.get('mount') or ''
+        if path == point or path.startswith(point.rstrip('/') + '/'):
+            if best is None or len(point) > len(best['mount']):
+                best = mount
+    return best
+
+
+def runner_capacity(facts, profile=None, reserve=None, path='/', runners=1, min_jobs=1, max_jobs=0):
+    """Number of jobs the host can run at once, from its gathered facts and a per-job profile."""
+    if not isinstance(facts, Mapping):
+        raise AnsibleFilterError('runner_capacity: the input must be the ansible_facts dictionary')
+    cpus = facts.get('processor_vcpus') or facts.get('processor_nproc')
+    memory_mb = facts.get('memtotal_mb')
+    if not cpus or not memory_mb:
+        raise AnsibleFilterError('runner_capacity needs the processor_vcpus and memtotal_mb facts: gather facts first')
+    profile = _merge(DEFAULT_PROFILE, profile, 'profile')
+    reserve = _merge(DEFAULT_RESERVE, reserve, 'reserve')
+
+    available = {
+        'cpus': max(float(cpus) - reserve['cpus'], 0),
+        'memory_mb': max(float(memory_mb) - reserve['memory_mb'], 0),
+    }
+    mount = mount_for(facts.get('mounts'), path)
+    if mount and mount.get('size_total'):
+        available['disk_gb'] = max(float(mount['size_total']) / GIB - reserve['disk_gb'], 0)
+
+    # A profile value of 0 ignores that resource.
+    by_resource = dict(
+        (key, int(math.floor(available[key] / profile[key] + 1e-9)))
+        for key in ('cpus', 'memory_mb', 'disk_gb') if key in available and profile[key] > 0
+    )
+    if not by_resource:
+        raise AnsibleFilterError('runner_capacity: the profile must size at least one of cpus, memory_mb, disk_gb')
+    limited_by = min(by_resource, key=lambda key: by_resource[key])
+    jobs = max(by_resource[limited_by], int(min_jobs))
+    if int(max_jobs) > 0:
+        jobs = min(jobs, int(max_jobs))
+
+    # GitLab: every runner entry is its own gitlab-runner process with its own
+    # `concurrent`, so the job slots are shared out between them.
+    concurrent = max(jobs // max(int(runners), 1), 1)
+    return {
+        'jobs': jobs,
+        'concurrent': concurrent,
+        'request_concurrency': min(concurrent, MAX_REQUEST_CONCURRENCY),
+        'limited_by': limited_by,
+        'capacity': by_resource,
+        'available': dict((key, round(value, 1)) for key, value in available.items()),
+    }
+
+
+def runner_list(count, prefix='runner', entry=None, start=1, width=2, separator='-'):
+    """Generate ``count`` runner entries named ``<prefix>-01``, ``<prefix>-02``... sharing ``entry``."""
+    if isinstance(count, Mapping):
+        count = count.get('jobs', 0)
+    try:
+        count = int(count)
+    except (TypeError, ValueError):
+        raise AnsibleFilterError('runner_list: count must be a number or a runner_capacity result')
+    if entry is not None and not isinstance(entry, Mapping):
+        raise AnsibleFilterError('runner_list: entry must be a dictionary')
+    runners = []
+    for index in range(int(start), int(start) + max(count, 0)):
+        runner = copy.deepcopy(dict(entry or {}))
+        runner['name'] = '{0}{1}{2:0{3}d}'.format(prefix, separator, index, int(width))
+        runners.append(runner)
+    return runners
+
+
+class FilterModule(object):
+
+    def filters(self):
+        return {
+            'runner_capacity': runner_capacity,
+            'runner_list': runner_list,
+        }
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.errors import AnsibleFilterError
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible.module_utils.six import string_types
+
+# Keys of the *_resources variables of the runner roles and their systemd directives.
+DIRECTIVES = (
+    ('cpu_weight', 'CPUWeight'),
+    ('cpu_quota', 'CPUQuota'),
+    ('allowed_cpus', 'AllowedCPUs'),
+    ('memory_high', 'MemoryHigh'),
+    ('memory_max', 'MemoryMax'),
+    ('memory_swap_max', 'MemorySwapMax'),
+    ('io_weight', 'IOWeight'),
+    ('io_read_bandwidth_max', 'IOReadBandwidthMax'),
+    ('io_write_bandwidth_max', 'IOWriteBandwidthMax'),
+    ('tasks_max', 'TasksMax'),
+)
+
+
+def systemd_resources(resources):
+    """Resource control directives (``MemoryMax=4G``...) of a resources dictionary, one per list item."""
+    if resources is None:
+        return []
+    if not isinstance(resources, Mapping):
+        raise AnsibleFilterError('systemd_resources: the input must be a dictionary')
+    unknown = sorted(set(resources) - set(key for key, directive in DIRECTIVES))
+    if unknown:
+        raise AnsibleFilterError('systemd_resources: unknown key(s): {0}'.format(', '.join(unknown)))
+    lines = []
+    for key, directive in DIRECTIVES:
+        value = resources.get(key)
+        # IO bandwidth limits take one value per device
+        for item in (value if isinstance(value, list) else [value]):
+            if item is not None and '{0}'.format(item) != '':
+                lines.append('{0}={1}'.format(directive, item))
+    return lines
+
+
+class FilterModule(object):
+
+    def filters(self):
+        return {
+            'systemd_resources': systemd_resources,
+        }
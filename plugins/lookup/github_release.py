@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+name: github_release
+short_description: Resolve the latest release tag of GitHub repositories with a controller-side cache
+version_added: "1.6.0"
+description:
+  - Returns the C(tag_name) of the latest release of each repository.
+  - Answers are stored on the controller for O(cache_ttl) seconds and shared by every host, fork and
+    playbook run, so resolving a version for a whole fleet costs at most one API request per repository.
+  - Expired entries are revalidated with C(If-None-Match); GitHub does not count C(304 Not Modified)
+    answers against the rate limit.
+  - Use it from a task with C(run_once) so it is evaluated once per play.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  _terms:
+    description: Repositories in C(owner/name) format.
+    type: list
+    elements: str
+    required: true
+  api_url:
+    description: GitHub API URL.
+    type: str
+    default: https://api.github.com
+  token:
+    description:
+      - Optional token to raise the rate limit. Anonymous requests are limited to 60 per hour.
+    type: str
+  strip_v:
+    description: Remove a leading C(v) from the tag (C(v2.330.0) becomes C(2.330.0)).
+    type: bool
+    default: false
+  cache_dir:
+    description:
+      - Controller directory holding the cache. Set to an empty string to disable caching.
+    type: path
+    default: ~/.ansible/cache/code3tech.devtools
+  cache_ttl:
+    description: Seconds an answer is reused without contacting GitHub.
+    type: int
+    default: 3600
+  validate_certs:
+    description: Validate the API TLS certificate.
+    type: bool
+    default: true
+'''
+
+EXAMPLES = r'''
+- name: Resolve latest runner version once for the whole play
+  ansible.builtin.set_fact:
+    runner_version: "{{ lookup('code3tech.devtools.github_release', 'actions/runner', strip_v=true) }}"
+  run_once: true
+
+- name: Resolve two repositories, re-checking at most once a day
+  ansible.builtin.debug:
+    msg: "{{ query('code3tech.devtools.github_release', 'asdf-vm/asdf', 'cli/cli', cache_ttl=86400) }}"
+'''
+
+RETURN = r'''
+_raw:
+  description: Latest release tag of each repository.
+  type: list
+  elements: str
+'''
+
+import time
+
+from ansible.errors import AnsibleLookupError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.lookup import LookupBase
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.github_api import GitHubClient
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestError
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache, cache_key
+
+CACHE_NAMESPACE = 'github_releases'
+
+
+class LookupModule(LookupBase):
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        api_url = self.get_option('api_url').rstrip('/')
+        ttl = self.get_option('cache_ttl')
+        cache = FileCache(self.get_option('cache_dir'), CACHE_NAMESPACE) if self.get_option('cache_dir') else None
+
+        client = GitHubClient(api_url, token=self.get_option('token'),
+                              validate_certs=self.get_option('validate_certs'))
+        results = []
+        with client:
+            for repository in terms:
+                tag = self._resolve(client, cache, api_url, repository, ttl)
+                if self.get_option('strip_v') and tag[:1] in ('v', 'V'):
+                    tag = tag[1:]
+                results.append(tag)
+        return results
+
+    def _resolve(self, client, cache, api_url, repository, ttl):
+        if cache is None:
+            return self._fetch(client, repository, None)['tag_name']
+
+        key = cache_key(api_url, repository)
+        entry = cache.get(key)
+        if entry and time.time() - entry.get('checked_at', 0) < ttl:
+            return entry['tag_name']
+        with cache.lock(key):
+            # Another fork may have refreshed the entry while we were waiting.
+            entry = cache.get(key)
+            if entry and time.time() - entry.get('checked_at', 0) < ttl:
+                return entry['tag_name']
+            entry = self._fetch(client, repository, entry)
+            cache.set(key, entry)
+        return entry['tag_name']
+
+    def _fetch(self, client, repository, previous):
+        headers = {}
+        if previous and previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        path = '/repos/{0}/releases/latest'.format(repository)
+        try:
+            status, response_headers, data = client.request('GET', path, expected=(200, 304), headers=headers)
+        except RestError as exc:
+            if previous:
+                # Rate limited or GitHub unavailable: a stale answer beats failing the play.
+                self._display.warning('Using cached release of {0}: {1}'.format(repository, to_native(exc)))
+                return previous
+            raise AnsibleLookupError('Unable to get the latest release of {0}: HTTP {1}'.format(
+                repository, exc.status))
+        except Exception as exc:
+            if previous:
+                return previous
+            raise AnsibleLookupError('Unable to get the latest release of {0}: {1}'.format(
+                repository, to_native(exc)))
+        entry = dict(previous or {})
+        if status == 200:
+            entry = {'tag_name': data['tag_name'], 'etag': response_headers.get('etag')}
+        entry['checked_at'] = time.time()
+        return entry
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Helpers shared by the asdf modules.
+
+The asdf data directory layout (``plugins/<name>``, ``installs/<name>/<version>``)
+is read directly so that converged hosts never have to spawn asdf. Missing
+versions are installed concurrently and can be imported from, or exported to,
+a shared build cache of prebuilt install trees.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import multiprocessing
+import os
+import shutil
+import tarfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.text.converters import to_native
+
+# Download caches honoured by the *-build tools used by the asdf plugins.
+BUILD_CACHE_ENV = {
+    'python': 'PYTHON_BUILD_CACHE_PATH',
+    'ruby': 'RUBY_BUILD_CACHE_PATH',
+    'nodejs': 'NODE_BUILD_CACHE_PATH',
+}
+
+
+class Asdf(object):
+    """Thin wrapper around an asdf binary and its data directory."""
+
+    def __init__(self, module, binary, data_dir):
+        self.module = module
+        self.binary = binary
+        self.data_dir = data_dir
+
+    def plugins(self):
+        path = os.path.join(self.data_dir, 'plugins')
+        if not os.path.isdir(path):
+            return []
+        return sorted(name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name)))
+
+    def install_path(self, plugin, version):
+        return os.path.join(self.data_dir, 'installs', plugin, version)
+
+    def installed(self, plugin):
+        path = os.path.join(self.data_dir, 'installs', plugin)
+        if not os.path.isdir(path):
+            return []
+        return sorted(name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name)))
+
+    def run(self, *args, **kwargs):
+        environ = {'ASDF_DATA_DIR': self.data_dir}
+        environ.update(kwargs.get('environ') or {})
+        return self.module.run_command([self.binary] + list(args), environ_update=environ)
+
+
+class BuildCache(object):
+    """Directory of prebuilt install trees keyed by plugin, version and platform.
+
+    The directory may live on shared storage: archives are written to a
+    temporary name and renamed into place, so readers never see partial files.
+    Install trees contain absolute paths, so hosts sharing a cache must use the
+    same ``ASDF_DATA_DIR`` and a compatible platform tag.
+    """
+
+    def __init__(self, directory, platform):
+        self.directory = directory
+        self.platform = platform
+
+    def archive_path(self, plugin, version):
+        return os.path.join(self.directory, plugin, '{0}-{1}-{2}.tar.gz'.format(plugin, version, self.platform))
+
+    def download_environ(self, plugin):
+        variable = BUILD_CACHE_ENV.get(plugin)
+        if not variable:
+            return {}
+        path = os.path.join(self.directory, 'downloads', plugin)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        return {variable: path}
+
+    def has(self, plugin, version):
+        return os.path.isfile(self.archive_path(plugin, version))
+
+    def import_to(self, plugin, version, target):
+        """Unpack the cached tree of ``plugin``/``version`` into ``target``."""
+        parent = os.path.dirname(target)
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+        work_dir = tempfile.mkdtemp(dir=parent, prefix='.' + version + '.')
+        try:
+            with tarfile.open(self.archive_path(plugin, version), 'r:gz') as archive:
+                for member in archive.getmembers():
+                    name = os.path.normpath(member.name)
+                    if name.startswith(os.pardir) or os.path.isabs(name):
+                        raise ValueError('Unsafe path {0!r} in cached archive'.format(member.name))
+                # Keep the 'tar' semantics (modes, links) on Pythons with extraction filters.
+                extra = {'filter': 'tar'} if hasattr(tarfile, 'tar_filter') else {}
+                archive.extractall(work_dir, **extra)
+            os.rename(work_dir, target)
+        finally:
+            if os.path.isdir(work_dir):
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    def export_from(self, plugin, version, source):
+        """Store the install tree ``source`` as the cached build of ``plugin``/``version``."""
+        archive_path = self.archive_path(plugin, version)
+        parent = os.path.dirname(archive_path)
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+        fd, tmp_path = tempfile.mkstemp(dir=parent, prefix='.' + os.path.basename(archive_path) + '.')
+        os.close(fd)
+        try:
+            with tarfile.open(tmp_path, 'w:gz') as archive:
+                archive.add(source, arcname='.')
+            os.chmod(tmp_path, 0o644)
+            os.rename(tmp_path, archive_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def install_one(asdf, plugin, version, cache=None, cache_import=True, cache_export=False, concurrency=None):
+    """Install a single version, preferring the build cache. Returns a result dict."""
+    result = {'plugin': plugin, 'version': version}
+    target = asdf.install_path(plugin, version)
+    try:
+        if cache is not None and cache_import and cache.has(plugin, version):
+            cache.import_to(plugin, version, target)
+            result['source'] = 'cache'
+            return result
+        environ = {}
+        if concurrency:
+            environ['ASDF_CONCURRENCY'] = str(concurrency)
+        if cache is not None:
+            environ.update(cache.download_environ(plugin))
+        rc, out, err = asdf.run('install', plugin, version, environ=environ)
+        if rc != 0:
+            result.update(failed=True, rc=rc, stdout=out, stderr=err)
+            return result
+        result['source'] = 'build'
+        if cache is not None and cache_export and os.path.isdir(target):
+            cache.export_from(plugin, version, target)
+            result['exported'] = True
+    except Exception as exc:
+        result.update(failed=True, msg=to_native(exc))
+    return result
+
+
+def install_many(asdf, pairs, workers=1, cache=None, cache_import=True, cache_export=False):
+    """Install ``[(plugin, version), ...]`` with up to ``workers`` installs at a time.
+
+    The CPU budget given to each build (``ASDF_CONCURRENCY``) is divided by the
+    number of workers so parallel compiles do not oversubscribe the host.
+    """
+    if not pairs:
+        return []
+    workers = max(1, min(workers, len(pairs)))
+    concurrency = max(1, multiprocessing.cpu_count() // workers)
+    results = []
+    if workers == 1:
+        for plugin, version in pairs:
+            results.append(install_one(asdf, plugin, version, cache, cache_import, cache_export, concurrency))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(install_one, asdf, plugin, version, cache, cache_import, cache_export,
+                                   concurrency) for plugin, version in pairs]
+            results = [future.result() for future in futures]
+    # Imported trees have no shims yet; one reshim covers every import.
+    if any(r.get('source') == 'cache' for r in results):
+        asdf.run('reshim')
+    return results
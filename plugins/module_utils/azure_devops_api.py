@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Azure DevOps REST API helpers for the azure_devops_agents role plugins."""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+
+from ansible.module_utils.six.moves.urllib.parse import quote
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestClient
+
+API_VERSION = '7.1'
+# Deployment groups and environments hold agents, each kind under its own API path.
+RESOURCE_KINDS = {
+    'deployment_group': 'deploymentgroups',
+    'environment': 'environments',
+}
+
+
+def tag_changes(current, wanted):
+    """Return ``(added, removed)`` between two tag lists (tags compare case-insensitively)."""
+    current = dict((tag.lower(), tag) for tag in current or [])
+    wanted = dict((tag.lower(), tag) for tag in wanted or [])
+    added = [wanted[key] for key in sorted(wanted) if key not in current]
+    removed = [current[key] for key in sorted(current) if key not in wanted]
+    return added, removed
+
+
+def target_name(target):
+    """Agent name of a deployment target or environment virtual machine resource."""
+    return (target.get('agent') or {}).get('name') or target.get('name')
+
+
+class AzureDevOpsClient(RestClient):
+    """Persistent Azure DevOps REST API client for one organization."""
+
+    def __init__(self, organization_url, pat=None, **kwargs):
+        headers = {}
+        if pat:
+            credentials = base64.b64encode((':' + pat).encode('utf-8')).decode('ascii')
+            headers['Authorization'] = 'Basic {0}'.format(credentials)
+        super(AzureDevOpsClient, self).__init__(organization_url, headers=headers, **kwargs)
+
+    @staticmethod
+    def _path(project, kind, *parts):
+        path = '/{0}/_apis/distributedtask/{1}'.format(quote(project, safe=''), RESOURCE_KINDS[kind])
+        return '/'.join([path] + [str(part) for part in parts])
+
+    def _list(self, path, params=None):
+        """Return every item of a list, following ``x-ms-continuationtoken``."""
+        params = dict(params or {}, **{'api-version': API_VERSION})
+
+        def next_page(headers, data):
+            token = headers.get('x-ms-continuationtoken')
+            return self.url_for(path, dict(params, continuationToken=token)) if token else None
+
+        return list(self.paginate(path, params=params, items_key='value', next_page=next_page))
+
+    def find(self, project, kind, name):
+        """Return the deployment group or environment called ``name`` (``None`` when missing)."""
+        for item in self._list(self._path(project, kind), {'name': name}):
+            if item.get('name', '').lower() == name.lower():
+                return item
+        return None
+
+    def create(self, project, kind, name, description=''):
+        """Create a deployment group or environment and return it."""
+        return self.request('POST', self._path(project, kind), params={'api-version': API_VERSION},
+                            body={'name': name, 'description': description}, expected=(200, 201))[2]
+
+    def targets(self, project, kind, resource_id):
+        """Return every agent of a deployment group (targets) or environment (VM resources)."""
+        if kind == 'deployment_group':
+            return self._list(self._path(project, kind, resource_id, 'targets'))
+        return self._list(self._path(project, kind, resource_id, 'providers', 'virtualmachines'))
+
+    def update_tags(self, project, kind, resource_id, updates):
+        """Set the tags of several agents; ``updates`` is a list of ``{'id', 'name', 'tags'}``."""
+        params = {'api-version': API_VERSION}
+        if kind == 'deployment_group':
+            # Deployment targets are updated in bulk, in one call.
+            body = [{'id': u['id'], 'tags': u['tags']} for u in updates]
+            return self.request('PATCH', self._path(project, kind, resource_id, 'targets'),
+                                params=params, body=body)[2]
+        path = self._path(project, kind, resource_id, 'providers', 'virtualmachines')
+        return [self.request('PATCH', path, params=params, body=update)[2] for update in updates]
+
+    def _permissions_path(self, project, resource_id):
+        return '/{0}/_apis/pipelines/pipelinepermissions/environment/{1}'.format(
+            quote(project, safe=''), resource_id)
+
+    def open_access(self, project, resource_id):
+        """Whether every pipeline may use the environment."""
+        data = self.get(self._permissions_path(project, resource_id), params={'api-version': '7.1-preview.1'})
+        return bool(((data or {}).get('allPipelines') or {}).get('authorized'))
+
+    def set_open_access(self, project, resource_id, authorized=True):
+        """Allow (or stop allowing) every pipeline to use the environment."""
+        self.request('PATCH', self._permissions_path(project, resource_id), params={'api-version': '7.1-preview.1'},
+                     body={'allPipelines': {'authorized': authorized}})
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""GitHub REST API helpers for the github_actions_runners role plugins."""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import calendar
+import re
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestClient
+
+GITHUB_API_VERSION = '2022-11-28'
+RUNNER_SCOPES = ('organization', 'repository', 'enterprise')
+
+_TIMESTAMP_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(Z|[+-]\d{2}:?\d{2})?$'
+)
+
+
+def parse_timestamp(value):
+    """Convert an ISO 8601 timestamp (as returned by GitHub) to epoch seconds."""
+    match = _TIMESTAMP_RE.match((value or '').strip())
+    if not match:
+        raise ValueError('Invalid timestamp: {0!r}'.format(value))
+    year, month, day, hour, minute, second = (int(x) for x in match.groups()[:6])
+    epoch = calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+    offset = match.group(7)
+    if offset and offset != 'Z':
+        sign = -1 if offset[0] == '-' else 1
+        digits = offset[1:].replace(':', '')
+        epoch -= sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60)
+    return epoch
+
+
+def runners_path(scope, organization=None, repository=None, enterprise=None):
+    """Return the ``.../actions/runners`` API path for a runner scope."""
+    if scope == 'organization':
+        if not organization:
+            raise ValueError('organization is required for organization scope')
+        return '/orgs/{0}/actions/runners'.format(organization)
+    if scope == 'repository':
+        if not repository:
+            raise ValueError('repository is required for repository scope')
+        return '/repos/{0}/actions/runners'.format(repository)
+    if scope == 'enterprise':
+        if not enterprise:
+            raise ValueError('enterprise is required for enterprise scope')
+        return '/enterprises/{0}/actions/runners'.format(enterprise)
+    raise ValueError('Unsupported runner scope: {0!r}'.format(scope))
+
+
+def label_changes(current, wanted):
+    """Compare the labels of a runner (as listed by the API) with the wanted custom labels.
+
+    Default labels (``self-hosted``, OS, architecture) are read-only and ignored
+    when they appear in ``wanted``. Labels compare case-insensitively, like on
+    GitHub. Returns ``(added, removed)``, both empty when nothing changes.
+    """
+    read_only = set(label['name'].lower() for label in current if label.get('type') == 'read-only')
+    custom = dict((label['name'].lower(), label['name']) for label in current if label.get('type') != 'read-only')
+    wanted = dict((name.lower(), name) for name in wanted if name.lower() not in read_only)
+    added = [wanted[key] for key in sorted(wanted) if key not in custom]
+    removed = [custom[key] for key in sorted(custom) if key not in wanted]
+    return added, removed
+
+
+class GitHubClient(RestClient):
+    """Persistent GitHub REST API client."""
+
+    def __init__(self, api_url, token=None, **kwargs):
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': GITHUB_API_VERSION,
+        }
+        if token:
+            headers['Authorization'] = 'Bearer {0}'.format(token)
+        super(GitHubClient, self).__init__(api_url, headers=headers, **kwargs)
+
+    def registration_token(self, scope_path):
+        """Create a runner registration token for ``scope_path``.
+
+        Returns ``{'token': ..., 'expires_at': ..., 'expires_at_epoch': ...}``.
+        """
+        data = self.request('POST', scope_path + '/registration-token', expected=(201,))[2]
+        return {
+            'token': data['token'],
+            'expires_at': data['expires_at'],
+            'expires_at_epoch': parse_timestamp(data['expires_at']),
+        }
+
+    def list_runners(self, scope_path):
+        """Return every runner registered in ``scope_path`` (all pages)."""
+        return list(self.paginate(scope_path, params={'per_page': 100}, items_key='runners'))
+
+    def set_runner_labels(self, scope_path, runner_id, labels):
+        """Replace the custom labels of a runner and return its new label list."""
+        path = '{0}/{1}/labels'.format(scope_path, int(runner_id))
+        return self.request('PUT', path, body={'labels': list(labels)})[2].get('labels', [])
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""GitLab REST API helpers for the gitlab_ci_runners role plugins."""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible.module_utils.six.moves.urllib.parse import quote
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestClient, RestError
+
+# Attributes accepted by PUT /runners/:id.
+RUNNER_ATTRIBUTES = (
+    'description', 'paused', 'locked', 'run_untagged', 'tag_list',
+    'access_level', 'maximum_timeout', 'maintenance_note',
+)
+
+
+def encode_path(path):
+    """URL-encode a namespaced path (``group/sub``) for use as an API ``:id``."""
+    return quote(str(path).strip('/'), safe='')
+
+
+def runner_changes(current, wanted):
+    """Return the subset of ``wanted`` runner attributes that differ from ``current``."""
+    changes = {}
+    for key, value in wanted.items():
+        if value is None:
+            continue
+        have = current.get(key)
+        if key == 'tag_list':
+            if sorted(have or []) != sorted(value):
+                changes[key] = list(value)
+        elif key == 'maximum_timeout':
+            if int(have or 0) != int(value):
+                changes[key] = int(value)
+        elif have != value:
+            changes[key] = value
+    return changes
+
+
+class GitLabClient(RestClient):
+    """Persistent GitLab REST API (v4) client."""
+
+    def __init__(self, gitlab_url, token=None, **kwargs):
+        headers = {}
+        if token:
+            headers['PRIVATE-TOKEN'] = token
+        super(GitLabClient, self).__init__(gitlab_url.rstrip('/') + '/api/v4', headers=headers, **kwargs)
+
+    def _namespace_id(self, kind, path):
+        try:
+            return int(self.get('/{0}/{1}'.format(kind, encode_path(path)))['id'])
+        except RestError as exc:
+            if exc.status == 404:
+                return None
+            raise
+
+    def group_id(self, full_path):
+        """Return the numeric ID of a group (``None`` when it does not exist)."""
+        return self._namespace_id('groups', full_path)
+
+    def project_id(self, path):
+        """Return the numeric ID of a project (``None`` when it does not exist)."""
+        return self._namespace_id('projects', path)
+
+    def list_runners(self, **filters):
+        """Return every runner visible to the token (all pages).
+
+        ``/runners/all`` lists the whole instance but needs an administrator;
+        other tokens fall back to ``/runners`` (runners the user has access to).
+        """
+        params = dict((k, v) for k, v in filters.items() if v not in (None, ''))
+        params['per_page'] = 100
+        try:
+            return list(self.paginate('/runners/all', params=params))
+        except RestError as exc:
+            if exc.status != 403:
+                raise
+        return list(self.paginate('/runners', params=params))
+
+    def runner(self, runner_id):
+        """Return the details of a runner (including ``tag_list``)."""
+        return self.get('/runners/{0}'.format(int(runner_id)))
+
+    def update_runner(self, runner_id, **attributes):
+        """Update a runner and return its new details."""
+        return self.request('PUT', '/runners/{0}'.format(int(runner_id)), body=attributes)[2]
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Small keep-alive JSON REST client shared by the collection's API plugins.
+
+``ansible.builtin.uri`` opens a new TCP/TLS connection for every call. The
+runner roles talk to the same API host dozens of times per play, so this
+client keeps one persistent connection per base URL, follows ``Link``
+pagination and retries on rate limiting / transient gateway errors.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import ssl
+import time
+
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import urlencode, urlsplit, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'PUT', 'DELETE')
+
+
+class RestError(Exception):
+    """Raised when the API answers with an unexpected status code."""
+
+    def __init__(self, method, url, status, body=None):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.body = body
+        super(RestError, self).__init__(
+            '{0} {1} returned HTTP {2}: {3}'.format(method, url, status, body if body is not None else '')
+        )
+
+
+def parse_link_header(value):
+    """Return a ``{rel: url}`` dict from an RFC 8288 ``Link`` header."""
+    links = {}
+    for part in (value or '').split(','):
+        section = part.split(';')
+        if len(section) < 2:
+            continue
+        url = section[0].strip().lstrip('<').rstrip('>')
+        for param in section[1:]:
+            param = param.strip()
+            if param.startswith('rel='):
+                links[param[4:].strip('"')] = url
+    return links
+
+
+class RestClient(object):
+    """JSON REST client that reuses a single HTTP(S) connection."""
+
+    def __init__(self, base_url, headers=None, validate_certs=True, ca_path=None,
+                 timeout=30, retries=3, user_agent='code3tech.devtools'):
+        parts = urlsplit(base_url.rstrip('/'))
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError('Unsupported URL scheme in {0!r}'.format(base_url))
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.headers = {
+            'Accept': 'application/json',
+            'User-Agent': user_agent,
+            'Connection': 'keep-alive',
+        }
+        self.headers.update(headers or {})
+        self.validate_certs = validate_certs
+        self.ca_path = ca_path
+        self.timeout = timeout
+        self.retries = retries
+        self.requests_made = 0
+        self._conn = None
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+    def _ssl_context(self):
+        context = ssl.create_default_context(cafile=self.ca_path or None)
+        if not self.validate_certs:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        return context
+
+    def _proxy(self):
+        if proxy_bypass(self.host):
+            return None
+        proxy = getproxies().get(self.scheme)
+        return urlsplit(proxy) if proxy else None
+
+    def _connect(self):
+        proxy = self._proxy()
+        target_port = self.port or (443 if self.scheme == 'https' else 80)
+        if self.scheme == 'https':
+            if proxy:
+                conn = http_client.HTTPSConnection(proxy.hostname, proxy.port or 3128, timeout=self.timeout,
+                                                   context=self._ssl_context())
+                conn.set_tunnel(self.host, target_port)
+            else:
+                conn = http_client.HTTPSConnection(self.host, target_port, timeout=self.timeout,
+                                                   context=self._ssl_context())
+        else:
+            if proxy:
+                conn = http_client.HTTPConnection(proxy.hostname, proxy.port or 3128, timeout=self.timeout)
+            else:
+                conn = http_client.HTTPConnection(self.host, target_port, timeout=self.timeout)
+        return conn
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            finally:
+                self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    def url_for(self, path, params=None):
+        """Return the absolute URL for an API path (or pass absolute URLs through)."""
+        if path.startswith('http://') or path.startswith('https://'):
+            url = path
+        else:
+            netloc = self.host if self.port is None else '{0}:{1}'.format(self.host, self.port)
+            url = '{0}://{1}{2}/{3}'.format(self.scheme, netloc, self.base_path, path.lstrip('/'))
+        if params:
+            url += ('&' if '?' in url else '?') + urlencode(params)
+        return url
+
+    def _request_target(self, url):
+        # Plain HTTP proxies expect the absolute URL, everything else the path only.
+        if self.scheme == 'http' and self._proxy():
+            return url
+        parts = urlsplit(url)
+        return parts.path + ('?' + parts.query if parts.query else '')
+
+    def _send(self, method, url, payload, headers):
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = self._connect()
+            try:
+                self._conn.request(method, self._request_target(url), body=payload, headers=headers)
+                response = self._conn.getresponse()
+                body = response.read()
+            except (http_client.HTTPException, OSError):
+                # Stale keep-alive connection: reconnect once, then give up.
+                self.close()
+                if attempt:
+                    raise
+                continue
+            if (response.getheader('Connection') or '').lower() == 'close':
+                self.close()
+            return response, body
+        raise http_client.HTTPException('Unable to send request to {0}'.format(url))
+
+    def request(self, method, path, body=None, params=None, expected=(200,), headers=None):
+        """Perform a request and return ``(status, headers, decoded_json_or_None)``."""
+        url = self.url_for(path, params)
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            request_headers['Content-Type'] = 'application/json'
+
+        # A failed POST/PATCH may already have been applied server side, so
+        # those are only retried when the server explicitly rate limited us.
+        retry_statuses = RETRY_STATUSES if method in IDEMPOTENT_METHODS else (429,)
+        delay = 1
+        for attempt in range(self.retries + 1):
+            response, raw = self._send(method, url, payload, request_headers)
+            self.requests_made += 1
+            status = response.status
+            retry_after = response.getheader('Retry-After')
+            # GitHub signals secondary rate limits with 403 + Retry-After.
+            throttled = status == 403 and retry_after is not None
+            if (status in retry_statuses or throttled) and attempt < self.retries:
+                try:
+                    wait = min(int(retry_after), 60) if retry_after else delay
+                except ValueError:
+                    wait = delay
+                time.sleep(wait)
+                delay *= 2
+                continue
+            break
+
+        text = raw.decode('utf-8', 'replace') if raw else ''
+        data = None
+        if text:
+            try:
+                data = json.loads(text)
+            except ValueError:
+                data = text
+        if expected and status not in expected:
+            raise RestError(method, url, status, data)
+        return status, dict((k.lower(), v) for k, v in response.getheaders()), data
+
+    def get(self, path, params=None, expected=(200,)):
+        return self.request('GET', path, params=params, expected=expected)[2]
+
+    def paginate(self, path, params=None, items_key=None, next_page=None):
+        """Yield every item of a paginated collection.
+
+        Pages are followed through the ``Link: rel="next"`` header. APIs that
+        use another mechanism can pass ``next_page(headers, data)`` returning
+        the next URL (or ``None``).
+        """
+        url = self.url_for(path, params)
+        while url:
+            status, headers, data = self.request('GET', url)
+            items = data.get(items_key, []) if items_key and isinstance(data, dict) else (data or [])
+            for item in items:
+                yield item
+            if next_page is not None:
+                url = next_page(headers, data)
+            else:
+                url = parse_link_header(headers.get('link')).get('next')
+            if url and not (url.startswith('http://') or url.startswith('https://')):
+                url = urljoin(self.url_for(''), url)
+
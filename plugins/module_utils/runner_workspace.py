@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Disk usage, busy-runner detection and least-recently-used planning for runner work folders.
+
+Used by the ``runner_workspace_cleanup`` module and by the disk guard script
+the runner roles install on the hosts (``runner-disk-guard.py``), which loads
+this file from its own directory: it must only depend on the standard library.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import shutil
+import stat
+
+DAY = 86400
+
+
+def tree_usage(path):
+    """Return ``(bytes on disk, newest mtime)`` of a file or directory tree, without following links."""
+    size = 0
+    newest = 0
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        try:
+            info = os.lstat(current)
+        except OSError:
+            continue
+        size += getattr(info, 'st_blocks', 0) * 512 or info.st_size
+        newest = max(newest, info.st_mtime)
+        if stat.S_ISDIR(info.st_mode):
+            try:
+                pending.extend(os.path.join(current, name) for name in os.listdir(current))
+            except OSError:
+                pass
+    return size, newest
+
+
+def disk_usage(path):
+    """Return ``(used bytes, size available to users)`` like df does."""
+    info = os.statvfs(path)
+    used = (info.f_blocks - info.f_bfree) * info.f_frsize
+    return used, used + info.f_bavail * info.f_frsize
+
+
+def process_state(workers):
+    """Return ``(runner directories running one of workers, working directories of every process)``.
+
+    ``workers`` are executable names (``Runner.Worker``); a runner directory is
+    the parent of the ``bin`` directory holding the worker.
+    """
+    workers = set(workers)
+    busy = set()
+    cwds = set()
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            cwds.add(os.readlink('/proc/{0}/cwd'.format(pid)))
+            with open('/proc/{0}/cmdline'.format(pid), 'rb') as handle:
+                argv0 = handle.read().split(b'\0', 1)[0].decode('utf-8', 'replace')
+        except (IOError, OSError):
+            continue
+        if os.path.basename(argv0) in workers:
+            # <runner dir>/bin/<worker>
+            busy.add(os.path.realpath(os.path.dirname(os.path.dirname(argv0))))
+    return busy, cwds
+
+
+def is_held(path, cwds):
+    """Whether ``path`` is, or holds, the working directory of a process."""
+    prefix = path + os.sep
+    return any(cwd == path or cwd.startswith(prefix) for cwd in cwds)
+
+
+def is_below(path, directories):
+    """Whether ``path`` lies inside one of ``directories``."""
+    return any(path.startswith(directory + os.sep) for directory in directories)
+
+
+def plan(candidates, max_ages, now, to_free, lru_kinds):
+    """Select the candidates to remove: first by age, then least recently used until ``to_free`` bytes.
+
+    A candidate is a dict with ``kind``, ``path``, ``size`` and ``last_used``;
+    ``max_ages`` maps a kind to its maximum age in days (``0`` = no limit).
+    """
+    selected = []
+    remaining = []
+    for candidate in candidates:
+        max_age = max_ages.get(candidate['kind'], 0)
+        if max_age > 0 and now - candidate['last_used'] > max_age * DAY:
+            selected.append(candidate)
+            to_free -= candidate['size']
+        else:
+            remaining.append(candidate)
+    for candidate in sorted(remaining, key=lambda c: c['last_used']):
+        if to_free <= 0:
+            break
+        if candidate['kind'] in lru_kinds:
+            selected.append(candidate)
+            to_free -= candidate['size']
+    return selected
+
+
+def remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.unlink(path)
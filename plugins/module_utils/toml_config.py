@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Format-preserving editor for GitLab Runner ``config.toml`` files.
+
+Only the key/value lines that change are rewritten: comments, ordering,
+indentation and unmanaged keys stay as they are. The parser understands the
+TOML subset written by ``gitlab-runner`` (tables, arrays of tables, strings,
+numbers, booleans, arrays and inline tables) and does not need a TOML
+library on the managed host.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import re
+
+_HEADER_RE = re.compile(r'^\s*(\[\[?)\s*([^\[\]]+?)\s*\]\]?\s*(#.*)?$')
+_KEY_RE = re.compile(r'(\s*)("(?:[^"\\]|\\.)*"|\'[^\']*\'|[A-Za-z0-9_-]+)\s*=\s*')
+_BARE_KEY_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+_NUMBER_RE = re.compile(r'[+-]?(?:0x[0-9A-Fa-f_]+|0o[0-7_]+|0b[01_]+|inf|nan|[0-9_]+(?:\.[0-9_]+)?(?:[eE][+-]?[0-9_]+)?)')
+_OTHER_RE = re.compile(r'[^\s,\]\}#]+')
+_SECRET_RE = re.compile(r'token|password|secret|access_key|secret_key', re.IGNORECASE)
+_ESCAPES = {'b': '\b', 't': '\t', 'n': '\n', 'f': '\f', 'r': '\r', '"': '"', '\\': '\\'}
+
+
+class TomlError(ValueError):
+    """Raised when the document cannot be parsed."""
+
+
+# ----------------------------------------------------------------------
+# Values
+# ----------------------------------------------------------------------
+def _skip_ws(text, pos, newlines=False):
+    while pos < len(text):
+        char = text[pos]
+        if char in ' \t' or (newlines and char in '\r\n'):
+            pos += 1
+        elif newlines and char == '#':
+            while pos < len(text) and text[pos] != '\n':
+                pos += 1
+        else:
+            break
+    return pos
+
+
+def _parse_basic_string(text, pos, multiline):
+    quote = '"""' if multiline else '"'
+    pos += len(quote)
+    if multiline and text[pos:pos + 1] == '\n':
+        pos += 1
+    chars = []
+    while pos < len(text):
+        if text.startswith(quote, pos):
+            return ''.join(chars), pos + len(quote)
+        char = text[pos]
+        if char == '\n' and not multiline:
+            break
+        if char == '\\':
+            nxt = text[pos + 1:pos + 2]
+            if nxt in _ESCAPES:
+                chars.append(_ESCAPES[nxt])
+                pos += 2
+            elif nxt in ('u', 'U'):
+                size = 4 if nxt == 'u' else 8
+                chars.append(chr(int(text[pos + 2:pos + 2 + size], 16)))
+                pos += 2 + size
+            elif multiline and nxt in (' ', '\t', '\r', '\n'):
+                # Line-ending backslash trims the following whitespace.
+                pos = _skip_ws(text, pos + 1, newlines=True)
+            else:
+                raise TomlError('Invalid escape sequence at offset {0}'.format(pos))
+            continue
+        chars.append(char)
+        pos += 1
+    raise TomlError('Unterminated string')
+
+
+def _parse_literal_string(text, pos, multiline):
+    quote = "'''" if multiline else "'"
+    start = pos + len(quote)
+    if multiline and text[start:start + 1] == '\n':
+        start += 1
+    end = text.find(quote, start)
+    if end < 0 or (not multiline and '\n' in text[start:end]):
+        raise TomlError('Unterminated string')
+    return text[start:end], end + len(quote)
+
+
+def parse_value(text, pos=0):
+    """Parse the TOML value starting at ``pos``. Returns ``(value, end_pos)``."""
+    pos = _skip_ws(text, pos)
+    if text.startswith('"""', pos):
+        return _parse_basic_string(text, pos, True)
+    if text.startswith("'''", pos):
+        return _parse_literal_string(text, pos, True)
+    char = text[pos:pos + 1]
+    if char == '"':
+        return _parse_basic_string(text, pos, False)
+    if char == "'":
+        return _parse_literal_string(text, pos, False)
+    if char == '[':
+        items = []
+        pos = _skip_ws(text, pos + 1, newlines=True)
+        while text[pos:pos + 1] != ']':
+            if pos >= len(text):
+                raise TomlError('Unterminated array')
+            value, pos = parse_value(text, pos)
+            items.append(value)
+            pos = _skip_ws(text, pos, newlines=True)
+            if text[pos:pos + 1] == ',':
+                pos = _skip_ws(text, pos + 1, newlines=True)
+        return items, pos + 1
+    if char == '{':
+        table = {}
+        pos = _skip_ws(text, pos + 1)
+        while text[pos:pos + 1] != '}':
+            match = _KEY_RE.match(text, pos)
+            if not match:
+                raise TomlError('Invalid inline table')
+            value, pos = parse_value(text, match.end())
+            table[_unquote_key(match.group(2))] = value
+            pos = _skip_ws(text, pos)
+            if text[pos:pos + 1] == ',':
+                pos = _skip_ws(text, pos + 1)
+        return table, pos + 1
+    for literal, value in (('true', True), ('false', False)):
+        if text.startswith(literal, pos):
+            return value, pos + len(literal)
+    match = _NUMBER_RE.match(text, pos)
+    if match and (match.end() == len(text) or text[match.end()] in ' \t\r\n,]}#'):
+        raw = match.group(0).replace('_', '')
+        try:
+            if raw.lstrip('+-')[:2] in ('0x', '0o', '0b'):
+                return int(raw, 0), match.end()
+            if raw.lstrip('+-') in ('inf', 'nan') or '.' in raw or 'e' in raw.lower():
+                return float(raw), match.end()
+            return int(raw), match.end()
+        except ValueError:
+            pass
+    # Dates and anything else we do not model are kept verbatim.
+    match = _OTHER_RE.match(text, pos)
+    if not match:
+        raise TomlError('Missing value at offset {0}'.format(pos))
+    return match.group(0), match.end()
+
+
+def dump_value(value):
+    """Render a Python value as an inline TOML value."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(dump_value(item) for item in value) + ']'
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        return '{ ' + ', '.join('{0} = {1}'.format(dump_key(k), dump_value(v)) for k, v in value.items()) + ' }'
+    # json.dumps produces a valid TOML basic string for any text.
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def dump_key(key):
+    return key if _BARE_KEY_RE.match(key) else json.dumps(key, ensure_ascii=False)
+
+
+def _unquote_key(key):
+    if key[:1] == '"':
+        return parse_value(key)[0]
+    if key[:1] == "'":
+        return key[1:-1]
+    return key
+
+
+def same_value(left, right):
+    """Compare two values the way TOML sees them (``1`` is not ``true``)."""
+    if isinstance(left, bool) or isinstance(right, bool):
+        return isinstance(left, bool) and isinstance(right, bool) and left == right
+    if isinstance(left, (list, tuple)) and isinstance(right, (list, tuple)):
+        return len(left) == len(right) and all(same_value(a, b) for a, b in zip(left, right))
+    if isinstance(left, dict) and isinstance(right, dict):
+        return sorted(left) == sorted(right) and all(same_value(left[k], right[k]) for k in left)
+    return left == right
+
+
+# ----------------------------------------------------------------------
+# Document
+# ----------------------------------------------------------------------
+class Section(object):
+    """A table of the document: ``name`` is its dotted path, ``()`` for the root."""
+
+    def __init__(self, name, array, start, end):
+        self.name = name
+        self.array = array
+        self.start = start      # header line, None for the root table
+        self.end = end          # first line after the section
+
+
+class TomlDocument(object):
+    """Line-based, format-preserving view of a TOML document."""
+
+    def __init__(self, text=''):
+        self.lines = text.splitlines()
+        self.sections = []
+        self._index()
+
+    def render(self):
+        return '\n'.join(self.lines) + '\n' if self.lines else ''
+
+    # -- structure -----------------------------------------------------
+    def _index(self):
+        self.sections = []
+        current = Section((), False, None, None)
+        line_no = 0
+        while line_no < len(self.lines):
+            line = self.lines[line_no]
+            header = _HEADER_RE.match(line)
+            if header:
+                current.end = line_no
+                self.sections.append(current)
+                name = tuple(_unquote_key(part.strip()) for part in header.group(2).split('.'))
+                current = Section(name, header.group(1) == '[[', line_no, None)
+                line_no += 1
+                continue
+            match = _KEY_RE.match(line)
+            if match:
+                line_no = self._value_end(line_no, match.end())
+                continue
+            line_no += 1
+        current.end = len(self.lines)
+        self.sections.append(current)
+
+    def _value_end(self, line_no, column):
+        """Return the line following the (possibly multi-line) value starting at ``line_no``."""
+        text = self.lines[line_no]
+        end = line_no
+        while True:
+            try:
+                parse_value(text, column)
+                return end + 1
+            except (TomlError, IndexError, ValueError):
+                if end + 1 >= len(self.lines):
+                    raise TomlError('Unterminated value on line {0}'.format(line_no + 1))
+                end += 1
+                text += '\n' + self.lines[end]
+
+    def runner_blocks(self):
+        """Return ``[(index, [sections])]`` for every ``[[runners]]`` element."""
+        blocks = []
+        for section in self.sections:
+            if section.array and section.name == ('runners',):
+                blocks.append([section])
+            elif blocks and section.name[:1] == ('runners',):
+                # [runners.docker], [[runners.docker.services]], ... belong to the last element.
+                blocks[-1].append(section)
+        return blocks
+
+    # -- key access ----------------------------------------------------
+    def _keys(self, section):
+        first = section.start + 1 if section.start is not None else 0
+        line_no = first
+        while line_no < section.end:
+            match = _KEY_RE.match(self.lines[line_no])
+            if match:
+                end = self._value_end(line_no, match.end())
+                yield _unquote_key(match.group(2)), line_no, end, match
+                line_no = end
+            else:
+                line_no += 1
+
+    def get(self, section, key):
+        """Return ``(found, value)`` for ``key`` in ``section``."""
+        for name, start, end, match in self._keys(section):
+            if name == key:
+                text = '\n'.join(self.lines[start:end])
+                return True, parse_value(text, match.end())[0]
+        return False, None
+
+    def set(self, section, key, value):
+        """Set (or remove when ``value`` is None) ``key`` in ``section``. Returns True when changed."""
+        last_key_end = None
+        indent = None
+        for name, start, end, match in self._keys(section):
+            last_key_end = end
+            indent = match.group(1) if indent is None else indent
+            if name != key:
+                continue
+            text = '\n'.join(self.lines[start:end])
+            current = parse_value(text, match.end())
+            if value is None:
+                del self.lines[start:end]
+            else:
+                if same_value(current[0], value):
+                    return False
+                # Keep the indentation and any trailing comment of the line.
+                remainder = text[current[1]:]
+                comment = remainder if remainder.strip().startswith('#') else ''
+                self.lines[start:end] = ['{0}{1} = {2}{3}'.format(
+                    match.group(1), match.group(2), dump_value(value), comment)]
+            self._index()
+            return True
+        if value is None:
+            return False
+        if indent is None:
+            indent = '  ' * len(section.name) if section.start is not None else ''
+        if last_key_end is not None:
+            position = last_key_end
+        elif section.start is not None:
+            position = section.start + 1
+        else:
+            position = 0
+        self.lines.insert(position, '{0}{1} = {2}'.format(indent, dump_key(key), dump_value(value)))
+        self._index()
+        return True
+
+    def add_table(self, name, line_no):
+        """Insert an empty ``[name]`` table header at ``line_no`` and return its section."""
+        # gitlab-runner indents sub-tables of [[runners]] by their depth.
+        indent = '  ' * (len(name) - 1) if name[:1] == ('runners',) else ''
+        self.lines.insert(line_no, '{0}[{1}]'.format(indent, '.'.join(dump_key(p) for p in name)))
+        self._index()
+        for section in self.sections:
+            if section.start == line_no:
+                return section
+        raise TomlError('Unable to add table {0}'.format('.'.join(name)))
+
+    def redacted(self):
+        """Render the document with secret values masked (for diffs and logs)."""
+        lines = []
+        for line in self.lines:
+            match = _KEY_RE.match(line)
+            if match and _SECRET_RE.search(_unquote_key(match.group(2))):
+                line = '{0}{1} = "********"'.format(match.group(1), match.group(2))
+            lines.append(line)
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+def apply_settings(document, settings, scope=None):
+    """Apply ``{dotted.key: value}`` to the root table or to one ``[[runners]]`` element.
+
+    ``scope`` is ``None`` for global settings or the index of the runners element.
+    Dotted keys address sub-tables (``docker.privileged`` goes to ``[runners.docker]``).
+    Returns a list of ``{'table', 'key', 'before', 'after'}`` changes.
+    """
+    changes = []
+    for dotted, value in settings.items():
+        parts = tuple(dotted.split('.'))
+        key = parts[-1]
+        if scope is None:
+            table = parts[:-1]
+            if table:
+                section = _find_table(document.sections, table)
+                if section is None:
+                    if value is None:
+                        continue
+                    section = document.add_table(table, _first_array_line(document))
+            else:
+                section = document.sections[0]
+            label = '.'.join(table) or '(root)'
+        else:
+            block = document.runner_blocks()[scope]
+            table = ('runners',) + parts[:-1]
+            section = _find_table(block, table)
+            if section is None:
+                if value is None:
+                    continue
+                section = document.add_table(table, _block_insert_line(document, block))
+            label = 'runners[{0}]{1}'.format(scope, ''.join('.' + p for p in parts[:-1]))
+        found, before = document.get(section, key)
+        if document.set(section, key, value):
+            changes.append({'table': label, 'key': key,
+                            'before': before if found else None, 'after': value})
+    return changes
+
+
+def merge_environment(document, variables, scope):
+    """Set or remove (``None``) ``NAME=value`` items of the ``environment`` array of one ``[[runners]]`` element.
+
+    Items of other variables are kept as they are. Returns the changes like :func:`apply_settings`.
+    """
+    section = document.runner_blocks()[scope][0]
+    found, before = document.get(section, 'environment')
+    if found and not isinstance(before, list):
+        raise TomlError('environment of runners[{0}] is not an array'.format(scope))
+    current = list(before) if found else []
+    pending = dict(variables)
+    after = []
+    for item in current:
+        name = str(item).split('=', 1)[0]
+        if name not in variables:
+            after.append(item)
+        elif pending.get(name) is not None:
+            # Replaced in place, so the order of the array is kept.
+            after.append('{0}={1}'.format(name, pending.pop(name)))
+    after.extend('{0}={1}'.format(name, value) for name, value in pending.items() if value is not None)
+    if after == current:
+        return []
+    document.set(section, 'environment', after or None)
+    return [{'table': 'runners[{0}]'.format(scope), 'key': 'environment',
+             'before': before if found else None, 'after': after or None}]
+
+
+def net_changes(changes):
+    """Fold the changes of one run into one change per key, from the first ``before`` to the last ``after``.
+
+    A key set more than once and left at its original value is dropped.
+    """
+    folded = {}
+    for change in changes:
+        slot = (change['table'], change['key'])
+        if slot in folded:
+            folded[slot]['after'] = change['after']
+        else:
+            folded[slot] = dict(change)
+    return [change for change in folded.values() if not same_value(change['before'], change['after'])]
+
+
+def _find_table(sections, name):
+    for section in sections:
+        if section.name == name and (not section.array or name == ('runners',)):
+            return section
+    return None
+
+
+def _first_array_line(document):
+    for section in document.sections:
+        if section.array:
+            return section.start
+    return len(document.lines)
+
+
+def _block_insert_line(document, block):
+    end = block[-1].end
+    # Do not place the new table after the blank lines separating runners.
+    while end > block[-1].start + 1 and not document.lines[end - 1].strip():
+        end -= 1
+    return end
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: artifact_fetch
+short_description: Download an artifact once to a controller cache and distribute it to hosts
+version_added: "1.6.0"
+description:
+  - Downloads O(url) a single time into a content-addressed cache on the controller
+    (C(blobs/sha256/<digest>)), then places it on the managed host.
+  - By default the file is pushed over the existing connection with the M(ansible.builtin.copy) logic,
+    so hosts that already have identical content are not transferred to again.
+  - With O(mirror_url) hosts pull the blob from a LAN HTTP server exporting the cache directory instead,
+    with the checksum verified by M(ansible.builtin.get_url).
+  - Concurrent forks share one download through a file lock. With O(offline=true) nothing is downloaded;
+    artifacts must already be cached or seeded as C(<cache_dir>/files/<filename>).
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  url:
+    description:
+      - Upstream URL of the artifact. Also the cache key when O(checksum) is not given.
+    type: str
+    required: true
+  dest:
+    description:
+      - Absolute path of the file on the managed host.
+    type: path
+    required: true
+  checksum:
+    description:
+      - Expected checksum, C(sha256:<hex>) or a bare SHA-256 hex digest.
+      - When set, a cached blob with this digest is used regardless of the URL.
+    type: str
+  cache_dir:
+    description:
+      - Controller directory holding the artifact cache.
+    type: path
+    default: ~/.ansible/cache/code3tech.devtools/artifacts
+  mirror_url:
+    description:
+      - Base URL of an HTTP server exporting O(cache_dir). When set, hosts download from
+        C(<mirror_url>/blobs/sha256/<digest>) instead of receiving the file from the controller.
+    type: str
+  offline:
+    description:
+      - Never contact O(url); fail when the artifact is neither cached nor seeded.
+    type: bool
+    default: false
+  owner:
+    description:
+      - Owner of O(dest).
+    type: str
+  group:
+    description:
+      - Group of O(dest).
+    type: str
+  mode:
+    description:
+      - Permissions of O(dest).
+    type: raw
+  validate_certs:
+    description:
+      - Validate TLS certificates of O(url) and O(mirror_url).
+    type: bool
+    default: true
+  timeout:
+    description:
+      - Download timeout in seconds.
+    type: int
+    default: 60
+attributes:
+  action:
+    support: full
+  check_mode:
+    support: full
+    details: The controller cache is still populated in check mode.
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Distribute the runner package from the controller cache
+  code3tech.devtools.artifact_fetch:
+    url: https://github.com/actions/runner/releases/download/v2.330.0/actions-runner-linux-x64-2.330.0.tar.gz
+    dest: /opt/github-actions-runners/.downloads/actions-runner-linux-x64-2.330.0.tar.gz
+    mode: '0644'
+
+- name: Pull from a LAN mirror of the cache (air-gapped controller cache)
+  code3tech.devtools.artifact_fetch:
+    url: https://download.agent.dev.azure.com/agent/4.261.0/vsts-agent-linux-x64-4.261.0.tar.gz
+    dest: /opt/azure-devops-agents/.downloads/vsts-agent-linux-x64-4.261.0.tar.gz
+    mirror_url: http://artifacts.lan:8080
+    offline: true
+'''
+
+RETURN = r'''
+sha256:
+  description: SHA-256 digest of the artifact.
+  returned: success
+  type: str
+size:
+  description: Artifact size in bytes.
+  returned: success
+  type: int
+cache_hit:
+  description: Whether the artifact was already in the controller cache.
+  returned: success
+  type: bool
+cache_path:
+  description: Path of the blob on the controller.
+  returned: success
+  type: str
+dest:
+  description: Path of the file on the managed host.
+  returned: success
+  type: str
+'''
@@ -0,0 +1,275 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: asdf_state
+short_description: Converge asdf plugins, installed versions and global versions in one pass
+version_added: "1.6.0"
+description:
+  - Reads the C(ASDF_DATA_DIR) C(plugins) and C(installs) trees and the global C(.tool-versions) file
+    directly and computes the difference with the desired state in a single pass.
+  - asdf is only executed for plugins that are not added yet and versions that are not installed,
+    so a converged host never spawns asdf.
+  - Missing versions are installed concurrently, up to O(workers) at a time.
+  - With O(cache_dir) set, prebuilt install trees stored as C(<plugin>/<plugin>-<version>-<platform>.tar.gz)
+    are imported instead of compiling, freshly built versions can be exported to the cache and the
+    source downloads of python-build, ruby-build and node-build are kept in C(<cache_dir>/downloads).
+  - Global versions are written to the C(.tool-versions) file directly; unrelated lines are preserved.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  plugins:
+    description:
+      - Desired plugins in the C(asdf_plugins) role format.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: Plugin name.
+        type: str
+        required: true
+      url:
+        description: Git URL of the plugin, for plugins outside the asdf short-name index.
+        type: str
+      versions:
+        description: Versions to install.
+        type: list
+        elements: str
+        default: []
+      global:
+        description: Version written to the global C(.tool-versions) file.
+        type: str
+  binary:
+    description:
+      - Path of the asdf binary.
+    type: path
+    default: /opt/asdf/bin/asdf
+  data_dir:
+    description:
+      - The C(ASDF_DATA_DIR) holding plugins and installs.
+    type: path
+    default: /opt/asdf
+  tool_versions:
+    description:
+      - Global C(.tool-versions) file (what C(asdf set -u) writes).
+    type: path
+    default: ~/.tool-versions
+  workers:
+    description:
+      - Maximum number of versions installed at the same time.
+    type: int
+    default: 2
+  cache_dir:
+    description:
+      - Build cache directory for prebuilt install trees. Disabled when not set.
+    type: path
+  cache_platform:
+    description:
+      - Platform tag of the cached builds. Defaults to C(linux-<machine>).
+    type: str
+  cache_import:
+    description:
+      - Import prebuilt trees found in O(cache_dir) instead of compiling.
+    type: bool
+    default: true
+  cache_export:
+    description:
+      - Store every version built by this task in O(cache_dir).
+    type: bool
+    default: false
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: full
+    details: Reports the changes to the C(.tool-versions) file.
+'''
+
+EXAMPLES = r'''
+- name: Converge asdf tools
+  code3tech.devtools.asdf_state:
+    plugins:
+      - name: nodejs
+        versions: ["20.11.0", "18.19.0"]
+        global: "20.11.0"
+      - name: python
+        versions: ["3.12.1"]
+        global: "3.12.1"
+    workers: 2
+'''
+
+RETURN = r'''
+plugins_added:
+  description: Plugins added by this task.
+  returned: always
+  type: list
+  elements: str
+installed:
+  description: Versions installed by this task.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"plugin": "nodejs", "version": "20.11.0", "source": "build"}]
+globals_set:
+  description: Global versions changed by this task, by plugin.
+  returned: always
+  type: dict
+  sample: {"nodejs": "20.11.0"}
+'''
+
+import os
+import platform
+import tempfile
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.asdf import Asdf, BuildCache, install_many
+
+
+def read_tool_versions(path):
+    """Return the lines of a .tool-versions file (empty list when missing)."""
+    try:
+        with open(path) as handle:
+            return handle.read().splitlines()
+    except (IOError, OSError):
+        return []
+
+
+def parse_tool_versions(lines):
+    """Map each tool to its version list, ignoring comments."""
+    tools = {}
+    for line in lines:
+        fields = line.split('#', 1)[0].split()
+        if len(fields) >= 2:
+            tools[fields[0]] = fields[1:]
+    return tools
+
+
+def update_tool_versions(lines, wanted):
+    """Return ``lines`` with ``{tool: version}`` set as the first (global) version of each tool."""
+    result = []
+    seen = set()
+    for line in lines:
+        fields = line.split('#', 1)[0].split()
+        if fields and fields[0] in wanted:
+            seen.add(fields[0])
+            line = '{0} {1}'.format(fields[0], wanted[fields[0]])
+        result.append(line)
+    result.extend('{0} {1}'.format(tool, wanted[tool]) for tool in sorted(wanted) if tool not in seen)
+    return result
+
+
+def write_lines(module, path, lines):
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tool-versions.')
+    with os.fdopen(fd, 'w') as handle:
+        handle.write('\n'.join(lines) + '\n')
+    if os.path.exists(path):
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+    else:
+        os.chmod(tmp_path, 0o644)
+    module.atomic_move(tmp_path, path)
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            plugins=dict(type='list', elements='dict', required=True, options={
+                'name': dict(type='str', required=True),
+                'url': dict(type='str'),
+                'versions': dict(type='list', elements='str', default=[]),
+                'global': dict(type='str'),
+            }),
+            binary=dict(type='path', default='/opt/asdf/bin/asdf'),
+            data_dir=dict(type='path', default='/opt/asdf'),
+            tool_versions=dict(type='path', default='~/.tool-versions'),
+            workers=dict(type='int', default=2),
+            cache_dir=dict(type='path'),
+            cache_platform=dict(type='str'),
+            cache_import=dict(type='bool', default=True),
+            cache_export=dict(type='bool', default=False),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+    asdf = Asdf(module, params['binary'], params['data_dir'])
+
+    # ------------------------------------------------------------------
+    # Single pass over the current state
+    # ------------------------------------------------------------------
+    present_plugins = set(asdf.plugins())
+    missing_plugins = [p for p in params['plugins'] if p['name'] not in present_plugins]
+    missing_versions = []
+    for plugin in params['plugins']:
+        installed = asdf.installed(plugin['name'])
+        for version in plugin['versions']:
+            pair = (plugin['name'], version)
+            if version not in installed and pair not in missing_versions:
+                missing_versions.append(pair)
+
+    lines = read_tool_versions(params['tool_versions'])
+    current = parse_tool_versions(lines)
+    wanted_globals = dict((p['name'], p['global']) for p in params['plugins']
+                          if p['global'] and current.get(p['name'], [None])[0] != p['global'])
+
+    result = dict(
+        changed=bool(missing_plugins or missing_versions or wanted_globals),
+        plugins_added=[p['name'] for p in missing_plugins],
+        installed=[{'plugin': p, 'version': v} for p, v in missing_versions],
+        globals_set=wanted_globals,
+    )
+    new_lines = update_tool_versions(lines, wanted_globals) if wanted_globals else lines
+    if module._diff and wanted_globals:
+        result['diff'] = dict(before='\n'.join(lines) + '\n' if lines else '',
+                              after='\n'.join(new_lines) + '\n',
+                              before_header=params['tool_versions'], after_header=params['tool_versions'])
+
+    if module.check_mode or not result['changed']:
+        module.exit_json(**result)
+
+    # ------------------------------------------------------------------
+    # Apply only what is missing
+    # ------------------------------------------------------------------
+    for plugin in missing_plugins:
+        args = ['plugin', 'add', plugin['name']]
+        if plugin['url']:
+            args.append(plugin['url'])
+        rc, out, err = asdf.run(*args)
+        if rc != 0:
+            module.fail_json(msg='Failed to add asdf plugin {0}: {1}'.format(plugin['name'], (err or out).strip()),
+                             **result)
+
+    if missing_versions:
+        cache = None
+        if params['cache_dir']:
+            cache = BuildCache(params['cache_dir'], params['cache_platform'] or 'linux-' + platform.machine())
+        results = install_many(asdf, missing_versions, workers=params['workers'], cache=cache,
+                               cache_import=params['cache_import'], cache_export=params['cache_export'])
+        result['installed'] = [r for r in results if not r.get('failed')]
+        failed = [r for r in results if r.get('failed')]
+        if failed:
+            module.fail_json(msg='Failed to install {0}'.format(
+                ', '.join('{0} {1}'.format(r['plugin'], r['version']) for r in failed)),
+                failed_versions=failed, **result)
+
+    if wanted_globals:
+        try:
+            write_lines(module, params['tool_versions'], new_lines)
+        except (IOError, OSError) as exc:
+            module.fail_json(msg='Failed to write {0}: {1}'.format(params['tool_versions'], to_native(exc)),
+                             **result)
+
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
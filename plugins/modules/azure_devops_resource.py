@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: azure_devops_resource
+short_description: Ensure an Azure DevOps deployment group or environment and reconcile the tags of its agents
+version_added: "1.6.0"
+description:
+  - Resolves a deployment group or environment by name, creating it when O(create=true), and optionally sets
+    the pipeline permissions of an environment (O(open_access)).
+  - Lists every agent of the resource once (deployment targets or environment virtual machine resources, all
+    pages) and only writes the tags of the agents in O(targets) that drifted. Deployment targets are updated in
+    a single call.
+  - Runs entirely on the controller (action plugin) over one keep-alive connection. Resolved IDs are cached per
+    organization URL, project, resource and PAT, so the other hosts of the play reuse them without any API
+    call. The cache is stored as JSON files guarded by a file lock, so only one host creates a missing resource.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  url:
+    description:
+      - Organization URL, for example C(https://dev.azure.com/myorg).
+    type: str
+    required: true
+  pat:
+    description:
+      - Personal Access Token allowed to manage deployment groups and environments.
+    type: str
+    required: true
+  project:
+    description:
+      - Project holding the resource.
+    type: str
+    required: true
+  kind:
+    description:
+      - Kind of resource.
+    type: str
+    required: true
+    choices: [deployment_group, environment]
+  name:
+    description:
+      - Name of the deployment group or environment.
+    type: str
+    required: true
+  create:
+    description:
+      - Create the resource when it does not exist. The module fails on a missing resource otherwise.
+    type: bool
+    default: false
+  description:
+    description:
+      - Description of a resource created by the module.
+    type: str
+    default: Created by Ansible azure_devops_agents role
+  open_access:
+    description:
+      - Whether every pipeline may use the environment. Left unchanged when not set.
+      - Only valid with O(kind=environment).
+    type: bool
+  targets:
+    description:
+      - Agents whose tags are reconciled. Each item needs the agent C(name) and the complete list of its
+        C(tags); an empty list removes every tag. Tags compare case-insensitively.
+    type: list
+    elements: dict
+  cache_dir:
+    description:
+      - Controller directory holding the ID cache (created with mode C(0700)).
+      - Set to an empty string to keep IDs in the worker memory only.
+    type: path
+    default: ~/.ansible/cache/code3tech.devtools
+  cache_ttl:
+    description:
+      - Seconds a resolved ID is reused. An ID the API no longer knows is resolved again right away.
+    type: int
+    default: 3600
+  validate_certs:
+    description:
+      - Validate the API TLS certificate.
+    type: bool
+    default: true
+  timeout:
+    description:
+      - API request timeout in seconds.
+    type: int
+    default: 30
+attributes:
+  action:
+    support: full
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Ensure the environment exists, open to every pipeline
+  code3tech.devtools.azure_devops_resource:
+    url: https://dev.azure.com/myorg
+    pat: "{{ vault_azure_devops_pat }}"
+    project: MyProject
+    kind: environment
+    name: production
+    create: true
+    open_access: true
+
+- name: Reconcile the tags of the agents of a deployment group
+  code3tech.devtools.azure_devops_resource:
+    url: https://dev.azure.com/myorg
+    pat: "{{ vault_azure_devops_pat }}"
+    project: MyProject
+    kind: deployment_group
+    name: web-servers
+    targets:
+      - name: web-01-agent
+        tags: [web, production]
+      - name: web-02-agent
+        tags: [web, production, canary]
+'''
+
+RETURN = r'''
+id:
+  description: ID of the resource, C(null) in check mode when it would be created.
+  returned: always
+  type: int
+created:
+  description: Whether the resource was created.
+  returned: always
+  type: bool
+cached:
+  description: Whether the ID came from the cache.
+  returned: always
+  type: bool
+targets:
+  description: Tag changes of every agent of O(targets) found in the resource.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"name": "web-01-agent", "id": 7, "added": ["canary"], "removed": []}]
+updated:
+  description: Names of the agents whose tags were written.
+  returned: always
+  type: list
+  elements: str
+missing:
+  description: Names of the agents of O(targets) not registered in the resource.
+  returned: always
+  type: list
+  elements: str
+requests:
+  description: Number of API requests made by this task.
+  returned: always
+  type: int
+'''
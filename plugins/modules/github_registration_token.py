@@ -0,0 +1,119 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: github_registration_token
+short_description: Get a GitHub Actions runner registration token with a controller-side cache
+version_added: "1.6.0"
+description:
+  - Creates a self-hosted runner registration token for an organization, repository or enterprise.
+  - Runs entirely on the controller (action plugin). Tokens are cached per API URL, scope and PAT, so every
+    runner on every host that shares a scope reuses the same token instead of calling the API again.
+  - The cache is stored as JSON files guarded by a file lock, which makes it visible to all forks of the play
+    and to later plays until the token gets within O(min_ttl) seconds of its C(expires_at).
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  api_url:
+    description:
+      - GitHub API URL. Use C(https://HOSTNAME/api/v3) for GitHub Enterprise Server.
+    type: str
+    default: https://api.github.com
+  token:
+    description:
+      - Personal Access Token or GitHub App token allowed to manage self-hosted runners in the scope.
+    type: str
+    required: true
+  scope:
+    description:
+      - Scope the runners are registered in.
+    type: str
+    required: true
+    choices: [organization, repository, enterprise]
+  organization:
+    description:
+      - Organization name. Required when O(scope=organization).
+    type: str
+  repository:
+    description:
+      - Repository in C(owner/repo) format. Required when O(scope=repository).
+    type: str
+  enterprise:
+    description:
+      - Enterprise slug. Required when O(scope=enterprise).
+    type: str
+  min_ttl:
+    description:
+      - Minimum remaining lifetime, in seconds, for a cached token to be reused.
+      - A new token is requested once the cached one is closer than this to its expiry.
+    type: int
+    default: 300
+  cache_dir:
+    description:
+      - Controller directory holding the token cache (created with mode C(0700)).
+      - Set to an empty string to keep tokens in the worker memory only.
+    type: path
+    default: ~/.ansible/cache/code3tech.devtools
+  validate_certs:
+    description:
+      - Validate the API TLS certificate.
+    type: bool
+    default: true
+  timeout:
+    description:
+      - API request timeout in seconds.
+    type: int
+    default: 30
+notes:
+  - Always set C(no_log) on the task, the registered result contains the registration token.
+attributes:
+  action:
+    support: full
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Get registration token for the organization (shared by all hosts)
+  code3tech.devtools.github_registration_token:
+    token: "{{ vault_github_token }}"
+    scope: organization
+    organization: mycompany
+  register: registration
+  no_log: true
+
+- name: Configure runner with the cached token
+  ansible.builtin.command:
+    cmd: ./config.sh --unattended --url https://github.com/mycompany --token {{ registration.token }}
+    chdir: /opt/github-actions-runners/runner-01
+  no_log: true
+'''
+
+RETURN = r'''
+token:
+  description: Runner registration token.
+  returned: success
+  type: str
+expires_at:
+  description: Token expiry timestamp as returned by GitHub.
+  returned: success
+  type: str
+  sample: "2026-01-22T12:13:35.123-08:00"
+cached:
+  description: Whether the token came from the cache instead of a new API call.
+  returned: success
+  type: bool
+registration_url:
+  description: API endpoint the token was (or would be) requested from.
+  returned: success
+  type: str
+'''
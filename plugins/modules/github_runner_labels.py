@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: github_runner_labels
+short_description: Reconcile the custom labels of many GitHub Actions runners at once
+version_added: "1.6.0"
+description:
+  - Lists the runners of every scope once (all pages), compares the custom labels of each runner in
+    O(runners) with the wanted ones and only sends C(PUT .../runners/:id/labels) for the runners that drifted.
+  - Label writes run over at most O(parallelism) keep-alive connections at a time.
+  - Default labels (C(self-hosted), operating system, architecture) are read-only and ignored when listed in
+    O(runners[].labels). Labels compare case-insensitively.
+  - Runs entirely on the controller (action plugin).
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  api_url:
+    description:
+      - GitHub API URL. Use C(https://HOSTNAME/api/v3) for GitHub Enterprise Server.
+    type: str
+    default: https://api.github.com
+  token:
+    description:
+      - Personal Access Token or GitHub App token allowed to manage self-hosted runners in the scope.
+    type: str
+    required: true
+  scope:
+    description:
+      - Scope of the runners that do not set their own C(scope).
+    type: str
+    choices: [organization, repository, enterprise]
+  organization:
+    description:
+      - Organization name, for O(scope=organization).
+    type: str
+  repository:
+    description:
+      - Repository in C(owner/repo) format, for O(scope=repository).
+    type: str
+  enterprise:
+    description:
+      - Enterprise slug, for O(scope=enterprise).
+    type: str
+  runners:
+    description:
+      - Runners to reconcile. Each item needs a C(name) and the complete list of its custom C(labels); an empty
+        list removes every custom label.
+      - Items may set their own C(scope), C(organization), C(repository) and C(enterprise).
+    type: list
+    elements: dict
+    required: true
+  parallelism:
+    description:
+      - Maximum number of label writes sent at the same time.
+    type: int
+    default: 4
+  validate_certs:
+    description:
+      - Validate the API TLS certificate.
+    type: bool
+    default: true
+  timeout:
+    description:
+      - API request timeout in seconds.
+    type: int
+    default: 30
+attributes:
+  action:
+    support: full
+  check_mode:
+    support: full
+    details: Reports the labels that would be added and removed without writing them.
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Reconcile runner labels
+  code3tech.devtools.github_runner_labels:
+    token: "{{ vault_github_token }}"
+    scope: organization
+    organization: acme
+    runners:
+      - name: runner-01
+        labels: [docker, linux]
+      - name: runner-02
+        labels: [docker, linux, gpu]
+  no_log: true
+'''
+
+RETURN = r'''
+runners:
+  description: Outcome for every runner, in the order of O(runners).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: Runner name.
+      type: str
+    id:
+      description: Runner ID.
+      type: int
+      returned: when the runner exists
+    status:
+      description: C(updated), C(unchanged), C(missing) (not registered in its scope) or C(failed).
+      type: str
+    added:
+      description: Custom labels added.
+      type: list
+      elements: str
+    removed:
+      description: Custom labels removed.
+      type: list
+      elements: str
+    labels:
+      description: Labels of the runner after the update.
+      type: list
+      elements: str
+      returned: when the runner exists
+    error:
+      description: Why the label write failed.
+      type: str
+      returned: when RV(runners[].status=failed)
+  sample: [{"name": "runner-01", "id": 42, "status": "updated", "added": ["gpu"], "removed": [],
+            "labels": ["Linux", "X64", "docker", "gpu", "self-hosted"]}]
+missing:
+  description: Names of the runners not registered in their scope.
+  returned: always
+  type: list
+  elements: str
+requests:
+  description: Number of API requests made by this task.
+  returned: always
+  type: int
+'''
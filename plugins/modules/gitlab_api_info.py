@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: gitlab_api_info
+short_description: Resolve GitLab group/project IDs and list runners once per play
+version_added: "1.6.0"
+description:
+  - Resolves the numeric IDs of GitLab groups and projects from their full paths and lists the runners
+    visible to the token through C(/runners/all) (all pages, 100 per page).
+  - Runs entirely on the controller (action plugin) over a single keep-alive connection.
+  - Answers are cached for the current play in a locked JSON file, so all hosts and runners of the play share
+    one API call per path and one runner listing instead of serializing C(ansible.builtin.uri) calls through
+    facts delegated to localhost.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  gitlab_url:
+    description:
+      - GitLab instance URL (without C(/api/v4)).
+    type: str
+    required: true
+  api_token:
+    description:
+      - Personal, group or project access token with the C(api) or C(read_api) scope.
+    type: str
+    required: true
+  group_paths:
+    description:
+      - Full paths of the groups to resolve.
+    type: list
+    elements: str
+    default: []
+  project_paths:
+    description:
+      - Paths (C(namespace/project)) of the projects to resolve.
+    type: list
+    elements: str
+    default: []
+  runners:
+    description:
+      - List the runners as well.
+      - C(/runners/all) requires an administrator token; other tokens list the runners they can access.
+    type: bool
+    default: false
+  runner_filters:
+    description:
+      - Query parameters of the runner listing, for example C(type), C(status), C(paused) or C(tag_list).
+    type: dict
+    default: {}
+  cache_dir:
+    description:
+      - Controller directory holding the per-play cache. Set to an empty string to disable it.
+    type: path
+    default: ~/.ansible/cache/code3tech.devtools
+  validate_certs:
+    description:
+      - Validate the API TLS certificate.
+    type: bool
+    default: true
+  timeout:
+    description:
+      - API request timeout in seconds.
+    type: int
+    default: 30
+attributes:
+  action:
+    support: full
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Resolve scope IDs and list runners
+  code3tech.devtools.gitlab_api_info:
+    gitlab_url: https://gitlab.com
+    api_token: "{{ vault_gitlab_api_token }}"
+    group_paths:
+      - mycompany/platform
+    project_paths:
+      - mycompany/platform/api
+    runners: true
+  register: gitlab
+  no_log: true
+'''
+
+RETURN = r'''
+groups:
+  description: Group ID by path, C(null) when the group does not exist (not cached, looked up again on the next call).
+  returned: always
+  type: dict
+  sample: {"mycompany/platform": 42}
+projects:
+  description: Project ID by path, C(null) when the project does not exist (not cached, looked up again on the next call).
+  returned: always
+  type: dict
+  sample: {"mycompany/platform/api": 1337}
+runners:
+  description: Runners as returned by the listing endpoint.
+  returned: when O(runners=true)
+  type: list
+  elements: dict
+  sample: [{"id": 6, "description": "runner-01 - host1", "runner_type": "group_type", "status": "online"}]
+requests:
+  description: Number of API requests made by this task (0 when everything came from the cache).
+  returned: always
+  type: int
+'''
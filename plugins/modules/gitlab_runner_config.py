@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: gitlab_runner_config
+short_description: Apply global and per-runner settings to a GitLab Runner config.toml in one write
+version_added: "1.6.0"
+description:
+  - Parses a GitLab Runner C(config.toml) and applies global settings, settings shared by every
+    C([[runners]]) entry and settings for runners selected by name.
+  - Only the lines whose effective value changes are rewritten; comments, ordering and unmanaged keys are kept.
+    A value that only differs in formatting (C(4) and C(0x4), C("a") and C('a')) is not a change.
+  - All changes are written with a single atomic replace, so gitlab-runner never reads a half-updated file.
+  - Dotted keys address sub-tables, for example C(docker.privileged) in O(runner_settings) is written
+    to C([runners.docker]) and C(session_server.session_timeout) in O(settings) to C([session_server]).
+  - A C(null) value removes the key.
+  - A key whose final value equals its original value is not reported as a change.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  path:
+    description:
+      - Path of the C(config.toml) file. It must exist.
+    type: path
+    required: true
+  settings:
+    description:
+      - Global settings (root table), such as C(concurrent) or C(listen_address).
+    type: dict
+    default: {}
+  runner_settings:
+    description:
+      - Settings applied to every C([[runners]]) entry, such as C(request_concurrency) or C(tls-ca-file).
+    type: dict
+    default: {}
+  runner_environment:
+    description:
+      - Variables set in the C(environment) array of every C([[runners]]) entry, as C(NAME=value) items.
+      - A C(null) value removes the items of that variable. Items of other variables are kept, so
+        variables set by hand or with C(--env) at registration survive.
+    type: dict
+    default: {}
+  runners:
+    description:
+      - Settings for specific runners, keyed by the C(name) of their C([[runners]]) entry.
+      - Merged over O(runner_settings) for that entry, so they override it and each key is set once.
+    type: dict
+    default: {}
+extends_documentation_fragment:
+  - ansible.builtin.files
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: full
+    details: Secret values (tokens, passwords, keys) are masked in the diff.
+'''
+
+EXAMPLES = r'''
+- name: Tune runner configuration
+  code3tech.devtools.gitlab_runner_config:
+    path: /opt/gitlab-runners/runner-01/config.toml
+    settings:
+      concurrent: 4
+    runner_settings:
+      request_concurrency: 2
+      tls-ca-file: /etc/ssl/certs/company-ca.crt
+      docker.pull_policy: ["if-not-present"]
+    runner_environment:
+      HTTP_PROXY: http://proxy:3128
+      NO_PROXY: null
+    runners:
+      runner-01:
+        limit: 2
+    owner: gitlab-runner
+    group: gitlab-runner
+    mode: '0600'
+  register: runner_config
+'''
+
+RETURN = r'''
+changes:
+  description: Settings whose effective value changed.
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"table": "runners[0]", "key": "request_concurrency", "before": 1, "after": 2}]
+'''
+
+import os
+import tempfile
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.toml_config import (
+    TomlDocument,
+    TomlError,
+    apply_settings,
+    merge_environment,
+    net_changes,
+)
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            path=dict(type='path', required=True),
+            settings=dict(type='dict', default={}),
+            runner_settings=dict(type='dict', default={}),
+            runner_environment=dict(type='dict', default={}),
+            runners=dict(type='dict', default={}),
+        ),
+        add_file_common_args=True,
+        supports_check_mode=True,
+    )
+    path = module.params['path']
+    if not os.path.isfile(path):
+        module.fail_json(msg='{0} does not exist'.format(path))
+
+    with open(path) as handle:
+        original = handle.read()
+    try:
+        document = TomlDocument(original)
+        before = document.redacted()
+        changes = apply_settings(document, module.params['settings'])
+        names = []
+        for index in range(len(document.runner_blocks())):
+            # Sections move as lines are edited, so look the entry up again each time.
+            name = document.get(document.runner_blocks()[index][0], 'name')[1]
+            names.append(name)
+            # The entry's own settings win over runner_settings, so every key is set once.
+            settings = dict(module.params['runner_settings'])
+            settings.update(module.params['runners'].get(name) or {})
+            changes.extend(apply_settings(document, settings, scope=index))
+            if module.params['runner_environment']:
+                changes.extend(merge_environment(document, module.params['runner_environment'], index))
+    except TomlError as exc:
+        module.fail_json(msg='Unable to parse {0}: {1}'.format(path, to_native(exc)))
+    changes = net_changes(changes)
+
+    for name in sorted(set(module.params['runners']) - set(names)):
+        module.warn('No [[runners]] entry named {0!r} in {1}'.format(name, path))
+
+    result = dict(changed=bool(changes), changes=changes)
+    if module._diff and changes:
+        result['diff'] = dict(before=before, after=document.redacted(), before_header=path, after_header=path)
+
+    if changes and not module.check_mode:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.config.toml.')
+        with os.fdopen(fd, 'w') as handle:
+            handle.write(document.render())
+        os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        module.atomic_move(tmp_path, path)
+
+    file_args = module.load_file_common_arguments(module.params)
+    result['changed'] = module.set_fs_attributes_if_different(file_args, result['changed'])
+    module.exit_json(**result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: gitlab_runner_update
+short_description: Update the settings of several GitLab runners over one API connection
+version_added: "1.6.0"
+description:
+  - Reads each runner through C(GET /runners/:id) and only sends C(PUT /runners/:id) with the attributes
+    that differ, so converged runners are not modified.
+  - Runs entirely on the controller (action plugin) and reuses a single keep-alive connection for all runners.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  gitlab_url:
+    description:
+      - GitLab instance URL (without C(/api/v4)).
+    type: str
+    required: true
+  api_token:
+    description:
+      - Access token with the C(api) scope allowed to manage the runners.
+    type: str
+    required: true
+  runners:
+    description:
+      - Runners to update. Each item needs an C(id) and may contain a C(name) (used in the result) and any of
+        C(description), C(paused), C(locked), C(run_untagged), C(tag_list), C(access_level),
+        C(maximum_timeout) and C(maintenance_note).
+      - Items without a positive C(id) are ignored.
+    type: list
+    elements: dict
+    required: true
+  validate_certs:
+    description:
+      - Validate the API TLS certificate.
+    type: bool
+    default: true
+  timeout:
+    description:
+      - API request timeout in seconds.
+    type: int
+    default: 30
+attributes:
+  action:
+    support: full
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Reconcile runner tags
+  code3tech.devtools.gitlab_runner_update:
+    gitlab_url: https://gitlab.com
+    api_token: "{{ vault_gitlab_api_token }}"
+    runners:
+      - id: 101
+        name: runner-01
+        tag_list: [docker, linux]
+      - id: 102
+        name: runner-02
+        tag_list: [docker, linux, gpu]
+  no_log: true
+'''
+
+RETURN = r'''
+runners:
+  description: Attributes changed on each runner (empty when it was already up to date).
+  returned: always
+  type: list
+  elements: dict
+  sample: [{"id": 101, "name": "runner-01", "changes": {"tag_list": ["docker", "linux"]}}]
+requests:
+  description: Number of API requests made by this task.
+  returned: always
+  type: int
+'''
@@ -0,0 +1,192 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: port_allocation
+short_description: Assign stable TCP ports to named services from a port range
+version_added: "1.6.0"
+description:
+  - Gives every name in O(names) a TCP port from O(range_start)-O(range_end) and records the assignment
+    in a JSON state file on the host, so a runner keeps its port across runs and across changes
+    to the other runners.
+  - Assignments are grouped (for example one group per role). Names that are no longer listed in their
+    group release their port; ports held by other groups are never reused.
+  - New assignments skip ports that are already listening on the host.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  path:
+    description:
+      - State file shared by every group on the host.
+    type: path
+    default: /var/lib/code3tech-devtools/ports.json
+  group:
+    description:
+      - Owner of the assignments, for example the role name.
+    type: str
+    required: true
+  names:
+    description:
+      - Names that need a port. The list is authoritative for the group.
+    type: list
+    elements: str
+    required: true
+  range_start:
+    description:
+      - First port of the range.
+    type: int
+    required: true
+  range_end:
+    description:
+      - Last port of the range (inclusive).
+    type: int
+    required: true
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Allocate one metrics port per runner
+  code3tech.devtools.port_allocation:
+    group: gitlab_ci_runners
+    names: "{{ gitlab_ci_runners_runners_list | map(attribute='name') | list }}"
+    range_start: 9252
+    range_end: 9299
+  register: metrics_ports
+'''
+
+RETURN = r'''
+ports:
+  description: Port assigned to each name.
+  returned: always
+  type: dict
+  sample: {"runner-01": 9252, "runner-02": 9253}
+allocated:
+  description: Names that received a new port in this run.
+  returned: always
+  type: list
+  elements: str
+released:
+  description: Names of the group whose port was released.
+  returned: always
+  type: list
+  elements: str
+'''
+
+import fcntl
+import json
+import os
+import tempfile
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+
+
+def listening_ports():
+    """Return the TCP ports in LISTEN state on the host (from /proc/net/tcp*)."""
+    ports = set()
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table) as handle:
+                next(handle)
+                for line in handle:
+                    fields = line.split()
+                    # State 0A is TCP_LISTEN.
+                    if len(fields) > 3 and fields[3] == '0A':
+                        ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+        except (IOError, OSError, StopIteration):
+            continue
+    return ports
+
+
+def allocate(state, group, names, range_start, range_end, busy=frozenset()):
+    """Update ``state`` in place. Returns ``(ports, allocated, released)``."""
+    current = state.setdefault(group, {})
+    released = sorted(name for name in current if name not in names)
+    for name in released:
+        del current[name]
+    taken = set(busy)
+    for other, assignments in state.items():
+        taken.update(port for name, port in assignments.items() if other != group or name in names)
+    allocated = []
+    for name in names:
+        port = current.get(name)
+        if port is not None and range_start <= port <= range_end:
+            continue
+        free = [p for p in range(range_start, range_end + 1) if p not in taken]
+        if not free:
+            raise ValueError('No free port left in {0}-{1} for {2}'.format(range_start, range_end, name))
+        current[name] = free[0]
+        taken.add(free[0])
+        allocated.append(name)
+    return dict((name, current[name]) for name in names), allocated, released
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            path=dict(type='path', default='/var/lib/code3tech-devtools/ports.json'),
+            group=dict(type='str', required=True),
+            names=dict(type='list', elements='str', required=True),
+            range_start=dict(type='int', required=True),
+            range_end=dict(type='int', required=True),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+    if not 0 < params['range_start'] <= params['range_end'] < 65536:
+        module.fail_json(msg='Invalid port range {0}-{1}'.format(params['range_start'], params['range_end']))
+    names = list(dict.fromkeys(params['names']))
+    path = params['path']
+    directory = os.path.dirname(path)
+
+    if not os.path.isdir(directory):
+        if module.check_mode:
+            ports, allocated, released = allocate({}, params['group'], names, params['range_start'],
+                                                  params['range_end'], listening_ports())
+            module.exit_json(changed=bool(allocated), ports=ports, allocated=allocated, released=released)
+        os.makedirs(directory, 0o755)
+
+    lock_fd = os.open(path + '.lock', os.O_CREAT | os.O_RDWR, 0o644) if not module.check_mode else None
+    try:
+        if lock_fd is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            with open(path) as handle:
+                state = json.load(handle)
+        except (IOError, OSError):
+            state = {}
+        except ValueError as exc:
+            module.fail_json(msg='Invalid port state file {0}: {1}'.format(path, to_native(exc)))
+        before = json.dumps(state, sort_keys=True)
+        try:
+            ports, allocated, released = allocate(state, params['group'], names, params['range_start'],
+                                                  params['range_end'], listening_ports())
+        except ValueError as exc:
+            module.fail_json(msg=to_native(exc))
+        changed = json.dumps(state, sort_keys=True) != before
+        if changed and not module.check_mode:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.ports.')
+            with os.fdopen(fd, 'w') as handle:
+                json.dump(state, handle, indent=2, sort_keys=True)
+            os.chmod(tmp_path, 0o644)
+            module.atomic_move(tmp_path, path)
+    finally:
+        if lock_fd is not None:
+            os.close(lock_fd)
+
+    module.exit_json(changed=changed, ports=ports, allocated=allocated, released=released)
+
+
+if __name__ == '__main__':
+    main()
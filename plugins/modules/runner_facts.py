@@ -0,0 +1,245 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: runner_facts
+short_description: Collect the state of every runner/agent installed under a base path
+version_added: "1.6.0"
+description:
+  - Scans a runner base directory (GitHub Actions runners or Azure DevOps agents) in a single pass.
+  - For every runner directory returns whether it is configured, the service name recorded by C(svc.sh)
+    in the C(.service) marker, the parsed runner metadata file and the systemd unit status.
+  - All unit states are read with a single C(systemctl show) call, so the whole scan costs one
+    module execution per host regardless of the number of runners.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  path:
+    description:
+      - Base directory holding one sub-directory per runner.
+    type: path
+    required: true
+  metadata_file:
+    description:
+      - Name of the JSON file written by C(config.sh) once the runner is configured.
+      - Use C(.runner) for GitHub Actions runners and C(.agent) for Azure DevOps agents.
+    type: str
+    default: .runner
+  excludes:
+    description:
+      - Directory names to ignore.
+    type: list
+    elements: str
+    default: ['.downloads']
+  systemd:
+    description:
+      - Query systemd for the status of every service found in the C(.service) markers.
+    type: bool
+    default: true
+  service_template:
+    description:
+      - Service unit of a runner, with C({name}) standing for the runner directory name,
+        for example C(github-actions-runner@{name}).
+      - When set, every configured runner gets this service name instead of the one in its C(.service) marker;
+        the marker of a unit installed by C(svc.sh) is then returned as RV(runners[].svc_service).
+    type: str
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Collect GitHub runner facts
+  code3tech.devtools.runner_facts:
+    path: /opt/github-actions-runners
+  register: _runner_facts
+
+- name: Collect Azure DevOps agent facts
+  code3tech.devtools.runner_facts:
+    path: /opt/azure-devops-agents
+    metadata_file: .agent
+  register: _agent_facts
+
+- name: Show services that are not running
+  ansible.builtin.debug:
+    msg: "{{ _runner_facts.runners | selectattr('active', 'equalto', false) | map(attribute='service') | list }}"
+'''
+
+RETURN = r'''
+runners:
+  description: One entry per runner directory, sorted by name.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: Runner directory name.
+      type: str
+    path:
+      description: Absolute runner directory.
+      type: str
+    configured:
+      description: Whether the metadata file exists.
+      type: bool
+    metadata:
+      description: Parsed metadata file (empty when missing or unreadable).
+      type: dict
+    service:
+      description:
+        - Service unit name from the C(.service) marker, without the C(.service) suffix.
+        - With O(service_template), the templated unit of the runner.
+      type: str
+      returned: when the marker exists, or the runner is configured and O(service_template) is set
+    svc_service:
+      description: Unit name from the C(.service) marker written by C(svc.sh), without the C(.service) suffix.
+      type: str
+      returned: when the marker exists and O(service_template) is set
+    unit:
+      description: Selected C(systemctl show) properties of the service unit.
+      type: dict
+      returned: when the marker exists and O(systemd=true)
+      sample: {"ActiveState": "active", "SubState": "running", "UnitFileState": "enabled", "LoadState": "loaded"}
+    active:
+      description: Whether the service unit is active.
+      type: bool
+      returned: when the marker exists and O(systemd=true)
+services:
+  description: Service names of every runner with a C(.service) marker.
+  returned: always
+  type: list
+  elements: str
+  sample: ["actions.runner.myorg.runner-01"]
+'''
+
+import json
+import os
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native, to_text
+
+UNIT_PROPERTIES = ('Id', 'LoadState', 'ActiveState', 'SubState', 'UnitFileState')
+
+
+def read_text(path):
+    """Return the stripped content of ``path`` or ``None`` when it does not exist."""
+    try:
+        with open(path, 'rb') as handle:
+            # config.sh writes its JSON files with a UTF-8 BOM.
+            return to_text(handle.read()).lstrip(u'\ufeff').strip()
+    except (IOError, OSError):
+        return None
+
+
+def read_metadata(path):
+    content = read_text(path)
+    if not content:
+        return {}
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def scan_runners(base_path, metadata_file, excludes, service_template=None):
+    runners = []
+    if not os.path.isdir(base_path):
+        return runners
+    for name in sorted(os.listdir(base_path)):
+        runner_dir = os.path.join(base_path, name)
+        if name in excludes or not os.path.isdir(runner_dir):
+            continue
+        metadata_path = os.path.join(runner_dir, metadata_file)
+        runner = {
+            'name': name,
+            'path': runner_dir,
+            'configured': os.path.isfile(metadata_path),
+            'metadata': read_metadata(metadata_path),
+        }
+        service = read_text(os.path.join(runner_dir, '.service'))
+        if service:
+            service = service[:-len('.service')] if service.endswith('.service') else service
+        if service_template:
+            if service:
+                runner['svc_service'] = service
+            service = service_template.format(name=name) if runner['configured'] else None
+        if service:
+            runner['service'] = service
+        runners.append(runner)
+    return runners
+
+
+def parse_systemctl_show(output):
+    """Split ``systemctl show`` output for several units into one dict per unit."""
+    units = []
+    current = {}
+    for line in output.splitlines():
+        if not line.strip():
+            if current:
+                units.append(current)
+                current = {}
+            continue
+        key, sep, value = line.partition('=')
+        if sep:
+            current[key] = value
+    if current:
+        units.append(current)
+    return units
+
+
+def query_units(module, services):
+    systemctl = module.get_bin_path('systemctl')
+    if not systemctl or not services:
+        return {}
+    cmd = [systemctl, 'show', '--property=' + ','.join(UNIT_PROPERTIES), '--']
+    cmd.extend(service + '.service' for service in services)
+    rc, out, err = module.run_command(cmd)
+    if rc != 0:
+        module.warn('systemctl show failed: {0}'.format(to_native(err or out).strip()))
+        return {}
+    units = parse_systemctl_show(out)
+    # systemctl prints the blocks in argument order; fall back to Id when counts differ.
+    if len(units) == len(services):
+        return dict(zip(services, units))
+    return dict((unit.get('Id', '')[:-len('.service')], unit) for unit in units)
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            path=dict(type='path', required=True),
+            metadata_file=dict(type='str', default='.runner'),
+            excludes=dict(type='list', elements='str', default=['.downloads']),
+            systemd=dict(type='bool', default=True),
+            service_template=dict(type='str'),
+        ),
+        supports_check_mode=True,
+    )
+
+    runners = scan_runners(module.params['path'], module.params['metadata_file'], module.params['excludes'],
+                           module.params['service_template'])
+    services = [runner['service'] for runner in runners if 'service' in runner]
+
+    if module.params['systemd']:
+        units = query_units(module, services)
+        for runner in runners:
+            if 'service' not in runner:
+                continue
+            unit = units.get(runner['service'], {})
+            runner['unit'] = dict((key, unit.get(key, '')) for key in UNIT_PROPERTIES if key != 'Id')
+            runner['active'] = unit.get('ActiveState') == 'active'
+
+    module.exit_json(changed=False, runners=runners, services=services)
+
+
+if __name__ == '__main__':
+    main()
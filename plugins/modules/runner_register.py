@@ -0,0 +1,291 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: runner_register
+short_description: Register a batch of runners/agents on a host in parallel
+version_added: "1.6.0"
+description:
+  - Runs the registration command of every runner in O(jobs) (C(config.sh) for GitHub Actions runners and
+    Azure DevOps agents, C(gitlab-runner register) for GitLab runners) with a bounded pool of workers, so a
+    host with many runners does not register them one at a time.
+  - A job whose O(jobs[].creates) marker already exists (and matches O(jobs[].creates_regex) when set) is
+    skipped, so re-running after a partial failure only registers the runners that are still missing.
+  - A failing command is retried up to O(retries) times with an exponential back-off. Jobs still failing
+    after that make the module fail once every other job has finished, with the result of every job.
+  - Commands run as the user the module runs as; use C(become_user) to register as the runner user.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  jobs:
+    description:
+      - Registration commands, one per runner.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+          - Runner name, used in the results.
+        type: str
+        required: true
+      argv:
+        description:
+          - Command to run.
+        type: list
+        elements: str
+        required: true
+      chdir:
+        description:
+          - Working directory of the command.
+        type: path
+      environment:
+        description:
+          - Extra environment variables for the command.
+        type: dict
+        default: {}
+      creates:
+        description:
+          - Path that exists once the runner is registered. The job is skipped when it exists.
+        type: path
+      creates_regex:
+        description:
+          - Regular expression the content of O(jobs[].creates) must match for the runner to count as registered.
+        type: str
+  parallelism:
+    description:
+      - Maximum number of registration commands running at the same time.
+    type: int
+    default: 4
+  retries:
+    description:
+      - Number of times a failing command is retried.
+    type: int
+    default: 2
+  retry_delay:
+    description:
+      - Seconds to wait before the first retry. The delay doubles with every further attempt.
+    type: int
+    default: 5
+  timeout:
+    description:
+      - Seconds after which a single attempt is killed and counted as failed.
+    type: int
+    default: 300
+  secrets:
+    description:
+      - Values (tokens, passwords) passed in O(jobs) that must never appear in the output.
+    type: list
+    elements: str
+    default: []
+attributes:
+  check_mode:
+    support: full
+    details: Reports which runners would be registered without running any command.
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Register runners in parallel
+  code3tech.devtools.runner_register:
+    jobs:
+      - name: runner-01
+        argv: [./config.sh, --unattended, --url, https://github.com/acme, --token, "{{ token }}", --name, runner-01]
+        chdir: /opt/github-actions-runners/runner-01
+        creates: /opt/github-actions-runners/runner-01/.runner
+      - name: runner-02
+        argv: [./config.sh, --unattended, --url, https://github.com/acme, --token, "{{ token }}", --name, runner-02]
+        chdir: /opt/github-actions-runners/runner-02
+        creates: /opt/github-actions-runners/runner-02/.runner
+    parallelism: 8
+    secrets:
+      - "{{ token }}"
+  become: true
+  become_user: ghrunner
+'''
+
+RETURN = r'''
+results:
+  description: Outcome of every job, in the order of O(jobs).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: Runner name.
+      type: str
+    status:
+      description: C(registered), C(skipped) (already registered) or C(failed).
+      type: str
+    attempts:
+      description: Number of times the command ran.
+      type: int
+    rc:
+      description: Exit code of the last attempt.
+      type: int
+      returned: when the command ran
+    stdout:
+      description: Last lines of the output of the last attempt.
+      type: str
+      returned: when the command ran
+    stderr:
+      description: Last lines of the error output of the last attempt.
+      type: str
+      returned: when the command ran
+    elapsed:
+      description: Seconds spent on the job, retries included.
+      type: float
+registered:
+  description: Names of the runners registered by this run.
+  returned: always
+  type: list
+  elements: str
+failed_runners:
+  description: Names of the runners whose registration failed.
+  returned: always
+  type: list
+  elements: str
+'''
+
+import os
+import re
+import subprocess
+import threading
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native, to_text
+
+OUTPUT_LINES = 20
+
+
+def is_registered(job):
+    marker = job.get('creates')
+    if not marker or not os.path.exists(marker):
+        return False
+    if not job.get('creates_regex'):
+        return True
+    try:
+        with open(marker, 'rb') as handle:
+            return re.search(job['creates_regex'], to_text(handle.read(), errors='surrogate_or_strict'),
+                             re.MULTILINE) is not None
+    except (IOError, OSError):
+        return False
+
+
+def tail(data):
+    return '\n'.join(to_text(data, errors='surrogate_or_replace').rstrip().splitlines()[-OUTPUT_LINES:])
+
+
+def run_job(job, retries, retry_delay, timeout, sleep=time.sleep):
+    started = time.time()
+    env = dict(os.environ)
+    env.update(dict((k, to_native(v)) for k, v in (job.get('environment') or {}).items()))
+    result = {'name': job['name'], 'status': 'failed', 'attempts': 0}
+    for attempt in range(retries + 1):
+        if attempt:
+            sleep(retry_delay * 2 ** (attempt - 1))
+        result['attempts'] = attempt + 1
+        try:
+            process = subprocess.Popen(job['argv'], cwd=job.get('chdir'), env=env,
+                                       stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                stdout, stderr = process.communicate()
+                stderr += b'\nTimed out after ' + to_native(timeout).encode() + b' seconds'
+            result.update(rc=process.returncode, stdout=tail(stdout), stderr=tail(stderr))
+        except OSError as exc:
+            result.update(rc=-1, stdout='', stderr=to_text(exc))
+        if result['rc'] == 0 and (not job.get('creates') or is_registered(job)):
+            result['status'] = 'registered'
+            break
+        if result['rc'] == 0:
+            result['stderr'] = (result['stderr'] + '\n' if result['stderr'] else '') + \
+                'Command succeeded but {0} does not show the runner as registered'.format(job['creates'])
+    result['elapsed'] = round(time.time() - started, 1)
+    return result
+
+
+def run_jobs(jobs, parallelism, retries, retry_delay, timeout):
+    """Run ``jobs`` with at most ``parallelism`` at a time; returns the results in job order."""
+    results = [None] * len(jobs)
+    pending = list(enumerate(jobs))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                index, job = pending.pop(0)
+            results[index] = run_job(job, retries, retry_delay, timeout)
+
+    threads = [threading.Thread(target=worker) for dummy in range(max(1, min(parallelism, len(jobs))))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            jobs=dict(type='list', elements='dict', required=True, options=dict(
+                name=dict(type='str', required=True),
+                argv=dict(type='list', elements='str', required=True),
+                chdir=dict(type='path'),
+                environment=dict(type='dict', default={}),
+                creates=dict(type='path'),
+                creates_regex=dict(type='str'),
+            )),
+            parallelism=dict(type='int', default=4),
+            retries=dict(type='int', default=2),
+            retry_delay=dict(type='int', default=5),
+            timeout=dict(type='int', default=300),
+            secrets=dict(type='list', elements='str', default=[], no_log=True),
+        ),
+        supports_check_mode=True,
+    )
+    jobs = module.params['jobs']
+    names = [job['name'] for job in jobs]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        module.fail_json(msg='Duplicate runner names in jobs: {0}'.format(', '.join(duplicates)))
+
+    results = [None] * len(jobs)
+    todo = []
+    for index, job in enumerate(jobs):
+        if is_registered(job):
+            results[index] = {'name': job['name'], 'status': 'skipped', 'attempts': 0, 'elapsed': 0.0}
+        elif module.check_mode:
+            results[index] = {'name': job['name'], 'status': 'registered', 'attempts': 0, 'elapsed': 0.0}
+        else:
+            todo.append(index)
+
+    ran = run_jobs([jobs[i] for i in todo], module.params['parallelism'], module.params['retries'],
+                   module.params['retry_delay'], module.params['timeout'])
+    for index, result in zip(todo, ran):
+        results[index] = result
+
+    registered = [r['name'] for r in results if r['status'] == 'registered']
+    failed = [r['name'] for r in results if r['status'] == 'failed']
+    output = dict(changed=bool(registered), results=results, registered=registered, failed_runners=failed)
+    if failed:
+        module.fail_json(msg='Registration failed for {0} of {1} runners: {2}'.format(
+            len(failed), len(jobs), ', '.join(failed)), **output)
+    module.exit_json(**output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: runner_unpack
+short_description: Extract a runner/agent tarball once and fan it out to many runner directories
+version_added: "1.6.0"
+description:
+  - Decompresses a GitHub Actions runner or Azure DevOps agent tarball a single time into a staging
+    directory next to the archive, then populates every destination directory in parallel.
+  - Files are cloned with reflinks (copy-on-write) when the filesystem supports them, so N runners cost
+    roughly the disk space and time of one. Without reflink support files are copied, or hardlinked
+    when O(link_mode=hardlink).
+  - Destinations that already contain O(creates) are left untouched.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  src:
+    description:
+      - Path of the C(.tar.gz) archive on the managed host.
+    type: path
+    required: true
+  dest:
+    description:
+      - Runner directories to populate.
+    type: list
+    elements: path
+    required: true
+  staging_dir:
+    description:
+      - Directory the archive is extracted to once.
+      - Defaults to the archive path without its C(.tar.gz) extension.
+    type: path
+  creates:
+    description:
+      - Path, relative to each destination, whose presence marks the destination as already populated.
+    type: str
+    default: config.sh
+  link_mode:
+    description:
+      - How files are placed into the destinations.
+      - V(auto) uses reflinks and falls back to a regular copy when the filesystem does not support them.
+      - V(hardlink) hardlinks files below O(link_paths) (the large, read-only binaries) and copies the rest,
+        so configuration files written by C(config.sh) are never shared between runners. A file that
+        cannot be hardlinked (another filesystem, no hardlink support, too many links) is copied.
+      - V(copy) always copies.
+    type: str
+    choices: [auto, reflink, hardlink, copy]
+    default: auto
+  link_paths:
+    description:
+      - Top-level directories whose files may be hardlinked when O(link_mode=hardlink).
+    type: list
+    elements: str
+    default: [bin, externals]
+  owner:
+    description:
+      - Owner of the populated files.
+    type: str
+  group:
+    description:
+      - Group of the populated files.
+    type: str
+  workers:
+    description:
+      - Number of destinations populated concurrently.
+    type: int
+    default: 8
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+requirements:
+  - tar
+'''
+
+EXAMPLES = r'''
+- name: Populate every runner directory from one extraction
+  code3tech.devtools.runner_unpack:
+    src: /opt/github-actions-runners/.downloads/actions-runner-linux-x64-2.330.0.tar.gz
+    dest:
+      - /opt/github-actions-runners/runner-01
+      - /opt/github-actions-runners/runner-02
+    owner: ghrunner
+    group: ghrunner
+'''
+
+RETURN = r'''
+staging_dir:
+  description: Directory holding the single extracted copy of the archive.
+  returned: always
+  type: str
+extracted:
+  description: Whether the archive was extracted during this run.
+  returned: always
+  type: bool
+populated:
+  description: Destinations that were populated during this run.
+  returned: always
+  type: list
+  elements: str
+method:
+  description: Placement method used for the populated destinations.
+  returned: always
+  type: str
+  sample: reflink
+'''
+
+import errno
+import fcntl
+import grp
+import os
+import pwd
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+
+# FICLONE from linux/fs.h: clone a whole file with copy-on-write extents.
+FICLONE = 0x40049409
+_NO_REFLINK = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS)
+# Another file system, no hardlinks on this one, or too many links to the file.
+_NO_HARDLINK = (errno.EXDEV, errno.EPERM, errno.EMLINK)
+_MARKER = '.extracted'
+
+
+class ReflinkUnsupported(Exception):
+    pass
+
+
+def reflink(src, dst):
+    with open(src, 'rb') as source:
+        with open(dst, 'wb') as target:
+            try:
+                fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+            except (IOError, OSError) as exc:
+                if exc.errno in _NO_REFLINK:
+                    raise ReflinkUnsupported()
+                raise
+    shutil.copystat(src, dst)
+
+
+def default_staging_dir(src):
+    name = os.path.basename(src)
+    for ext in ('.tar.gz', '.tgz', '.tar'):
+        if name.endswith(ext):
+            name = name[:-len(ext)]
+            break
+    return os.path.join(os.path.dirname(src), name)
+
+
+def extract_once(module, src, staging_dir):
+    """Extract ``src`` into ``staging_dir`` unless a complete extraction already exists."""
+    marker = os.path.join(staging_dir, _MARKER)
+    if os.path.exists(marker):
+        return False
+    if module.check_mode:
+        return True
+    tar = module.get_bin_path('tar', required=True)
+    parent = os.path.dirname(staging_dir)
+    work_dir = tempfile.mkdtemp(dir=parent, prefix='.' + os.path.basename(staging_dir) + '.')
+    cmd = [tar, '-x', '--no-same-owner', '-f', src, '-C', work_dir]
+    pigz = module.get_bin_path('pigz')
+    if pigz and src.endswith(('.gz', '.tgz')):
+        cmd[1:1] = ['--use-compress-program', pigz]
+    elif src.endswith(('.gz', '.tgz')):
+        cmd.insert(2, '-z')
+    rc, out, err = module.run_command(cmd)
+    if rc != 0:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        module.fail_json(msg='Failed to extract {0}: {1}'.format(src, (err or out).strip()), cmd=cmd)
+    open(os.path.join(work_dir, _MARKER), 'w').close()
+    if os.path.isdir(staging_dir):
+        shutil.rmtree(staging_dir)
+    os.rename(work_dir, staging_dir)
+    return True
+
+
+class FanOut(object):
+    """Replicates a staging tree into destination directories."""
+
+    def __init__(self, staging_dir, link_mode, link_paths, uid, gid):
+        self.staging_dir = staging_dir
+        self.link_mode = link_mode
+        self.link_paths = tuple(link_paths)
+        self.uid = uid
+        self.gid = gid
+        # Flipped to False (and never back) by the first unsupported clone.
+        self.reflink_ok = link_mode in ('auto', 'reflink')
+
+    def method(self):
+        if self.reflink_ok:
+            return 'reflink'
+        return 'hardlink' if self.link_mode == 'hardlink' else 'copy'
+
+    def _chown(self, path):
+        if self.uid != -1 or self.gid != -1:
+            os.lchown(path, self.uid, self.gid)
+
+    def _place_file(self, rel, src, dst):
+        if self.reflink_ok:
+            try:
+                reflink(src, dst)
+                return
+            except ReflinkUnsupported:
+                if self.link_mode == 'reflink':
+                    raise
+                self.reflink_ok = False
+        if self.link_mode == 'hardlink' and rel.split(os.sep, 1)[0] in self.link_paths:
+            try:
+                os.link(src, dst)
+                return
+            except OSError as exc:
+                if exc.errno not in _NO_HARDLINK:
+                    raise
+        shutil.copy2(src, dst)
+
+    def populate(self, dest, creates):
+        deferred = None
+        for root, dirs, files in os.walk(self.staging_dir):
+            rel_root = os.path.relpath(root, self.staging_dir)
+            target_root = dest if rel_root == os.curdir else os.path.join(dest, rel_root)
+            if not os.path.isdir(target_root):
+                os.makedirs(target_root)
+                shutil.copystat(root, target_root)
+            self._chown(target_root)
+            for name in dirs + files:
+                src = os.path.join(root, name)
+                dst = os.path.join(target_root, name)
+                rel = os.path.normpath(os.path.join(rel_root, name))
+                if rel == _MARKER:
+                    continue
+                if rel == creates:
+                    # Placed last so an interrupted run is retried next time.
+                    deferred = (rel, src, dst)
+                    continue
+                if os.path.islink(src):
+                    if os.path.lexists(dst):
+                        os.unlink(dst)
+                    os.symlink(os.readlink(src), dst)
+                    self._chown(dst)
+                elif name in files:
+                    if os.path.lexists(dst):
+                        os.unlink(dst)
+                    self._place_file(rel, src, dst)
+                    self._chown(dst)
+        if deferred:
+            self._place_file(*deferred)
+            self._chown(deferred[2])
+        return dest
+
+
+def resolve_ids(module):
+    uid = gid = -1
+    try:
+        if module.params['owner']:
+            owner = module.params['owner']
+            uid = int(owner) if owner.isdigit() else pwd.getpwnam(owner).pw_uid
+        if module.params['group']:
+            group = module.params['group']
+            gid = int(group) if group.isdigit() else grp.getgrnam(group).gr_gid
+    except KeyError as exc:
+        module.fail_json(msg='Unknown owner or group: {0}'.format(to_native(exc)))
+    return uid, gid
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            src=dict(type='path', required=True),
+            dest=dict(type='list', elements='path', required=True),
+            staging_dir=dict(type='path'),
+            creates=dict(type='str', default='config.sh'),
+            link_mode=dict(type='str', default='auto', choices=['auto', 'reflink', 'hardlink', 'copy']),
+            link_paths=dict(type='list', elements='str', default=['bin', 'externals']),
+            owner=dict(type='str'),
+            group=dict(type='str'),
+            workers=dict(type='int', default=8),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+
+    if not os.path.isfile(params['src']):
+        module.fail_json(msg='Archive {0} does not exist'.format(params['src']))
+
+    staging_dir = params['staging_dir'] or default_staging_dir(params['src'])
+    pending = [d for d in params['dest'] if not os.path.exists(os.path.join(d, params['creates']))]
+    # Nothing to populate: don't even look at the archive.
+    if not pending:
+        module.exit_json(changed=False, staging_dir=staging_dir, extracted=False, populated=[], method='none')
+
+    extracted = extract_once(module, params['src'], staging_dir)
+    if module.check_mode:
+        module.exit_json(changed=True, staging_dir=staging_dir, extracted=extracted, populated=pending,
+                         method=params['link_mode'])
+
+    uid, gid = resolve_ids(module)
+    fanout = FanOut(staging_dir, params['link_mode'], params['link_paths'], uid, gid)
+    creates = os.path.normpath(params['creates'])
+    populated = []
+    try:
+        # Probe reflink support on the first destination before going wide.
+        populated.append(fanout.populate(pending[0], creates))
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max(1, params['workers'])) as pool:
+                populated.extend(pool.map(lambda dest: fanout.populate(dest, creates), pending[1:]))
+    except ReflinkUnsupported:
+        module.fail_json(msg='The filesystem of {0} does not support reflinks; use link_mode=auto'.format(
+            pending[0]), populated=populated)
+    except (IOError, OSError) as exc:
+        module.fail_json(msg='Failed to populate runner directories: {0}'.format(to_native(exc)),
+                         populated=populated)
+
+    module.exit_json(changed=True, staging_dir=staging_dir, extracted=extracted, populated=populated,
+                     method=fanout.method())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: runner_workspace_cleanup
+short_description: Clean the work folders of every runner/agent under a base path in one pass
+version_added: "1.6.0"
+description:
+  - Walks the C(_work) folder of every runner directory under O(path) once, measuring the size and the
+    last use (newest modification time in the tree) of every top-level entry of C(_work), C(_work/_temp)
+    and C(_work/_tool).
+  - Entries not used for longer than their maximum age are removed.
+  - When O(max_usage_percent) is set and the file system holding O(path) is fuller than that, the least
+    recently used entries are removed, oldest first, until the usage drops to O(target_usage_percent).
+  - Runners that are running a job (their worker process is alive) are skipped, as is every entry that
+    is the working directory of a running process.
+  - Only summary counters are returned, whatever the number of files removed.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  path:
+    description:
+      - Base directory holding one sub-directory per runner.
+    type: path
+    required: true
+  excludes:
+    description:
+      - Directory names under O(path) to ignore.
+    type: list
+    elements: str
+    default: ['.downloads']
+  work_folder:
+    description:
+      - Name of the work folder inside every runner directory.
+    type: str
+    default: _work
+  worker:
+    description:
+      - Executable name of the job process, used to detect runners that are running a job.
+      - Use C(Runner.Worker) for GitHub Actions runners and C(Agent.Worker) for Azure DevOps agents.
+    type: str
+    default: Runner.Worker
+  work_max_age_days:
+    description:
+      - Remove job directories of C(_work) not used for this many days. C(0) disables age-based removal.
+    type: int
+    default: 0
+  temp_max_age_days:
+    description:
+      - Remove entries of C(_work/_temp) not used for this many days. C(0) disables age-based removal.
+    type: int
+    default: 1
+  tool_max_age_days:
+    description:
+      - Remove tool cache entries of C(_work/_tool) not used for this many days. C(0) disables age-based removal.
+    type: int
+    default: 0
+  tool_lru:
+    description:
+      - Let the disk-usage cleanup remove tool cache entries too. They are otherwise only removed by age.
+    type: bool
+    default: false
+  max_usage_percent:
+    description:
+      - Disk usage (percent) above which least recently used entries are removed. C(0) disables it.
+    type: int
+    default: 0
+  target_usage_percent:
+    description:
+      - Disk usage (percent) the disk-usage cleanup stops at. Defaults to O(max_usage_percent) minus 10.
+    type: int
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+'''
+
+EXAMPLES = r'''
+- name: Remove job directories older than a week and keep the disk below 85%
+  code3tech.devtools.runner_workspace_cleanup:
+    path: /opt/github-actions-runners
+    work_max_age_days: 7
+    max_usage_percent: 85
+  register: _cleanup
+
+- name: Clean Azure DevOps agent work folders
+  code3tech.devtools.runner_workspace_cleanup:
+    path: /opt/azure-devops-agents
+    worker: Agent.Worker
+    work_max_age_days: 7
+'''
+
+RETURN = r'''
+runners:
+  description: Number of runner directories scanned.
+  returned: always
+  type: int
+busy:
+  description: Runners skipped because they are running a job.
+  returned: always
+  type: list
+  elements: str
+scanned:
+  description: Number of entries measured.
+  returned: always
+  type: int
+scanned_bytes:
+  description: Disk space used by the measured entries.
+  returned: always
+  type: int
+removed:
+  description: Number of entries removed (or that would be removed in check mode), by kind.
+  returned: always
+  type: dict
+  sample: {"work": 3, "temp": 12, "tool": 0}
+freed_bytes:
+  description: Disk space released by the removed entries.
+  returned: always
+  type: int
+usage_before:
+  description: Disk usage of the file system holding O(path) before the cleanup, in percent.
+  returned: always
+  type: float
+usage_after:
+  description: Disk usage after the cleanup, in percent (estimated in check mode).
+  returned: always
+  type: float
+'''
+
+import os
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.runner_workspace import (
+    disk_usage,
+    is_held,
+    plan,
+    process_state,
+    remove,
+    tree_usage,
+)
+
+
+def collect(base_path, excludes, work_folder):
+    """Return ``(runner directories, candidates)``; a candidate is a dict with runner, kind and path."""
+    runners = []
+    candidates = []
+    if not os.path.isdir(base_path):
+        return runners, candidates
+    for name in sorted(os.listdir(base_path)):
+        work = os.path.join(base_path, name, work_folder)
+        if name in excludes or not os.path.isdir(work):
+            continue
+        runners.append(os.path.join(base_path, name))
+        for entry in sorted(os.listdir(work)):
+            entry_path = os.path.join(work, entry)
+            if entry in ('_temp', '_tool'):
+                if os.path.isdir(entry_path) and not os.path.islink(entry_path):
+                    for child in sorted(os.listdir(entry_path)):
+                        candidates.append({'runner': name, 'kind': entry[1:],
+                                           'path': os.path.join(entry_path, child)})
+            elif os.path.isdir(entry_path) and not os.path.islink(entry_path):
+                candidates.append({'runner': name, 'kind': 'work', 'path': entry_path})
+    return runners, candidates
+
+
+def percent(used, total):
+    return round(100.0 * used / total, 1) if total else 0.0
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            path=dict(type='path', required=True),
+            excludes=dict(type='list', elements='str', default=['.downloads']),
+            work_folder=dict(type='str', default='_work'),
+            worker=dict(type='str', default='Runner.Worker'),
+            work_max_age_days=dict(type='int', default=0),
+            temp_max_age_days=dict(type='int', default=1),
+            tool_max_age_days=dict(type='int', default=0),
+            tool_lru=dict(type='bool', default=False),
+            max_usage_percent=dict(type='int', default=0),
+            target_usage_percent=dict(type='int'),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+    base_path = params['path']
+    target = params['target_usage_percent']
+    if target is None:
+        target = max(params['max_usage_percent'] - 10, 0)
+    if params['max_usage_percent'] and not 0 <= target <= params['max_usage_percent'] <= 100:
+        module.fail_json(msg='target_usage_percent must be between 0 and max_usage_percent (<= 100)')
+
+    runners, candidates = collect(base_path, params['excludes'], params['work_folder'])
+    busy, cwds = process_state([params['worker']])
+    busy_names = sorted(os.path.basename(r) for r in runners if os.path.realpath(r) in busy)
+
+    scanned_bytes = 0
+    eligible = []
+    for candidate in candidates:
+        candidate['size'], candidate['last_used'] = tree_usage(candidate['path'])
+        scanned_bytes += candidate['size']
+        if candidate['runner'] not in busy_names and not is_held(os.path.realpath(candidate['path']), cwds):
+            eligible.append(candidate)
+
+    used, total = disk_usage(base_path) if os.path.isdir(base_path) else (0, 0)
+    usage_before = percent(used, total)
+    to_free = 0
+    if params['max_usage_percent'] and usage_before > params['max_usage_percent']:
+        to_free = used - total * target // 100
+
+    max_ages = {'work': params['work_max_age_days'], 'temp': params['temp_max_age_days'],
+                'tool': params['tool_max_age_days']}
+    lru_kinds = ('work', 'temp', 'tool') if params['tool_lru'] else ('work', 'temp')
+    selected = plan(eligible, max_ages, time.time(), to_free, lru_kinds)
+
+    removed = {'work': 0, 'temp': 0, 'tool': 0}
+    freed = 0
+    errors = []
+    for candidate in selected:
+        if not module.check_mode:
+            try:
+                remove(candidate['path'])
+            except (IOError, OSError) as exc:
+                errors.append('{0}: {1}'.format(candidate['path'], to_native(exc)))
+                continue
+        removed[candidate['kind']] += 1
+        freed += candidate['size']
+    for error in errors[:5]:
+        module.warn('Unable to remove {0}'.format(error))
+
+    if module.check_mode or not os.path.isdir(base_path):
+        used_after = max(used - freed, 0)
+    else:
+        used_after, total = disk_usage(base_path)
+
+    module.exit_json(
+        changed=bool(sum(removed.values())),
+        runners=len(runners),
+        busy=busy_names,
+        scanned=len(candidates),
+        scanned_bytes=scanned_bytes,
+        removed=removed,
+        freed_bytes=freed,
+        usage_before=usage_before,
+        usage_after=percent(used_after, total),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,367 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: tool_cache
+short_description: Seed a host-level tool cache shared by every runner or agent of a host
+version_added: "1.6.0"
+description:
+  - Installs tool archives into a tool cache directory laid out like the hosted runner images
+    (C(<path>/<name>/<version>/<arch>) plus a C(<arch>.complete) marker), the layout C(setup-*) actions
+    and Azure Pipelines tool installers look up through C(RUNNER_TOOL_CACHE) and C(AGENT_TOOLSDIRECTORY).
+  - Entries whose marker exists are left untouched, so a warm cache costs a few C(stat) calls.
+  - Missing entries are downloaded and installed concurrently. Each one is extracted into a staging
+    directory next to its final place, renamed into place and only then marked complete, under a lock per
+    entry, so jobs and concurrent runs never see a partial entry. An entry directory without its marker
+    (an interrupted install) is replaced.
+  - Directories created for new tools and versions get the mode and group of O(path), so runners can still
+    add versions that are not seeded but cannot remove the seeded ones when O(path) has the sticky bit.
+author:
+  - Code3Tech DevOps Team (@kode3tech)
+options:
+  path:
+    description:
+      - Tool cache directory. It must exist.
+    type: path
+    required: true
+  tools:
+    description:
+      - Tool versions to install.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description:
+          - Tool name as looked up by the setup actions, for example C(node), C(Python) or C(go).
+        type: str
+        required: true
+      version:
+        description:
+          - Full version, for example C(20.11.1).
+        type: str
+        required: true
+      url:
+        description:
+          - URL of a C(.tar.gz), C(.tgz), C(.tar.xz) or C(.tar) archive of the tool.
+        type: str
+        required: true
+      checksum:
+        description:
+          - Expected checksum of the archive, C(sha256:<hex>) or a bare SHA-256 hex digest.
+        type: str
+      arch:
+        description:
+          - Architecture directory of the entry. Defaults to O(arch).
+        type: str
+      strip_components:
+        description:
+          - Leading path components removed from the archive members, C(1) for archives with a top-level
+            directory such as C(node-v20.11.1-linux-x64/).
+        type: int
+        default: 0
+  arch:
+    description:
+      - Default architecture directory of the entries.
+    type: str
+    default: x64
+  owner:
+    description:
+      - Owner of the installed entries. They keep the permissions of the archive.
+    type: str
+  group:
+    description:
+      - Group of the installed entries.
+    type: str
+  workers:
+    description:
+      - Number of entries downloaded and installed concurrently.
+    type: int
+    default: 4
+  validate_certs:
+    description:
+      - Validate TLS certificates of the tool URLs.
+    type: bool
+    default: true
+  timeout:
+    description:
+      - Download timeout in seconds.
+    type: int
+    default: 60
+attributes:
+  check_mode:
+    support: full
+  diff_mode:
+    support: none
+requirements:
+  - tar
+'''
+
+EXAMPLES = r'''
+- name: Seed the shared tool cache
+  code3tech.devtools.tool_cache:
+    path: /opt/hostedtoolcache
+    tools:
+      - name: node
+        version: 20.11.1
+        url: https://nodejs.org/dist/v20.11.1/node-v20.11.1-linux-x64.tar.gz
+        checksum: "sha256:{{ node_20_11_1_sha256 }}"
+        strip_components: 1
+      - name: go
+        version: 1.22.0
+        url: https://go.dev/dl/go1.22.0.linux-amd64.tar.gz
+        strip_components: 1
+'''
+
+RETURN = r'''
+installed:
+  description: Entries installed during this run, as C(<name>/<version>/<arch>).
+  returned: always
+  type: list
+  elements: str
+present:
+  description: Entries that were already complete.
+  returned: always
+  type: list
+  elements: str
+'''
+
+import fcntl
+import grp
+import hashlib
+import os
+import pwd
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.urls import open_url
+
+CHUNK_SIZE = 1024 * 1024
+_LOCK_DIR = '.locks'
+
+
+class ToolCacheError(Exception):
+    pass
+
+
+def entry_id(tool):
+    return '{0}/{1}/{2}'.format(tool['name'], tool['version'], tool['arch'])
+
+
+def is_complete(root, tool):
+    return os.path.isfile(os.path.join(root, tool['name'], tool['version'], tool['arch'] + '.complete'))
+
+
+def _expected_digest(checksum):
+    if not checksum:
+        return None
+    algorithm, sep, value = checksum.partition(':')
+    if not sep:
+        algorithm, value = 'sha256', checksum
+    if algorithm.lower() != 'sha256':
+        raise ToolCacheError('Only sha256 checksums are supported, got {0!r}'.format(checksum))
+    return value.strip().lower()
+
+
+def _makedirs_like(root, path):
+    """Create ``path`` below ``root``, giving new directories the mode and ownership of ``root``."""
+    if os.path.isdir(path):
+        return
+    _makedirs_like(root, os.path.dirname(path))
+    try:
+        os.mkdir(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+        return
+    stat = os.stat(root)
+    os.chown(path, stat.st_uid, stat.st_gid)
+    os.chmod(path, stat.st_mode & 0o7777)
+
+
+def _chown_tree(path, uid, gid):
+    if uid == -1 and gid == -1:
+        return
+    os.lchown(path, uid, gid)
+    for parent, dirs, files in os.walk(path):
+        for name in dirs + files:
+            os.lchown(os.path.join(parent, name), uid, gid)
+
+
+class ToolCache(object):
+
+    def __init__(self, root, run_command, tar, uid=-1, gid=-1, validate_certs=True, timeout=60):
+        self.root = root
+        self.run_command = run_command
+        self.tar = tar
+        self.uid = uid
+        self.gid = gid
+        self.validate_certs = validate_certs
+        self.timeout = timeout
+
+    def _download(self, tool, target):
+        expected = _expected_digest(tool.get('checksum'))
+        digest = hashlib.sha256()
+        response = open_url(tool['url'], validate_certs=self.validate_certs, timeout=self.timeout,
+                            http_agent='code3tech.devtools')
+        try:
+            with open(target, 'wb') as handle:
+                while True:
+                    chunk = response.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    handle.write(chunk)
+        finally:
+            response.close()
+        if expected and digest.hexdigest() != expected:
+            raise ToolCacheError('Checksum mismatch for {0}: expected sha256:{1}, got sha256:{2}'.format(
+                tool['url'], expected, digest.hexdigest()))
+
+    def _extract(self, tool, archive, target):
+        cmd = [self.tar, '-x', '--no-same-owner', '-f', archive, '-C', target]
+        if tool['url'].endswith(('.gz', '.tgz')):
+            cmd.insert(2, '-z')
+        elif tool['url'].endswith('.xz'):
+            cmd.insert(2, '-J')
+        if tool.get('strip_components'):
+            cmd.append('--strip-components={0}'.format(tool['strip_components']))
+        rc, out, err = self.run_command(cmd)
+        if rc != 0:
+            raise ToolCacheError('Failed to extract {0}: {1}'.format(tool['url'], (err or out).strip()))
+
+    def install(self, tool):
+        """Install ``tool`` unless it is complete. Return ``True`` when it was installed by this call."""
+        version_dir = os.path.join(self.root, tool['name'], tool['version'])
+        final = os.path.join(version_dir, tool['arch'])
+        marker = final + '.complete'
+        lock_dir = os.path.join(self.root, _LOCK_DIR)
+        _makedirs_like(self.root, lock_dir)
+        lock_path = os.path.join(lock_dir, '{name}-{version}-{arch}.lock'.format(**tool))
+        lock_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            # Another run may have installed it while we were waiting.
+            if os.path.isfile(marker):
+                return False
+            _makedirs_like(self.root, version_dir)
+            staging = tempfile.mkdtemp(dir=version_dir, prefix='.{0}.'.format(tool['arch']))
+            try:
+                archive = staging + '.download'
+                try:
+                    self._download(tool, archive)
+                    self._extract(tool, archive, staging)
+                finally:
+                    if os.path.exists(archive):
+                        os.unlink(archive)
+                os.chmod(staging, 0o755)
+                _chown_tree(staging, self.uid, self.gid)
+                if os.path.lexists(final):
+                    # Left behind by an interrupted install: it never got its marker.
+                    stale = tempfile.mkdtemp(dir=version_dir, prefix='.{0}.stale.'.format(tool['arch']))
+                    os.rename(final, os.path.join(stale, tool['arch']))
+                    shutil.rmtree(stale, ignore_errors=True)
+                os.rename(staging, final)
+            finally:
+                if os.path.isdir(staging):
+                    shutil.rmtree(staging, ignore_errors=True)
+            # The marker goes last: lookups only trust entries that have it.
+            with open(marker, 'w'):
+                pass
+            if self.uid != -1 or self.gid != -1:
+                os.chown(marker, self.uid, self.gid)
+            return True
+        finally:
+            os.close(lock_fd)
+
+
+def normalize(tools, default_arch):
+    entries = []
+    for tool in tools:
+        entry = dict(tool, arch=tool.get('arch') or default_arch,
+                     strip_components=int(tool.get('strip_components') or 0))
+        for key in ('name', 'version', 'arch'):
+            if '/' in entry[key] or entry[key] in ('.', '..'):
+                raise ToolCacheError('Invalid tool {0} {1!r}'.format(key, entry[key]))
+        entries.append(entry)
+    return entries
+
+
+def resolve_ids(module):
+    uid = gid = -1
+    try:
+        if module.params['owner']:
+            owner = module.params['owner']
+            uid = int(owner) if owner.isdigit() else pwd.getpwnam(owner).pw_uid
+        if module.params['group']:
+            group = module.params['group']
+            gid = int(group) if group.isdigit() else grp.getgrnam(group).gr_gid
+    except KeyError as exc:
+        module.fail_json(msg='Unknown owner or group: {0}'.format(to_native(exc)))
+    return uid, gid
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            path=dict(type='path', required=True),
+            tools=dict(type='list', elements='dict', required=True, options=dict(
+                name=dict(type='str', required=True),
+                version=dict(type='str', required=True),
+                url=dict(type='str', required=True),
+                checksum=dict(type='str'),
+                arch=dict(type='str'),
+                strip_components=dict(type='int', default=0),
+            )),
+            arch=dict(type='str', default='x64'),
+            owner=dict(type='str'),
+            group=dict(type='str'),
+            workers=dict(type='int', default=4),
+            validate_certs=dict(type='bool', default=True),
+            timeout=dict(type='int', default=60),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+    root = params['path']
+    if not os.path.isdir(root):
+        module.fail_json(msg='Tool cache directory {0} does not exist'.format(root))
+    try:
+        tools = normalize(params['tools'], params['arch'])
+    except ToolCacheError as exc:
+        module.fail_json(msg=to_native(exc))
+
+    present = [entry_id(tool) for tool in tools if is_complete(root, tool)]
+    pending = [tool for tool in tools if entry_id(tool) not in present]
+    if not pending or module.check_mode:
+        module.exit_json(changed=bool(pending), installed=[entry_id(tool) for tool in pending], present=present)
+
+    uid, gid = resolve_ids(module)
+    cache = ToolCache(root, module.run_command, module.get_bin_path('tar', required=True), uid, gid,
+                      validate_certs=params['validate_certs'], timeout=params['timeout'])
+    installed, failed = [], []
+    with ThreadPoolExecutor(max_workers=max(1, params['workers'])) as pool:
+        futures = [(tool, pool.submit(cache.install, tool)) for tool in pending]
+        for tool, future in futures:
+            try:
+                (installed if future.result() else present).append(entry_id(tool))
+            except Exception as exc:
+                failed.append('{0}: {1}'.format(entry_id(tool), to_native(exc)))
+    if failed:
+        module.fail_json(msg='Failed to install tools: {0}'.format('; '.join(failed)),
+                         installed=installed, present=present)
+    module.exit_json(changed=bool(installed), installed=installed, present=present)
+
+
+if __name__ == '__main__':
+    main()
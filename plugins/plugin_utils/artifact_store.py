@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Content-addressed artifact store living on the Ansible controller.
+
+Layout below the store directory::
+
+    blobs/sha256/<digest>    artifact content, named by its SHA-256
+    index/<key>.json         URL -> digest mapping (see FileCache)
+    files/<filename>         optional seed directory for offline use
+
+The ``blobs`` tree can be exported as-is by any static HTTP server to act as
+a LAN mirror for the managed hosts.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import os
+import tempfile
+
+from ansible.module_utils.six.moves.urllib.parse import urlsplit
+from ansible.module_utils.urls import open_url
+
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache, cache_key
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ArtifactError(Exception):
+    pass
+
+
+def parse_checksum(checksum):
+    """Return the hex digest of a ``sha256:<hex>`` (or bare hex) checksum, or ``None``."""
+    if not checksum:
+        return None
+    algorithm, sep, value = checksum.partition(':')
+    if not sep:
+        algorithm, value = 'sha256', checksum
+    if algorithm.lower() != 'sha256':
+        raise ArtifactError('Only sha256 checksums are supported, got {0!r}'.format(checksum))
+    return value.strip().lower()
+
+
+def _copy_hashing(source, target):
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        target.write(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+class ArtifactStore(object):
+
+    def __init__(self, directory):
+        self.root = os.path.expanduser(directory)
+        self.index = FileCache(self.root, 'index')
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, 'blobs', 'sha256', digest)
+
+    def seed_path(self, url):
+        return os.path.join(self.root, 'files', os.path.basename(urlsplit(url).path))
+
+    def _has(self, digest):
+        return bool(digest) and os.path.isfile(self.blob_path(digest))
+
+    def _store(self, source, expected=None):
+        """Write the ``source`` stream into the store and return its digest."""
+        blob_dir = os.path.dirname(self.blob_path('x'))
+        if not os.path.isdir(blob_dir):
+            os.makedirs(blob_dir, 0o755)
+        fd, tmp_path = tempfile.mkstemp(dir=blob_dir, prefix='.incoming.')
+        try:
+            with os.fdopen(fd, 'wb') as target:
+                digest, dummy = _copy_hashing(source, target)
+            if expected and digest != expected:
+                raise ArtifactError('Checksum mismatch: expected sha256:{0}, got sha256:{1}'.format(
+                    expected, digest))
+            os.chmod(tmp_path, 0o644)
+            os.rename(tmp_path, self.blob_path(digest))
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return digest
+
+    def lookup(self, url, checksum=None):
+        """Return the digest of ``url`` if it is available offline, else ``None``."""
+        expected = parse_checksum(checksum)
+        if self._has(expected):
+            return expected
+        entry = self.index.get(cache_key(url)) or {}
+        if self._has(entry.get('sha256')) and expected in (None, entry['sha256']):
+            return entry['sha256']
+        seed = self.seed_path(url)
+        if os.path.isfile(seed):
+            with open(seed, 'rb') as source:
+                digest = self._store(source, expected)
+            self.index.set(cache_key(url), {'url': url, 'sha256': digest})
+            return digest
+        return None
+
+    def ensure(self, url, checksum=None, offline=False, validate_certs=True, timeout=60):
+        """Make ``url`` available in the store.
+
+        Returns ``(digest, hit)``; ``hit`` is false when the artifact had to be downloaded.
+        """
+        digest = self.lookup(url, checksum)
+        if digest:
+            return digest, True
+        if offline:
+            raise ArtifactError('{0} is not in the artifact cache and offline mode is enabled. Seed it by '
+                                'copying the file to {1}'.format(url, self.seed_path(url)))
+        key = cache_key(url)
+        with self.index.lock(key):
+            # Another fork may have downloaded it while we were waiting.
+            digest = self.lookup(url, checksum)
+            if digest:
+                return digest, True
+            response = open_url(url, validate_certs=validate_certs, timeout=timeout,
+                                http_agent='code3tech.devtools')
+            try:
+                digest = self._store(response, parse_checksum(checksum))
+            finally:
+                response.close()
+            self.index.set(key, {'url': url, 'sha256': digest})
+        return digest, False
+
+    def size(self, digest):
+        return os.path.getsize(self.blob_path(digest))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+"""Controller-side JSON cache shared by the collection's action and lookup plugins.
+
+Ansible runs each host in its own forked worker, so an in-memory cache is
+not visible to the other hosts of the play. Entries are therefore stored as
+small JSON files and every read-modify-write cycle is serialized with an
+``flock`` so that only one worker refreshes a given key at a time.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+
+
+def cache_key(*parts):
+    """Build a stable, filesystem-safe cache key from arbitrary strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class FileCache(object):
+    """Tiny locked JSON key/value store living in ``directory/namespace``."""
+
+    def __init__(self, directory, namespace):
+        self.path = os.path.join(os.path.expanduser(directory), namespace)
+
+    def _ensure_dir(self):
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path, 0o700)
+
+    def _entry(self, key):
+        return os.path.join(self.path, key + '.json')
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """Hold an exclusive lock for ``key`` while the block runs."""
+        self._ensure_dir()
+        fd = os.open(os.path.join(self.path, key + '.lock'), os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def get(self, key):
+        """Return the stored value for ``key`` or ``None``."""
+        try:
+            with open(self._entry(key)) as handle:
+                return json.load(handle)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def set(self, key, value):
+        """Atomically store ``value`` (must be JSON serializable) for ``key``."""
+        self._ensure_dir()
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix='.' + key, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as handle:
+                json.dump(value, handle)
+            os.chmod(tmp_path, 0o600)
+            os.rename(tmp_path, self._entry(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def delete(self, key):
+        try:
+            os.unlink(self._entry(key))
+        except OSError:
+            pass
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+#
+# Managed by Ansible (code3tech.devtools).
+#
+# Pulls a declared list of container images so jobs start from a warm image
+# store. Run by the docker and podman roles during the play and then by a
+# systemd timer to keep tags fresh.
+#
+#   - References pinned by digest (image@sha256:...) that are already present
+#     are skipped without contacting the registry.
+#   - Tags are pulled: the engine compares the remote manifest digest with the
+#     local one and only downloads what changed.
+#   - At most "parallelism" pulls run at once, across all image stores.
+#   - For podman, "root" pulls into the system storage and every user of
+#     "users" into their rootless storage (runuser, XDG_RUNTIME_DIR set).
+#
+# The JSON config is written by the roles:
+#
+#   {"engine": "podman", "images": ["docker.io/library/alpine:3.20"],
+#    "parallelism": 4, "root": true, "users": ["ghrunner"]}
+#
+# Exits non-zero when a pull failed, so the unit shows the failure.
+
+import argparse
+import fcntl
+import json
+import pwd
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PULL_TIMEOUT = 1800
+LOCK_FILE = '/run/code3tech-image-prepull-{0}.lock'
+
+
+def log(message):
+    print(message, flush=True)
+
+
+def storages(config):
+    """Return ``(label, command prefix)`` for every image store to fill."""
+    binary = shutil.which(config.get('engine', 'docker'))
+    if not binary:
+        raise SystemExit('{0} is not installed'.format(config.get('engine', 'docker')))
+    result = []
+    if config.get('root', True):
+        result.append(('root', [binary]))
+    for user in config.get('users', []):
+        try:
+            uid = pwd.getpwnam(user).pw_uid
+        except KeyError:
+            log('{0}: unknown user, skipped'.format(user))
+            continue
+        # Rootless storage and credentials live with the user
+        result.append((user, ['runuser', '-u', user, '--', 'env',
+                              'XDG_RUNTIME_DIR=/run/user/{0}'.format(uid), binary]))
+    return result
+
+
+def image_id(prefix, image):
+    process = subprocess.run(prefix + ['image', 'inspect', '--format', '{{.Id}}', image],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+def prepull(label, prefix, image):
+    """Pull ``image`` into one store and return its status."""
+    before = image_id(prefix, image)
+    if before and '@' in image:
+        return 'present'
+    started = time.time()
+    process = subprocess.run(prefix + ['pull', '--quiet', image], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE, universal_newlines=True, timeout=PULL_TIMEOUT)
+    if process.returncode != 0:
+        error = (process.stderr.strip().splitlines() or ['exit code {0}'.format(process.returncode)])[-1]
+        log('{0}: {1} failed: {2}'.format(label, image, error))
+        return 'failed'
+    after = image_id(prefix, image)
+    status = 'pulled' if before is None else ('updated' if after != before else 'current')
+    if status != 'current':
+        log('{0}: {1} {2} in {3:.0f}s'.format(label, image, status, time.time() - started))
+    return status
+
+
+def run(config):
+    jobs = [(label, prefix, image) for label, prefix in storages(config) for image in config.get('images', [])]
+    summary = {'present': [], 'current': [], 'pulled': [], 'updated': [], 'failed': []}
+    if not jobs:
+        return summary
+    with ThreadPoolExecutor(max_workers=max(1, int(config.get('parallelism', 4)))) as pool:
+        futures = [(label, image, pool.submit(prepull, label, prefix, image)) for label, prefix, image in jobs]
+        for label, image, future in futures:
+            try:
+                status = future.result()
+            except (OSError, subprocess.SubprocessError) as exc:
+                log('{0}: {1} failed: {2}'.format(label, image, exc))
+                status = 'failed'
+            summary[status].append('{0}: {1}'.format(label, image))
+    log(', '.join('{0} {1}'.format(len(items), status) for status, items in summary.items()))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pull container images ahead of the jobs that use them')
+    parser.add_argument('--config', required=True)
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON on the last line')
+    args = parser.parse_args()
+    with open(args.config) as handle:
+        config = json.load(handle)
+    with open(LOCK_FILE.format(config.get('engine', 'docker')), 'w') as lock:
+        # The timer and a playbook run never pull at the same time.
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        summary = run(config)
+    if args.json:
+        print(json.dumps(summary), flush=True)
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+#
+# Managed by Ansible (code3tech.devtools).
+#
+# Frees disk space on CI runner hosts between playbook runs. Started by a
+# systemd timer; exits immediately while every watched file system is below
+# max_usage_percent. Above it, evicts in this order until usage is back at
+# target_usage_percent:
+#
+#   1. "temp" entries (job temp files), least recently used first
+#   2. dangling images, unused volumes and build cache (docker / podman)
+#   3. "lru" entries (job workspaces, caches), least recently used first
+#   4. unused images older than image_min_age
+#
+# Entries below a runner whose worker process is running, and entries that
+# are the working directory of any process, are never touched, so running
+# jobs are not interrupted. Runners without a worker process per job
+# (gitlab-runner) give their entries a "min_age" in seconds instead: entries
+# modified more recently than that are kept. The sizes, the process scan and the least
+# recently used order come from runner_workspace.py, installed next to this
+# script (plugins/module_utils/runner_workspace.py of the collection, also
+# used by the runner_workspace_cleanup module). The JSON config is written by
+# the runner roles:
+#
+#   {"paths": [...], "max_usage_percent": 85, "target_usage_percent": 75,
+#    "workers": ["Runner.Worker"],
+#    "temp": [{"glob": "/opt/r/*/_work/_temp/*"}],
+#    "lru": [{"glob": "/opt/r/*/_work/*", "exclude": ["_temp", "_tool"]},
+#            {"glob": "/srv/builds/*/*", "min_age": 10800}, "/srv/cache/**/cache.zip"],
+#    "containers": {"engines": ["docker", "podman"], "users": ["ghrunner"], "image_min_age": "24h"}}
+
+import argparse
+import fcntl
+import glob
+import json
+import os
+import pwd
+import shutil
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from runner_workspace import disk_usage, is_below, is_held, plan, process_state, remove, tree_usage  # noqa: E402
+
+LOCK_FILE = '/run/code3tech-disk-guard.lock'
+
+
+def log(message):
+    print(message, flush=True)
+
+
+def usage_percent(path):
+    used, total = disk_usage(path)
+    return 100.0 * used / total if total else 0.0
+
+
+def candidates(kind, patterns, held):
+    """Return the entries matching ``patterns`` that no running job holds."""
+    busy, cwds = held
+    now = time.time()
+    found = {}
+    for pattern in patterns:
+        if not isinstance(pattern, dict):
+            pattern = {'glob': pattern}
+        exclude = set(pattern.get('exclude', []))
+        min_age = pattern.get('min_age', 0)
+        for path in glob.glob(pattern['glob'], recursive=True):
+            real = os.path.realpath(path)
+            if os.path.basename(path) in exclude or path in found or is_below(real, busy) or is_held(real, cwds):
+                continue
+            size, last_used = tree_usage(path)
+            if now - last_used < min_age:
+                continue
+            found[path] = {'kind': kind, 'path': path, 'size': size, 'last_used': last_used}
+    return list(found.values())
+
+
+class Guard(object):
+    def __init__(self, config, dry_run):
+        self.config = config
+        self.dry_run = dry_run
+        self.paths = [p for p in config.get('paths', []) if os.path.isdir(p)]
+        self.target = config.get('target_usage_percent', 75)
+        self.freed = 0
+
+    def usage(self):
+        return max([usage_percent(p) for p in self.paths] or [0.0])
+
+    def satisfied(self):
+        return self.usage() <= self.target
+
+    def to_free(self):
+        """Bytes to remove for the fullest watched file system to reach the target."""
+        needed = 0
+        for path in self.paths:
+            used, total = disk_usage(path)
+            needed = max(needed, used - total * self.target // 100)
+        return needed
+
+    def evict(self, kind, held):
+        found = candidates(kind, self.config.get(kind, []), held)
+        for candidate in plan(found, {}, time.time(), self.to_free(), (kind,)):
+            log('{0}: removing {1} ({2} MiB, last used {3})'.format(
+                kind, candidate['path'], candidate['size'] // 1048576,
+                time.strftime('%Y-%m-%d %H:%M', time.localtime(candidate['last_used']))))
+            if self.dry_run:
+                continue
+            try:
+                remove(candidate['path'])
+                self.freed += candidate['size']
+            except OSError as exc:
+                log('{0}: unable to remove {1}: {2}'.format(kind, candidate['path'], exc))
+        return self.satisfied()
+
+    def engine_commands(self, unused_images):
+        containers = self.config.get('containers') or {}
+        for engine in containers.get('engines', []):
+            binary = shutil.which(engine)
+            if not binary:
+                continue
+            if unused_images:
+                commands = [['image', 'prune', '--all', '--force',
+                             '--filter', 'until={0}'.format(containers.get('image_min_age', '24h'))]]
+            else:
+                commands = [['image', 'prune', '--force'], ['volume', 'prune', '--force']]
+                if engine == 'docker':
+                    commands.append(['builder', 'prune', '--force'])
+            prefixes = [[]]
+            if engine == 'podman':
+                # Rootless storage lives in every user's home
+                prefixes.extend(self.rootless_prefix(user) for user in containers.get('users', []))
+            for prefix in prefixes:
+                if prefix is None:
+                    continue
+                for command in commands:
+                    yield prefix + [binary] + command
+
+    @staticmethod
+    def rootless_prefix(user):
+        try:
+            uid = pwd.getpwnam(user).pw_uid
+        except KeyError:
+            return None
+        return ['runuser', '-u', user, '--', 'env', 'XDG_RUNTIME_DIR=/run/user/{0}'.format(uid)]
+
+    def prune(self, unused_images):
+        for command in self.engine_commands(unused_images):
+            if self.satisfied():
+                return True
+            log('containers: {0}'.format(' '.join(command)))
+            if self.dry_run:
+                continue
+            try:
+                subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               timeout=1800, check=True)
+            except (OSError, subprocess.SubprocessError) as exc:
+                log('containers: {0} failed: {1}'.format(command[0], exc))
+        return self.satisfied()
+
+    def run(self):
+        before = self.usage()
+        if before <= self.config.get('max_usage_percent', 85):
+            return 0
+        log('disk usage {0:.1f}% above {1}%, freeing space down to {2}%'.format(
+            before, self.config.get('max_usage_percent', 85), self.target))
+        held = process_state(self.config.get('workers', []))
+        done = (self.evict('temp', held) or self.prune(False)
+                or self.evict('lru', held) or self.prune(True))
+        log('disk usage {0:.1f}% -> {1:.1f}%, {2} MiB freed from files{3}'.format(
+            before, self.usage(), self.freed // 1048576, '' if done else ' (target not reached)'))
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Free disk space on CI runner hosts under disk pressure')
+    parser.add_argument('--config', required=True)
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+    with open(args.config) as handle:
+        config = json.load(handle)
+    with open(LOCK_FILE, 'w') as lock:
+        # Guards of several roles share the disk: run them one at a time.
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return Guard(config, args.dry_run).run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+#
+# Managed by Ansible (code3tech.devtools).
+#
+# Prometheus metrics and health endpoint for self-hosted runners/agents that
+# do not expose one themselves (GitHub Actions runners, Azure Pipelines agents).
+#
+#   GET /metrics  Prometheus text format
+#   GET /health   JSON, HTTP 200 when every runner service is active, 503 otherwise
+#
+# Every runner is a directory of --base-path holding the --metadata-file
+# written at configuration time (.runner / .agent). Its service is
+# --service-template with {name} replaced by the directory name, or the
+# .service file written by svc.sh. A runner is busy while its worker
+# process runs (process_state() of runner_workspace.py, installed next to
+# this script).
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from runner_workspace import process_state  # noqa: E402
+
+
+def systemd_state(units):
+    """Return {unit: {ActiveState, NRestarts, ...}} with one systemctl call."""
+    if not units:
+        return {}
+    try:
+        output = subprocess.run(
+            ['systemctl', 'show', '--property=Id,ActiveState,SubState,NRestarts'] + units,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, timeout=10,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    states = {}
+    for block in output.strip().split('\n\n'):
+        values = dict(line.split('=', 1) for line in block.splitlines() if '=' in line)
+        if values.get('Id'):
+            states[values['Id']] = values
+    return states
+
+
+def collect(args):
+    runners = []
+    for metadata in sorted(glob.glob(os.path.join(args.base_path, '*', args.metadata_file))):
+        directory = os.path.dirname(metadata)
+        service = ''
+        if args.service_template:
+            service = args.service_template.format(name=os.path.basename(directory))
+        else:
+            try:
+                with open(os.path.join(directory, '.service')) as handle:
+                    service = handle.read().strip()
+            except OSError:
+                pass
+        if service and not service.endswith('.service'):
+            service += '.service'
+        logs = glob.glob(os.path.join(directory, '_diag', args.worker_log_glob))
+        runners.append({
+            'name': os.path.basename(directory),
+            'directory': directory,
+            'service': service,
+            'job_logs': len(logs),
+            'last_job': max([os.path.getmtime(log) for log in logs] or [0]),
+        })
+    states = systemd_state([r['service'] for r in runners if r['service']])
+    busy = process_state([args.worker])[0]
+    for runner in runners:
+        state = states.get(runner['service'], {})
+        runner['active'] = state.get('ActiveState') == 'active'
+        runner['restarts'] = int(state.get('NRestarts') or 0)
+        runner['busy'] = os.path.realpath(runner['directory']) in busy or runner['directory'] in busy
+    return runners
+
+
+def render_metrics(prefix, runners):
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append('# HELP {0}_{1} {2}'.format(prefix, name, help_text))
+        lines.append('# TYPE {0}_{1} {2}'.format(prefix, name, kind))
+        for labels, value in samples:
+            label_text = ','.join('{0}="{1}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"'))
+                                  for k, v in labels)
+            lines.append('{0}_{1}{2} {3}'.format(prefix, name, '{' + label_text + '}' if label_text else '',
+                                                 value))
+
+    metric('up', 'gauge', 'Whether the runner service is active.',
+           [((('runner', r['name']), ('service', r['service'])), int(r['active'])) for r in runners])
+    metric('busy', 'gauge', 'Whether the runner is executing a job.',
+           [((('runner', r['name']),), int(r['busy'])) for r in runners])
+    metric('service_restarts_total', 'counter', 'Automatic restarts of the runner service.',
+           [((('runner', r['name']),), r['restarts']) for r in runners])
+    # The runner rotates its worker logs, so this count goes down: a gauge, not a counter.
+    metric('job_logs', 'gauge', 'Jobs whose worker log is still kept in _diag.',
+           [((('runner', r['name']),), r['job_logs']) for r in runners])
+    metric('last_job_timestamp_seconds', 'gauge', 'Start time of the most recent job.',
+           [((('runner', r['name']),), int(r['last_job'])) for r in runners])
+    metric('runners', 'gauge', 'Configured runners on this host.', [((), len(runners))])
+    metric('runners_busy', 'gauge', 'Runners executing a job.', [((), sum(r['busy'] for r in runners))])
+    metric('scrape_timestamp_seconds', 'gauge', 'Time of this scrape.', [((), int(time.time()))])
+    return '\n'.join(lines) + '\n'
+
+
+def make_handler(args):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *unused):
+            pass
+
+        def _send(self, status, body, content_type):
+            data = body.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == '/metrics':
+                self._send(200, render_metrics(args.prefix, collect(args)), 'text/plain; version=0.0.4')
+            elif path in ('/health', '/healthz'):
+                runners = collect(args)
+                down = [r['name'] for r in runners if not r['active']]
+                body = json.dumps({
+                    'status': 'fail' if down else 'pass',
+                    'runners': len(runners),
+                    'busy': sum(r['busy'] for r in runners),
+                    'down': down,
+                })
+                self._send(503 if down else 200, body, 'application/json')
+            else:
+                self._send(404, 'not found\n', 'text/plain')
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runner metrics and health exporter")
+    parser.add_argument('--base-path', required=True)
+    parser.add_argument('--metadata-file', default='.runner')
+    parser.add_argument('--worker', default='Runner.Worker')
+    parser.add_argument('--worker-log-glob', default='Worker_*.log')
+    parser.add_argument('--prefix', default='github_runner')
+    parser.add_argument('--service-template', default='')
+    parser.add_argument('--listen-address', default='')
+    parser.add_argument('--port', type=int, required=True)
+    args = parser.parse_args()
+    HTTPServer((args.listen_address, args.port), make_handler(args)).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+#
+# Managed by Ansible (code3tech.devtools).
+#
+# Keeps a pool of pre-registered, single-use GitHub Actions runners on this
+# host. Every runner gets a just-in-time configuration from the GitHub API
+# (generate-jitconfig), runs exactly one job in a fresh copy of the runner
+# template and exits; its directory is then deleted in the background and a
+# new runner takes its place. At any time `idle` runners wait for a job, and
+# the pool never grows beyond `max` runners or what the host can hold with
+# `job_profile` per job and `reserve` kept for the host itself.
+#
+# Runs as root so the API token in the config never reaches the jobs; the
+# runners run as `user`. The JSON config is written by the role:
+#
+#   {"api_url": "https://api.github.com", "token": "...",
+#    "runners_path": "/orgs/acme/actions/runners", "runner_group": "Default",
+#    "labels": ["self-hosted", "Linux", "X64", "pool"], "name_prefix": "host-01-pool",
+#    "idle": 2, "max": 0, "job_profile": {"cpus": 2, "memory_mb": 4096},
+#    "reserve": {"cpus": 1, "memory_mb": 2048},
+#    "template": "/opt/r/_pool/template", "slots": "/opt/r/_pool/slots",
+#    "user": "ghrunner", "interval": 5}
+
+import argparse
+import json
+import math
+import os
+import pwd
+import queue
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+# Line the runner prints when its job starts.
+JOB_STARTED = 'Running job:'
+# Directories shared with the template instead of copied (read-only for the jobs).
+SHARED_DIRS = ('bin', 'externals')
+# A runner exiting sooner than this without running a job counts as a failed start.
+MIN_LIFETIME = 30
+MAX_BACKOFF = 300
+
+
+def log(message):
+    print(message, flush=True)
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super(ApiError, self).__init__('HTTP {0}: {1}'.format(status, message))
+        self.status = status
+
+
+class GitHub(object):
+    """Minimal GitHub REST client for the runner endpoints of one scope."""
+
+    def __init__(self, api_url, token, runners_path, timeout=30):
+        self.api_url = api_url.rstrip('/') + '/'
+        self.token = token
+        self.runners_path = runners_path.rstrip('/')
+        self.timeout = timeout
+
+    def request(self, method, path, body=None):
+        """Return ``(data, headers)``; ``path`` may be absolute (``Link`` pagination)."""
+        url = path if path.startswith('http') else urljoin(self.api_url, path.lstrip('/'))
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = Request(url, data=data, method=method, headers={
+            'Accept': 'application/vnd.github+json',
+            'Authorization': 'Bearer {0}'.format(self.token),
+            'X-GitHub-Api-Version': '2022-11-28',
+            'Content-Type': 'application/json',
+            'User-Agent': 'code3tech-devtools-runner-pool',
+        })
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                content = response.read()
+                return (json.loads(content.decode('utf-8')) if content else None), response.headers
+        except HTTPError as exc:
+            raise ApiError(exc.code, exc.read().decode('utf-8', 'replace')[:200])
+        except URLError as exc:
+            raise ApiError(0, str(exc.reason))
+
+    def runners(self):
+        """Every runner of the scope (all pages)."""
+        path = '{0}?per_page=100'.format(self.runners_path)
+        while path:
+            data, headers = self.request('GET', path)
+            for runner in (data or {}).get('runners', []):
+                yield runner
+            path = None
+            for link in (headers.get('Link') or '').split(','):
+                if 'rel="next"' in link:
+                    path = link.split(';')[0].strip().strip('<>')
+
+    def runner_group_id(self, name):
+        """ID of the runner group called ``name`` (repository runners are always in group 1)."""
+        if not name or self.runners_path.startswith('/repos/'):
+            return 1
+        path = self.runners_path[:-len('runners')] + 'runner-groups?per_page=100'
+        data, dummy = self.request('GET', path)
+        for group in (data or {}).get('runner_groups', []):
+            if group.get('name', '').lower() == name.lower():
+                return group['id']
+        raise ApiError(404, 'runner group {0!r} not found'.format(name))
+
+    def jit_config(self, name, group_id, labels):
+        """Register a single-use runner; returns ``(runner id, encoded JIT config)``."""
+        data, dummy = self.request('POST', self.runners_path + '/generate-jitconfig', {
+            'name': name, 'runner_group_id': group_id, 'labels': labels, 'work_folder': '_work',
+        })
+        return data['runner']['id'], data['encoded_jit_config']
+
+    def delete(self, runner_id):
+        try:
+            self.request('DELETE', '{0}/{1}'.format(self.runners_path, int(runner_id)))
+        except ApiError as exc:
+            if exc.status != 404:
+                raise
+
+
+def host_capacity(profile, reserve):
+    """Number of jobs the host can run at once with ``profile`` per job."""
+    cpus = os.cpu_count() or 1
+    memory_mb = 0
+    with open('/proc/meminfo') as handle:
+        for line in handle:
+            if line.startswith('MemTotal:'):
+                memory_mb = int(line.split()[1]) // 1024
+    available = {'cpus': cpus - reserve.get('cpus', 0), 'memory_mb': memory_mb - reserve.get('memory_mb', 0)}
+    limits = [int(math.floor(max(available[key], 0) / float(profile[key])))
+              for key in available if profile.get(key, 0) > 0]
+    return max(min(limits), 1) if limits else cpus
+
+
+class Slot(object):
+    """One single-use runner and its directory."""
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.runner_id = None
+        self.process = None
+        self.started = time.time()
+        self.busy = False
+
+
+class Pool(object):
+
+    def __init__(self, config):
+        self.config = config
+        self.api = GitHub(config['api_url'], config['token'], config['runners_path'])
+        self.slots = []
+        self.stopping = threading.Event()
+        self.trash = queue.Queue()
+        # Failed API calls and runners crashing at start-up; both slow the loop down.
+        self.failures = 0
+        self.crashes = 0
+        self.user = pwd.getpwnam(config['user']) if config.get('user') else None
+        self.capacity = host_capacity(config.get('job_profile') or {}, config.get('reserve') or {})
+        if int(config.get('max') or 0) > 0:
+            self.capacity = min(self.capacity, int(config['max']))
+        self.idle = min(max(int(config.get('idle', 1)), 1), self.capacity)
+        self.group_id = None
+
+    # -- workspace --------------------------------------------------------
+
+    def _chown(self, path):
+        if self.user is None or os.geteuid() != 0:
+            return
+        for root, dirs, files in os.walk(path):
+            for name in [root] + [os.path.join(root, entry) for entry in dirs + files]:
+                os.lchown(name, self.user.pw_uid, self.user.pw_gid)
+
+    def prepare(self, path):
+        """Create a runner directory from the template: shared binaries, private everything else."""
+        template = self.config['template']
+        os.makedirs(path)
+        for entry in os.listdir(template):
+            source, target = os.path.join(template, entry), os.path.join(path, entry)
+            if entry in SHARED_DIRS:
+                os.symlink(source, target)
+            elif os.path.isdir(source) and not os.path.islink(source):
+                shutil.copytree(source, target, symlinks=True)
+            else:
+                shutil.copy2(source, target, follow_symlinks=False)
+        self._chown(path)
+
+    def recycle(self, path):
+        """Move a used directory aside at once; the recycler thread deletes it."""
+        target = os.path.join(self.config['slots'], '.trash', os.path.basename(path) + '-' + uuid.uuid4().hex[:6])
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.rename(path, target)
+        except OSError:
+            target = path
+        self.trash.put(target)
+
+    def recycler(self):
+        while True:
+            path = self.trash.get()
+            shutil.rmtree(path, ignore_errors=True)
+
+    # -- runners ----------------------------------------------------------
+
+    def _demote(self):
+        if self.user is not None and os.geteuid() == 0:
+            os.initgroups(self.user.pw_name, self.user.pw_gid)
+            os.setgid(self.user.pw_gid)
+            os.setuid(self.user.pw_uid)
+
+    def _follow(self, slot):
+        for line in iter(slot.process.stdout.readline, b''):
+            text = line.decode('utf-8', 'replace').rstrip()
+            if JOB_STARTED in text:
+                slot.busy = True
+            log('[{0}] {1}'.format(slot.name, text))
+
+    def start(self):
+        name = '{0}-{1}'.format(self.config['name_prefix'], uuid.uuid4().hex[:8])
+        slot = Slot(name, os.path.join(self.config['slots'], name))
+        self.prepare(slot.path)
+        try:
+            if self.group_id is None:
+                self.group_id = self.api.runner_group_id(self.config.get('runner_group'))
+            slot.runner_id, jit_config = self.api.jit_config(name, self.group_id, self.config['labels'])
+            env = dict(os.environ, ACTIONS_RUNNER_INPUT_JITCONFIG=jit_config)
+            if self.user is not None:
+                env.update(HOME=self.user.pw_dir, USER=self.user.pw_name, LOGNAME=self.user.pw_name)
+            slot.process = subprocess.Popen(
+                [os.path.join(slot.path, 'run.sh')], cwd=slot.path, env=env, stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, preexec_fn=self._demote, start_new_session=True)
+        except Exception:
+            if slot.runner_id is not None:
+                self._delete(slot)
+            self.recycle(slot.path)
+            raise
+        thread = threading.Thread(target=self._follow, args=(slot,))
+        thread.daemon = True
+        thread.start()
+        self.slots.append(slot)
+        self.failures = 0
+        log('Started runner {0} (id {1})'.format(name, slot.runner_id))
+
+    def _delete(self, slot):
+        try:
+            self.api.delete(slot.runner_id)
+        except ApiError as exc:
+            log('Unable to delete runner {0}: {1}'.format(slot.name, exc))
+
+    def reap(self):
+        for slot in list(self.slots):
+            code = slot.process.poll()
+            if code is None:
+                if time.time() - slot.started >= MIN_LIFETIME:
+                    self.crashes = 0
+                continue
+            self.slots.remove(slot)
+            if slot.busy:
+                log('Runner {0} finished its job (exit {1})'.format(slot.name, code))
+            else:
+                # Ephemeral runners are removed by GitHub after their job only.
+                self._delete(slot)
+                if time.time() - slot.started < MIN_LIFETIME:
+                    self.crashes += 1
+                log('Runner {0} exited without a job (exit {1})'.format(slot.name, code))
+            self.recycle(slot.path)
+
+    def cleanup(self):
+        """Delete leftovers of a previous run: offline pool runners and their directories."""
+        prefix = self.config['name_prefix'] + '-'
+        try:
+            for runner in self.api.runners():
+                if runner.get('name', '').startswith(prefix) and runner.get('status') == 'offline':
+                    self.api.delete(runner['id'])
+                    log('Deleted stale runner {0}'.format(runner['name']))
+        except ApiError as exc:
+            log('Unable to list stale runners: {0}'.format(exc))
+        os.makedirs(self.config['slots'], exist_ok=True)
+        for entry in os.listdir(self.config['slots']):
+            if entry == '.trash':
+                for leftover in os.listdir(os.path.join(self.config['slots'], entry)):
+                    self.trash.put(os.path.join(self.config['slots'], entry, leftover))
+            else:
+                self.recycle(os.path.join(self.config['slots'], entry))
+
+    def fill(self):
+        """Start runners until ``idle`` of them wait for a job, within capacity."""
+        while not self.stopping.is_set():
+            idle = sum(1 for slot in self.slots if not slot.busy)
+            if idle >= self.idle or len(self.slots) >= self.capacity:
+                return
+            self.start()
+
+    def stop(self):
+        for slot in self.slots:
+            try:
+                os.killpg(slot.process.pid, signal.SIGINT)
+            except OSError:
+                pass
+        deadline = time.time() + 30
+        for slot in self.slots:
+            try:
+                slot.process.wait(max(deadline - time.time(), 0))
+            except subprocess.TimeoutExpired:
+                os.killpg(slot.process.pid, signal.SIGKILL)
+            if not slot.busy:
+                self._delete(slot)
+            shutil.rmtree(slot.path, ignore_errors=True)
+        log('Stopped {0} runner(s)'.format(len(self.slots)))
+
+    def run(self):
+        recycler = threading.Thread(target=self.recycler)
+        recycler.daemon = True
+        recycler.start()
+        self.cleanup()
+        log('Runner pool {0}: {1} idle, at most {2} runner(s)'.format(
+            self.config['name_prefix'], self.idle, self.capacity))
+        interval = int(self.config.get('interval', 5))
+        while not self.stopping.is_set():
+            self.reap()
+            delay = interval
+            try:
+                self.fill()
+            except Exception as exc:
+                self.failures += 1
+                log('Unable to start a runner: {0}'.format(exc))
+            errors = max(self.failures, self.crashes)
+            if errors:
+                delay = min(interval * 2 ** min(errors, 10), MAX_BACKOFF)
+            self.stopping.wait(delay)
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep a pool of idle single-use GitHub Actions runners')
+    parser.add_argument('--config', required=True)
+    args = parser.parse_args()
+    with open(args.config) as handle:
+        config = json.load(handle)
+
+    pool = Pool(config)
+    signal.signal(signal.SIGTERM, lambda *dummy: pool.stopping.set())
+    signal.signal(signal.SIGINT, lambda *dummy: pool.stopping.set())
+    pool.run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
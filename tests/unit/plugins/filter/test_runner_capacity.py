@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.code3tech.devtools.plugins.filter.runner_capacity import (
+    mount_for,
+    runner_capacity,
+    runner_list,
+)
+
+GIB = 1024 ** 3
+
+
+def facts(cpus=16, memory_mb=65536, disk_gb=500):
+    return {
+        'processor_vcpus': cpus,
+        'memtotal_mb': memory_mb,
+        'mounts': [
+            {'mount': '/', 'size_total': 50 * GIB},
+            {'mount': '/opt', 'size_total': disk_gb * GIB},
+        ],
+    }
+
+
+def test_capacity_is_limited_by_the_scarcest_resource():
+    result = runner_capacity(facts(), path='/opt/github-actions-runners')
+    # (16 - 1) / 2 cpus, (65536 - 2048) / 4096 MB, (500 - 10) / 20 GB
+    assert result['capacity'] == {'cpus': 7, 'memory_mb': 15, 'disk_gb': 24}
+    assert result['jobs'] == 7
+    assert result['limited_by'] == 'cpus'
+
+    result = runner_capacity(facts(cpus=64, memory_mb=16384), path='/opt/runners')
+    assert result['jobs'] == 3
+    assert result['limited_by'] == 'memory_mb'
+
+    # The root file system is much smaller than /opt.
+    result = runner_capacity(facts(cpus=64), path='/var/lib/runners')
+    assert result['jobs'] == 2
+    assert result['limited_by'] == 'disk_gb'
+
+
+def test_capacity_profile_and_bounds():
+    result = runner_capacity(facts(), profile={'cpus': 0.5, 'disk_gb': 0}, reserve={'cpus': 0}, path='/opt')
+    assert 'disk_gb' not in result['capacity']
+    assert result['capacity']['cpus'] == 32
+    assert result['jobs'] == 15
+
+    assert runner_capacity(facts(), max_jobs=4, path='/opt')['jobs'] == 4
+    assert runner_capacity(facts(cpus=1, memory_mb=1024), path='/opt')['jobs'] == 1
+    assert runner_capacity(facts(cpus=1, memory_mb=1024), min_jobs=0, path='/opt')['jobs'] == 0
+
+
+def test_capacity_gitlab_concurrency():
+    result = runner_capacity(facts(cpus=64, memory_mb=262144), path='/opt', runners=3)
+    assert result['jobs'] == 24
+    assert result['concurrent'] == 8
+    assert result['request_concurrency'] == 4
+
+    result = runner_capacity(facts(cpus=4), path='/opt', runners=3)
+    assert result['concurrent'] == 1
+    assert result['request_concurrency'] == 1
+
+
+def test_capacity_errors():
+    with pytest.raises(AnsibleFilterError, match='gather facts'):
+        runner_capacity({'mounts': []})
+    with pytest.raises(AnsibleFilterError, match='unknown profile'):
+        runner_capacity(facts(), profile={'gpus': 1})
+    with pytest.raises(AnsibleFilterError, match='at least one'):
+        runner_capacity(facts(), profile={'cpus': 0, 'memory_mb': 0, 'disk_gb': 0})
+
+
+def test_mount_for_picks_the_longest_mount_point():
+    mounts = [{'mount': '/'}, {'mount': '/opt'}, {'mount': '/opt/runners'}]
+    assert mount_for(mounts, '/opt/runners/r1')['mount'] == '/opt/runners'
+    assert mount_for(mounts, '/optional')['mount'] == '/'
+    assert mount_for([], '/opt') is None
+
+
+def test_runner_list():
+    runners = runner_list(3, prefix='ci', entry={'labels': ['docker']})
+    assert [r['name'] for r in runners] == ['ci-01', 'ci-02', 'ci-03']
+    assert all(r['labels'] == ['docker'] for r in runners)
+    runners[0]['labels'].append('x')
+    assert runners[1]['labels'] == ['docker']
+
+    assert runner_list({'jobs': 2}, start=5, width=3) == [{'name': 'runner-005'}, {'name': 'runner-006'}]
+    assert runner_list(0) == []
+    with pytest.raises(AnsibleFilterError):
+        runner_list('many')
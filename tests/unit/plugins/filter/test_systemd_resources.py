@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleFilterError
+
+from ansible_collections.code3tech.devtools.plugins.filter.systemd_resources import systemd_resources
+
+
+def test_directives_in_fixed_order():
+    resources = {
+        'tasks_max': 4096,
+        'memory_max': '4G',
+        'cpu_quota': '200%',
+        'memory_high': '',
+        'io_read_bandwidth_max': ['/dev/sda 100M', '/dev/sdb 50M'],
+    }
+
+    assert systemd_resources(resources) == [
+        'CPUQuota=200%',
+        'MemoryMax=4G',
+        'IOReadBandwidthMax=/dev/sda 100M',
+        'IOReadBandwidthMax=/dev/sdb 50M',
+        'TasksMax=4096',
+    ]
+    assert systemd_resources({}) == []
+    assert systemd_resources(None) == []
+
+
+def test_unknown_key_is_rejected():
+    with pytest.raises(AnsibleFilterError, match='memory_limit'):
+        systemd_resources({'memory_limit': '4G'})
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.code3tech.devtools.plugins.lookup.github_release import LookupModule
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache
+
+API = 'https://api.github.com'
+
+
+class FakeClient(object):
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, path, expected=None, headers=None):
+        self.calls.append((path, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def test_resolve_uses_cache_within_ttl(tmp_path):
+    cache = FileCache(str(tmp_path), 'github_releases')
+    client = FakeClient([(200, {'etag': '"abc"'}, {'tag_name': 'v1.2.3'})])
+    lookup = LookupModule()
+
+    assert lookup._resolve(client, cache, API, 'asdf-vm/asdf', 3600) == 'v1.2.3'
+    assert lookup._resolve(client, cache, API, 'asdf-vm/asdf', 3600) == 'v1.2.3'
+    assert len(client.calls) == 1
+
+
+def test_resolve_revalidates_with_etag(tmp_path):
+    cache = FileCache(str(tmp_path), 'github_releases')
+    client = FakeClient([
+        (200, {'etag': '"abc"'}, {'tag_name': 'v1.2.3'}),
+        (304, {}, None),
+    ])
+    lookup = LookupModule()
+
+    lookup._resolve(client, cache, API, 'asdf-vm/asdf', 0)
+    assert lookup._resolve(client, cache, API, 'asdf-vm/asdf', 0) == 'v1.2.3'
+    assert client.calls[1][1] == {'If-None-Match': '"abc"'}
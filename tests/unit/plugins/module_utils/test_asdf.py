@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.asdf import Asdf, BuildCache, install_many
+
+
+class FakeModule(object):
+    """Records asdf invocations and emulates 'asdf install' on disk."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.commands = []
+
+    def run_command(self, cmd, environ_update=None):
+        self.commands.append((cmd[1:], dict(environ_update or {})))
+        if cmd[1] == 'install':
+            target = os.path.join(self.data_dir, 'installs', cmd[2], cmd[3], 'bin')
+            os.makedirs(target)
+            with open(os.path.join(target, cmd[2]), 'w') as handle:
+                handle.write(cmd[3])
+        return 0, '', ''
+
+
+def _asdf(tmp_path, name='host'):
+    data_dir = str(tmp_path / name)
+    return Asdf(FakeModule(data_dir), '/opt/asdf/bin/asdf', data_dir)
+
+
+def test_install_many_builds_in_parallel(tmp_path):
+    asdf = _asdf(tmp_path)
+    results = install_many(asdf, [('python', '3.12.1'), ('nodejs', '20.11.0')], workers=2)
+    assert sorted(r['source'] for r in results) == ['build', 'build']
+    assert asdf.installed('python') == ['3.12.1']
+    installs = [c for c in asdf.module.commands if c[0][0] == 'install']
+    assert all('ASDF_CONCURRENCY' in env for dummy, env in installs)
+
+
+def test_build_cache_export_then_import(tmp_path):
+    cache = BuildCache(str(tmp_path / 'cache'), 'ubuntu-22-x86_64')
+    builder = _asdf(tmp_path, 'builder')
+    install_many(builder, [('python', '3.12.1')], cache=cache, cache_export=True)
+    assert cache.has('python', '3.12.1')
+    assert os.path.isdir(str(tmp_path / 'cache' / 'downloads' / 'python'))
+
+    consumer = _asdf(tmp_path, 'consumer')
+    results = install_many(consumer, [('python', '3.12.1')], cache=cache)
+    assert results[0]['source'] == 'cache'
+    with open(os.path.join(consumer.install_path('python', '3.12.1'), 'bin', 'python')) as handle:
+        assert handle.read() == '3.12.1'
+    # No compile on the consumer, a single reshim for the imports.
+    assert [c[0][0] for c in consumer.module.commands] == ['reshim']
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import threading
+
+import pytest
+
+from ansible.module_utils.six.moves import BaseHTTPServer
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, parse_qs
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.azure_devops_api import (
+    AzureDevOpsClient,
+    tag_changes,
+    target_name,
+)
+
+TARGETS = [{'id': i, 'tags': ['web'], 'agent': {'name': 'agent-{0}'.format(i)}} for i in range(1, 6)]
+
+
+class FakeAzureDevOps(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        return json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        FakeAzureDevOps.requests.append(('GET', url.path, query))
+        if self.headers.get('Authorization') != 'Basic OnNlY3JldA==':
+            return self._reply(401, {'message': 'unauthorized'})
+        if url.path == '/myorg/My%20Project/_apis/distributedtask/deploymentgroups':
+            groups = [{'id': 12, 'name': 'Web'}, {'id': 13, 'name': 'web-canary'}]
+            return self._reply(200, {'count': 2, 'value': groups})
+        if url.path == '/myorg/My%20Project/_apis/distributedtask/deploymentgroups/12/targets':
+            start = int(query.get('continuationToken', ['0'])[0])
+            headers = {'x-ms-continuationtoken': str(start + 2)} if start + 2 < len(TARGETS) else {}
+            return self._reply(200, {'count': 2, 'value': TARGETS[start:start + 2]}, headers)
+        return self._reply(200, {'count': 0, 'value': []})
+
+    def do_PATCH(self):
+        FakeAzureDevOps.requests.append(('PATCH', urlsplit(self.path).path, self._body()))
+        return self._reply(200, {'count': 0, 'value': []})
+
+
+@pytest.fixture
+def azure_devops():
+    FakeAzureDevOps.requests = []
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), FakeAzureDevOps)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield 'http://127.0.0.1:{0}/myorg'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_find_matches_the_exact_name(azure_devops):
+    with AzureDevOpsClient(azure_devops, pat='secret') as client:
+        assert client.find('My Project', 'deployment_group', 'web')['id'] == 12
+        assert client.find('My Project', 'environment', 'production') is None
+    method, path, query = FakeAzureDevOps.requests[0]
+    assert query == {'name': ['web'], 'api-version': ['7.1']}
+
+
+def test_targets_follow_continuation_tokens(azure_devops):
+    with AzureDevOpsClient(azure_devops, pat='secret') as client:
+        assert client.targets('My Project', 'deployment_group', 12) == TARGETS
+        assert client.requests_made == 3
+    assert [r[2].get('continuationToken') for r in FakeAzureDevOps.requests] == [None, ['2'], ['4']]
+
+
+def test_deployment_target_tags_are_updated_in_one_call(azure_devops):
+    with AzureDevOpsClient(azure_devops, pat='secret') as client:
+        client.update_tags('My Project', 'deployment_group', 12, [
+            {'id': 1, 'name': 'agent-1', 'tags': ['web', 'canary']},
+            {'id': 2, 'name': 'agent-2', 'tags': []},
+        ])
+    assert FakeAzureDevOps.requests == [(
+        'PATCH', '/myorg/My%20Project/_apis/distributedtask/deploymentgroups/12/targets',
+        [{'id': 1, 'tags': ['web', 'canary']}, {'id': 2, 'tags': []}],
+    )]
+
+
+def test_tag_changes():
+    assert tag_changes(['web', 'Linux'], ['linux', 'web']) == ([], [])
+    assert tag_changes(['web', 'old'], ['web', 'canary']) == (['canary'], ['old'])
+    assert tag_changes(None, []) == ([], [])
+
+
+def test_target_name():
+    assert target_name({'agent': {'name': 'agent-1'}, 'name': 'vm-1'}) == 'agent-1'
+    assert target_name({'name': 'vm-1'}) == 'vm-1'
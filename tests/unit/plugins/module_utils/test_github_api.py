@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.github_api import (
+    label_changes,
+    parse_timestamp,
+    runners_path,
+)
+from ansible_collections.code3tech.devtools.plugins.module_utils.rest_client import RestClient, parse_link_header
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2026-01-22T20:13:35Z', 1769112815),
+    ('2026-01-22T20:13:35.123Z', 1769112815),
+    ('2026-01-22T12:13:35.123-08:00', 1769112815),
+    ('2026-01-22T21:13:35+01:00', 1769112815),
+])
+def test_parse_timestamp(value, expected):
+    assert parse_timestamp(value) == expected
+
+
+def test_parse_timestamp_invalid():
+    with pytest.raises(ValueError):
+        parse_timestamp('yesterday')
+
+
+@pytest.mark.parametrize('scope, kwargs, expected', [
+    ('organization', {'organization': 'acme'}, '/orgs/acme/actions/runners'),
+    ('repository', {'repository': 'acme/app'}, '/repos/acme/app/actions/runners'),
+    ('enterprise', {'enterprise': 'ent'}, '/enterprises/ent/actions/runners'),
+])
+def test_runners_path(scope, kwargs, expected):
+    assert runners_path(scope, **kwargs) == expected
+
+
+def test_runners_path_requires_name():
+    with pytest.raises(ValueError):
+        runners_path('organization')
+
+
+def test_parse_link_header():
+    header = ('<https://api.github.com/orgs/acme/actions/runners?page=2>; rel="next", '
+              '<https://api.github.com/orgs/acme/actions/runners?page=5>; rel="last"')
+    links = parse_link_header(header)
+    assert links['next'].endswith('page=2')
+    assert links['last'].endswith('page=5')
+
+
+def test_url_for_keeps_base_path():
+    client = RestClient('https://ghe.example.com/api/v3/')
+    assert client.url_for('/orgs/acme', {'per_page': 100}) == 'https://ghe.example.com/api/v3/orgs/acme?per_page=100'
+    assert client.url_for('https://other/x') == 'https://other/x'
+
+
+def _labels(*names, **kwargs):
+    read_only = kwargs.get('read_only', ('self-hosted', 'Linux', 'X64'))
+    return ([{'name': name, 'type': 'read-only'} for name in read_only]
+            + [{'name': name, 'type': 'custom'} for name in names])
+
+
+def test_label_changes():
+    assert label_changes(_labels('docker', 'gpu'), ['gpu', 'docker']) == ([], [])
+    assert label_changes(_labels('docker'), ['Docker', 'self-hosted', 'linux']) == ([], [])
+    assert label_changes(_labels('docker', 'old'), ['docker', 'gpu']) == (['gpu'], ['old'])
+    assert label_changes(_labels('docker'), []) == ([], ['docker'])
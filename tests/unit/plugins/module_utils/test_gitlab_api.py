@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import threading
+
+import pytest
+
+from ansible.module_utils.six.moves import BaseHTTPServer
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, parse_qs
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.gitlab_api import (
+    GitLabClient,
+    encode_path,
+    runner_changes,
+)
+
+RUNNERS = [{'id': i, 'description': 'runner-{0}'.format(i)} for i in range(1, 6)]
+
+
+class FakeGitLab(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    admin = True
+    paths = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        FakeGitLab.paths.append(url.path)
+        if self.headers.get('PRIVATE-TOKEN') != 'secret':
+            return self._reply(401, {'message': '401 Unauthorized'})
+        if url.path == '/api/v4/groups/acme%2Fplatform':
+            return self._reply(200, {'id': 42})
+        if url.path.startswith('/api/v4/groups/') or url.path.startswith('/api/v4/projects/'):
+            return self._reply(404, {'message': '404 Not found'})
+        if url.path == '/api/v4/runners/all' and not FakeGitLab.admin:
+            return self._reply(403, {'message': '403 Forbidden'})
+        if url.path in ('/api/v4/runners/all', '/api/v4/runners'):
+            page = int(parse_qs(url.query).get('page', ['1'])[0])
+            headers = {}
+            if page * 2 < len(RUNNERS):
+                headers['Link'] = '<http://{0}:{1}{2}?per_page=2&page={3}>; rel="next"'.format(
+                    self.server.server_address[0], self.server.server_address[1], url.path, page + 1)
+            return self._reply(200, RUNNERS[(page - 1) * 2:page * 2], headers)
+        return self._reply(404, {'message': '404 Not found'})
+
+
+@pytest.fixture
+def gitlab():
+    FakeGitLab.admin = True
+    FakeGitLab.paths = []
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), FakeGitLab)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield 'http://127.0.0.1:{0}/'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def test_encode_path():
+    assert encode_path('/acme/platform ci/') == 'acme%2Fplatform%20ci'
+
+
+def test_namespace_ids(gitlab):
+    with GitLabClient(gitlab, token='secret') as client:
+        assert client.group_id('acme/platform') == 42
+        assert client.project_id('acme/missing') is None
+
+
+def test_list_runners_follows_pages(gitlab):
+    with GitLabClient(gitlab, token='secret') as client:
+        assert client.list_runners(status='online') == RUNNERS
+        assert client.requests_made == 3
+    assert set(FakeGitLab.paths) == set(['/api/v4/runners/all'])
+
+
+def test_list_runners_falls_back_without_admin(gitlab):
+    FakeGitLab.admin = False
+    with GitLabClient(gitlab, token='secret') as client:
+        assert client.list_runners() == RUNNERS
+    assert FakeGitLab.paths[0] == '/api/v4/runners/all'
+    assert FakeGitLab.paths[1:] == ['/api/v4/runners'] * 3
+
+
+def test_runner_changes():
+    current = {'tag_list': ['linux', 'docker'], 'locked': False, 'maximum_timeout': None, 'description': 'r1'}
+    assert runner_changes(current, {'tag_list': ['docker', 'linux'], 'description': 'r1'}) == {}
+    assert runner_changes(current, {'tag_list': ['docker'], 'locked': True, 'maximum_timeout': 0}) == {
+        'tag_list': ['docker'], 'locked': True}
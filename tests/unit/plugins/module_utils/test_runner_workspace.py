@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.runner_workspace import (
+    DAY,
+    is_below,
+    is_held,
+    plan,
+    tree_usage,
+)
+
+
+def test_tree_usage_reports_newest_mtime(tmp_path):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'a' / 'old').write_text('x' * 10)
+    (tmp_path / 'a' / 'new').write_text('y')
+    os.utime(str(tmp_path / 'a' / 'old'), (1000, 1000))
+    os.utime(str(tmp_path / 'a' / 'new'), (5000, 5000))
+    os.utime(str(tmp_path / 'a'), (2000, 2000))
+
+    size, newest = tree_usage(str(tmp_path / 'a'))
+
+    assert size > 0
+    assert newest == 5000
+
+
+def test_plan_age_then_lru():
+    now = 100 * DAY
+    candidates = [
+        {'kind': 'work', 'path': 'w-old', 'size': 10, 'last_used': now - 9 * DAY},
+        {'kind': 'work', 'path': 'w-mid', 'size': 30, 'last_used': now - 3 * DAY},
+        {'kind': 'work', 'path': 'w-new', 'size': 30, 'last_used': now - DAY},
+        {'kind': 'tool', 'path': 't-old', 'size': 99, 'last_used': now - 50 * DAY},
+    ]
+    max_ages = {'work': 7, 'temp': 1, 'tool': 0}
+
+    assert [c['path'] for c in plan(candidates, max_ages, now, 0, ('work', 'temp'))] == ['w-old']
+    # 10 bytes come from the aged entry, the rest from the least recently used job directories.
+    assert [c['path'] for c in plan(candidates, max_ages, now, 35, ('work', 'temp'))] == ['w-old', 'w-mid']
+    assert [c['path'] for c in plan(candidates, max_ages, now, 35, ('work', 'temp', 'tool'))] == ['w-old', 't-old']
+
+
+def test_is_held():
+    assert is_held('/opt/r/_work/repo', ['/opt/r/_work/repo/src'])
+    assert is_held('/opt/r/_work/repo', ['/opt/r/_work/repo'])
+    assert not is_held('/opt/r/_work/repo', ['/opt/r/_work/repo2'])
+
+
+def test_is_below():
+    assert is_below('/opt/r/runner-01/_work/repo', ['/opt/r/runner-01'])
+    assert not is_below('/opt/r/runner-010/_work/repo', ['/opt/r/runner-01'])
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.code3tech.devtools.plugins.module_utils.toml_config import (
+    TomlDocument,
+    TomlError,
+    apply_settings,
+    dump_value,
+    merge_environment,
+    net_changes,
+    parse_value,
+)
+
+CONFIG = '''concurrent = 1
+check_interval = 0
+
+[session_server]
+  session_timeout = 1800
+
+[[runners]]
+  name = "runner-01"
+  token = "glrt-secret"
+  executor = "shell"
+  environment = [
+    "HTTP_PROXY=http://proxy:3128",  # old proxy
+    "NO_PROXY=localhost"
+  ]
+  [runners.cache]
+    MaxUploadedArchiveSize = 0
+
+[[runners]]
+  name = "runner-02"
+  token = "glrt-other"
+  executor = "docker"
+  request_concurrency = 2 # keep me
+  [runners.docker]
+    image = "alpine"
+'''
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('42', 42),
+    ('1_000', 1000),
+    ('0x10', 16),
+    ('1.5', 1.5),
+    ('true', True),
+    ('"a\\tb"', 'a\tb'),
+    ("'C:\\path'", 'C:\\path'),
+    ('["a", 1, [true]]', ['a', 1, [True]]),
+    ('{ x = 1, "y z" = "w" }', {'x': 1, 'y z': 'w'}),
+    ('1979-05-27T07:32:00Z', '1979-05-27T07:32:00Z'),
+])
+def test_parse_value(text, expected):
+    assert parse_value(text)[0] == expected
+
+
+def test_parse_value_unterminated():
+    with pytest.raises(TomlError):
+        parse_value('"open')
+
+
+def test_dump_value_round_trip():
+    value = ['x "quoted"', 2, False, {'k': 'v'}]
+    assert parse_value(dump_value(value))[0] == value
+
+
+def test_runner_blocks():
+    document = TomlDocument(CONFIG)
+    blocks = document.runner_blocks()
+    assert len(blocks) == 2
+    assert [s.name for s in blocks[0]] == [('runners',), ('runners', 'cache')]
+    assert document.get(blocks[1][0], 'name') == (True, 'runner-02')
+
+
+def test_apply_settings_every_runner():
+    document = TomlDocument(CONFIG)
+    changes = apply_settings(document, {'concurrent': 4, 'session_server.session_timeout': 1800})
+    assert changes == [{'table': '(root)', 'key': 'concurrent', 'before': 1, 'after': 4}]
+    for index in range(2):
+        apply_settings(document, {'request_concurrency': 2, 'docker.pull_policy': ['if-not-present'],
+                                  'environment': None}, scope=index)
+    text = document.render()
+    assert text.startswith('concurrent = 4\n')
+    assert 'environment' not in text
+    assert '  request_concurrency = 2 # keep me\n' in text
+    assert text.count('    pull_policy = ["if-not-present"]\n') == 2
+    assert '  [runners.docker]\n    pull_policy' in text.split('name = "runner-02"')[0]
+
+    # A second pass over the result is a no-op.
+    again = TomlDocument(text)
+    assert apply_settings(again, {'concurrent': 4}) == []
+    assert apply_settings(again, {'request_concurrency': 2, 'docker.pull_policy': ['if-not-present']}, 0) == []
+    assert again.render() == text
+
+
+def test_merge_environment_keeps_other_variables():
+    document = TomlDocument(CONFIG.replace('"NO_PROXY=localhost"', '"NO_PROXY=localhost", "CI_DEBUG=1"'))
+    proxy = {'HTTP_PROXY': 'http://new:3128', 'HTTPS_PROXY': 'http://new:3128', 'NO_PROXY': '.corp'}
+    assert merge_environment(document, proxy, 0)[0]['after'] == [
+        'HTTP_PROXY=http://new:3128', 'NO_PROXY=.corp', 'CI_DEBUG=1', 'HTTPS_PROXY=http://new:3128']
+    assert merge_environment(document, proxy, 0) == []
+
+    removal = dict.fromkeys(proxy)
+    merge_environment(document, removal, 0)
+    assert document.get(document.runner_blocks()[0][0], 'environment') == (True, ['CI_DEBUG=1'])
+    # Nothing to remove and no environment key: nothing written.
+    assert merge_environment(document, removal, 1) == []
+    assert document.get(document.runner_blocks()[1][0], 'environment') == (False, None)
+
+
+def test_same_value_is_type_aware():
+    document = TomlDocument('flag = 1\n')
+    assert apply_settings(document, {'flag': True})[0]['before'] == 1
+    assert document.render() == 'flag = true\n'
+
+
+def test_redacted():
+    redacted = TomlDocument(CONFIG).redacted()
+    assert 'glrt-' not in redacted
+    assert '  token = "********"' in redacted
+
+
+def test_net_changes_drops_a_key_set_back_to_its_value():
+    document = TomlDocument(CONFIG)
+    changes = apply_settings(document, {'request_concurrency': 1}, scope=1)
+    changes += apply_settings(document, {'request_concurrency': 2, 'limit': 1}, scope=1)
+    assert [(c['before'], c['after']) for c in changes] == [(2, 1), (1, 2), (None, 1)]
+    assert net_changes(changes) == [{'table': 'runners[1]', 'key': 'limit', 'before': None, 'after': 1}]
+    assert '  request_concurrency = 2 # keep me\n' in document.render()
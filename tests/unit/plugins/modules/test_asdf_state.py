@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from ansible_collections.code3tech.devtools.plugins.modules.asdf_state import (
+    parse_tool_versions,
+    update_tool_versions,
+)
+
+LINES = [
+    '# managed by hand',
+    'nodejs 18.19.0 20.11.0',
+    'direnv 2.32.3  # pinned',
+]
+
+
+def test_parse_tool_versions():
+    assert parse_tool_versions(LINES) == {
+        'nodejs': ['18.19.0', '20.11.0'],
+        'direnv': ['2.32.3'],
+    }
+
+
+def test_update_tool_versions_keeps_unrelated_lines():
+    updated = update_tool_versions(LINES, {'nodejs': '20.11.0', 'python': '3.12.1'})
+    assert updated == [
+        '# managed by hand',
+        'nodejs 20.11.0',
+        'direnv 2.32.3  # pinned',
+        'python 3.12.1',
+    ]
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.code3tech.devtools.plugins.modules.port_allocation import allocate
+
+
+def test_allocate_is_stable():
+    state = {}
+    ports, allocated, released = allocate(state, 'gitlab', ['a', 'b'], 9252, 9260)
+    assert ports == {'a': 9252, 'b': 9253}
+    assert allocated == ['a', 'b'] and released == []
+
+    # Removing a runner keeps the ports of the others; a new one takes the free port.
+    ports, allocated, released = allocate(state, 'gitlab', ['b', 'c'], 9252, 9260)
+    assert ports == {'b': 9253, 'c': 9252}
+    assert allocated == ['c'] and released == ['a']
+
+    assert allocate(state, 'gitlab', ['b', 'c'], 9252, 9260) == ({'b': 9253, 'c': 9252}, [], [])
+
+
+def test_allocate_skips_other_groups_and_busy_ports():
+    state = {'github': {'exporter': 9252}}
+    ports, allocated, released = allocate(state, 'gitlab', ['a'], 9252, 9260, busy={9253})
+    assert ports == {'a': 9254}
+    assert state['github'] == {'exporter': 9252}
+
+
+def test_allocate_moves_ports_outside_the_range():
+    state = {'gitlab': {'a': 8000}}
+    assert allocate(state, 'gitlab', ['a'], 9252, 9260)[0] == {'a': 9252}
+
+
+def test_allocate_exhausted_range():
+    with pytest.raises(ValueError):
+        allocate({}, 'gitlab', ['a', 'b'], 9252, 9252)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+
+from ansible_collections.code3tech.devtools.plugins.modules.runner_facts import parse_systemctl_show, scan_runners
+
+
+def test_scan_runners(tmp_path):
+    configured = tmp_path / 'runner-01'
+    configured.mkdir()
+    (configured / '.runner').write_bytes(b'\xef\xbb\xbf' + json.dumps({'agentId': 7}).encode())
+    (configured / '.service').write_text('actions.runner.acme.runner-01.service\n')
+    (tmp_path / 'runner-02').mkdir()
+    (tmp_path / '.downloads').mkdir()
+    (tmp_path / 'stray-file').write_text('x')
+
+    runners = scan_runners(str(tmp_path), '.runner', ['.downloads'])
+
+    assert [r['name'] for r in runners] == ['runner-01', 'runner-02']
+    assert runners[0]['configured'] is True
+    assert runners[0]['metadata'] == {'agentId': 7}
+    assert runners[0]['service'] == 'actions.runner.acme.runner-01'
+    assert runners[1]['configured'] is False
+    assert 'service' not in runners[1]
+
+
+def test_scan_runners_service_template(tmp_path):
+    for name in ('runner-01', 'runner-02', 'runner-03'):
+        (tmp_path / name).mkdir()
+    (tmp_path / 'runner-01' / '.runner').write_text('{}')
+    (tmp_path / 'runner-01' / '.service').write_text('actions.runner.acme.runner-01.service\n')
+    (tmp_path / 'runner-02' / '.runner').write_text('{}')
+
+    runners = scan_runners(str(tmp_path), '.runner', [], 'github-actions-runner@{name}')
+
+    assert runners[0]['service'] == 'github-actions-runner@runner-01'
+    assert runners[0]['svc_service'] == 'actions.runner.acme.runner-01'
+    assert runners[1]['service'] == 'github-actions-runner@runner-02'
+    assert 'svc_service' not in runners[1]
+    assert 'service' not in runners[2]
+
+
+def test_scan_runners_missing_base(tmp_path):
+    assert scan_runners(str(tmp_path / 'nope'), '.runner', []) == []
+
+
+def test_parse_systemctl_show():
+    output = 'Id=a.service\nActiveState=active\n\nId=b.service\nActiveState=failed\n'
+    assert parse_systemctl_show(output) == [
+        {'Id': 'a.service', 'ActiveState': 'active'},
+        {'Id': 'b.service', 'ActiveState': 'failed'},
+    ]
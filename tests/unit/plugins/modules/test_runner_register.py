@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import sys
+import time
+
+from ansible_collections.code3tech.devtools.plugins.modules.runner_register import is_registered, run_job, run_jobs
+
+# Fails until it has been called twice, then writes the marker.
+FLAKY = '''
+import os, sys
+count = os.path.join(sys.argv[1], 'count')
+calls = int(open(count).read()) + 1 if os.path.exists(count) else 1
+open(count, 'w').write(str(calls))
+if calls < 2:
+    sys.exit('token rejected')
+open(os.path.join(sys.argv[1], '.runner'), 'w').write('{}')
+'''
+
+
+def test_run_job_retries_until_registered(tmp_path):
+    job = {'name': 'runner-01', 'argv': [sys.executable, '-c', FLAKY, str(tmp_path)],
+           'creates': str(tmp_path / '.runner')}
+    delays = []
+
+    result = run_job(job, retries=2, retry_delay=5, timeout=30, sleep=delays.append)
+
+    assert result['status'] == 'registered'
+    assert result['attempts'] == 2
+    assert delays == [5]
+
+
+def test_run_job_gives_up(tmp_path):
+    job = {'name': 'runner-01', 'argv': [sys.executable, '-c', 'import sys; sys.exit("boom")']}
+
+    result = run_job(job, retries=2, retry_delay=1, timeout=30, sleep=lambda delay: None)
+
+    assert result['status'] == 'failed'
+    assert result['attempts'] == 3
+    assert result['rc'] == 1
+    assert 'boom' in result['stderr']
+
+
+def test_run_job_requires_marker(tmp_path):
+    job = {'name': 'runner-01', 'argv': [sys.executable, '-c', 'pass'], 'creates': str(tmp_path / 'config.toml')}
+
+    result = run_job(job, retries=0, retry_delay=0, timeout=30)
+
+    assert result['status'] == 'failed'
+    assert 'does not show the runner as registered' in result['stderr']
+
+
+def test_run_jobs_in_parallel_keeps_order():
+    jobs = [{'name': str(i), 'argv': [sys.executable, '-c', 'import time; time.sleep(0.5)']} for i in range(4)]
+
+    started = time.time()
+    results = run_jobs(jobs, parallelism=4, retries=0, retry_delay=0, timeout=30)
+
+    assert time.time() - started < 1.5
+    assert [r['name'] for r in results] == ['0', '1', '2', '3']
+    assert all(r['status'] == 'registered' for r in results)
+
+
+def test_is_registered_regex(tmp_path):
+    config = tmp_path / 'config.toml'
+    job = {'creates': str(config), 'creates_regex': r'^\s*\[\[runners\]\]'}
+    assert not is_registered(job)
+    config.write_text('concurrent = 1\n')
+    assert not is_registered(job)
+    config.write_text('concurrent = 1\n\n[[runners]]\n  name = "x"\n')
+    assert is_registered(job)
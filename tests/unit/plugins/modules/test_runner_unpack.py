@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import errno
+import os
+
+from ansible_collections.code3tech.devtools.plugins.modules.runner_unpack import FanOut, default_staging_dir
+
+
+def _staging(tmp_path):
+    staging = tmp_path / 'staging'
+    (staging / 'bin').mkdir(parents=True)
+    (staging / 'bin' / 'Runner.Listener').write_text('binary')
+    (staging / 'config.sh').write_text('#!/bin/bash')
+    os.symlink('bin/Runner.Listener', str(staging / 'run-link'))
+    return staging
+
+
+def test_default_staging_dir():
+    assert default_staging_dir('/d/actions-runner-linux-x64-2.330.0.tar.gz') == '/d/actions-runner-linux-x64-2.330.0'
+
+
+def test_populate_copy(tmp_path):
+    staging = _staging(tmp_path)
+    dest = tmp_path / 'runner-01'
+    FanOut(str(staging), 'copy', ['bin'], -1, -1).populate(str(dest), 'config.sh')
+    assert (dest / 'bin' / 'Runner.Listener').read_text() == 'binary'
+    assert (dest / 'config.sh').exists()
+    assert os.readlink(str(dest / 'run-link')) == 'bin/Runner.Listener'
+    assert os.stat(str(dest / 'bin' / 'Runner.Listener')).st_nlink == 1
+
+
+def test_populate_hardlink_only_link_paths(tmp_path):
+    staging = _staging(tmp_path)
+    dest = tmp_path / 'runner-01'
+    FanOut(str(staging), 'hardlink', ['bin'], -1, -1).populate(str(dest), 'config.sh')
+    assert os.stat(str(dest / 'bin' / 'Runner.Listener')).st_nlink == 2
+    assert os.stat(str(dest / 'config.sh')).st_nlink == 1
+
+
+def test_populate_hardlink_falls_back_to_copy(tmp_path, monkeypatch):
+    staging = _staging(tmp_path)
+    dest = tmp_path / 'runner-01'
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, 'Invalid cross-device link')
+
+    monkeypatch.setattr(os, 'link', cross_device)
+    FanOut(str(staging), 'hardlink', ['bin'], -1, -1).populate(str(dest), 'config.sh')
+    assert (dest / 'bin' / 'Runner.Listener').read_text() == 'binary'
+    assert os.stat(str(dest / 'bin' / 'Runner.Listener')).st_nlink == 1
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+
+from ansible_collections.code3tech.devtools.plugins.modules.runner_workspace_cleanup import collect
+
+
+def test_collect(tmp_path):
+    work = tmp_path / 'runner-01' / '_work'
+    (work / 'repo' / 'repo').mkdir(parents=True)
+    (work / '_temp' / 'job.sh').parent.mkdir()
+    (work / '_temp' / 'job.sh').write_text('x')
+    (work / '_tool' / 'node').mkdir(parents=True)
+    (tmp_path / 'runner-02').mkdir()
+    (tmp_path / '.downloads' / '_work').mkdir(parents=True)
+
+    runners, candidates = collect(str(tmp_path), ['.downloads'], '_work')
+
+    assert runners == [str(tmp_path / 'runner-01')]
+    assert [(c['kind'], os.path.basename(c['path'])) for c in candidates] == [
+        ('temp', 'job.sh'), ('tool', 'node'), ('work', 'repo')]
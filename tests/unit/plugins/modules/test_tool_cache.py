@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import os
+import stat
+import subprocess
+import tarfile
+
+import pytest
+
+from ansible_collections.code3tech.devtools.plugins.modules.tool_cache import (
+    ToolCache,
+    ToolCacheError,
+    is_complete,
+    normalize,
+)
+
+
+def _run(cmd):
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    return process.returncode, out.decode(), err.decode()
+
+
+def _archive(tmp_path):
+    source = tmp_path / 'node-v20.11.1-linux-x64' / 'bin'
+    source.mkdir(parents=True)
+    (source / 'node').write_text('#!/bin/sh')
+    archive = tmp_path / 'node.tar.gz'
+    with tarfile.open(str(archive), 'w:gz') as tar:
+        tar.add(str(tmp_path / 'node-v20.11.1-linux-x64'), arcname='node-v20.11.1-linux-x64')
+    return archive
+
+
+def _tool(archive, **kwargs):
+    tool = dict(name='node', version='20.11.1', url='file://' + str(archive), strip_components=1)
+    tool.update(kwargs)
+    return normalize([tool], 'x64')[0]
+
+
+def test_install_places_entry_then_marker(tmp_path):
+    root = tmp_path / 'toolcache'
+    root.mkdir()
+    os.chmod(str(root), 0o1775)
+    archive = _archive(tmp_path)
+    tool = _tool(archive, checksum='sha256:' + hashlib.sha256(archive.read_bytes()).hexdigest())
+    cache = ToolCache(str(root), _run, 'tar')
+
+    assert not is_complete(str(root), tool)
+    assert cache.install(tool) is True
+    assert (root / 'node' / '20.11.1' / 'x64' / 'bin' / 'node').read_text() == '#!/bin/sh'
+    assert is_complete(str(root), tool)
+    assert stat.S_IMODE(os.stat(str(root / 'node')).st_mode) == 0o1775
+    # Nothing left behind next to the entry.
+    assert sorted(os.listdir(str(root / 'node' / '20.11.1'))) == ['x64', 'x64.complete']
+
+    assert cache.install(tool) is False
+
+
+def test_install_replaces_an_incomplete_entry(tmp_path):
+    root = tmp_path / 'toolcache'
+    (root / 'node' / '20.11.1' / 'x64').mkdir(parents=True)
+    (root / 'node' / '20.11.1' / 'x64' / 'partial').write_text('')
+    tool = _tool(_archive(tmp_path))
+
+    assert ToolCache(str(root), _run, 'tar').install(tool) is True
+    assert os.listdir(str(root / 'node' / '20.11.1' / 'x64')) == ['bin']
+
+
+def test_checksum_mismatch_leaves_no_entry(tmp_path):
+    root = tmp_path / 'toolcache'
+    root.mkdir()
+    tool = _tool(_archive(tmp_path), checksum='sha256:' + '0' * 64)
+
+    with pytest.raises(ToolCacheError, match='Checksum mismatch'):
+        ToolCache(str(root), _run, 'tar').install(tool)
+    assert os.listdir(str(root / 'node' / '20.11.1')) == []
+
+
+def test_normalize_rejects_path_components():
+    assert normalize([{'name': 'go', 'version': '1.22.0', 'url': 'u', 'arch': None}], 'arm64')[0]['arch'] == 'arm64'
+    with pytest.raises(ToolCacheError):
+        normalize([{'name': 'go', 'version': '../1.22.0', 'url': 'u'}], 'x64')
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+
+import pytest
+
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.artifact_store import (
+    ArtifactError,
+    ArtifactStore,
+    parse_checksum,
+)
+
+URL = 'https://example.com/releases/v1/pkg-1.0.tar.gz'
+PAYLOAD = b'runner package'
+DIGEST = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def _seed(tmp_path):
+    (tmp_path / 'files').mkdir()
+    (tmp_path / 'files' / 'pkg-1.0.tar.gz').write_bytes(PAYLOAD)
+
+
+def test_parse_checksum():
+    assert parse_checksum(None) is None
+    assert parse_checksum('sha256:ABC') == 'abc'
+    assert parse_checksum('abc') == 'abc'
+    with pytest.raises(ArtifactError):
+        parse_checksum('md5:abc')
+
+
+def test_offline_seed_is_imported(tmp_path):
+    _seed(tmp_path)
+    store = ArtifactStore(str(tmp_path))
+    assert store.ensure(URL, offline=True) == (DIGEST, True)
+    with open(store.blob_path(DIGEST), 'rb') as handle:
+        assert handle.read() == PAYLOAD
+    # Second lookup is served from the index.
+    (tmp_path / 'files' / 'pkg-1.0.tar.gz').unlink()
+    assert store.lookup(URL) == DIGEST
+
+
+def test_offline_miss_fails(tmp_path):
+    with pytest.raises(ArtifactError, match='offline'):
+        ArtifactStore(str(tmp_path)).ensure(URL, offline=True)
+
+
+def test_seed_checksum_mismatch(tmp_path):
+    _seed(tmp_path)
+    with pytest.raises(ArtifactError, match='Checksum mismatch'):
+        ArtifactStore(str(tmp_path)).lookup(URL, checksum='sha256:' + '0' * 64)
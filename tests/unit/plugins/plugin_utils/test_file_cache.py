@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Code3Tech DevOps Team
+# MIT License (see LICENSE)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import stat
+
+from ansible_collections.code3tech.devtools.plugins.plugin_utils.file_cache import FileCache, cache_key
+
+
+def test_cache_key_is_stable_and_separates_parts():
+    assert cache_key('a', 'b') == cache_key('a', 'b')
+    assert cache_key('ab', '') != cache_key('a', 'b')
+
+
+def test_set_get_delete(tmp_path):
+    cache = FileCache(str(tmp_path), 'tokens')
+    key = cache_key('x')
+    assert cache.get(key) is None
+    with cache.lock(key):
+        cache.set(key, {'token': 'abc'})
+    assert cache.get(key) == {'token': 'abc'}
+    mode = stat.S_IMODE(os.stat(os.path.join(cache.path, key + '.json')).st_mode)
+    assert mode == 0o600
+    cache.delete(key)
+    assert cache.get(key) is None